@@ -1,61 +1,81 @@
 # pyright: reportUnboundVariable=false
 
 import glob
-import importlib
 import os
 import site
 import sys
 import typing
+from pathlib import Path
 
-from .basic_game import BasicGame
-from .basic_game_ini import BasicIniGame
-
-site.addsitedir(os.path.join(os.path.dirname(__file__), "lib"))
+import mobase
 
+from .basic_game import BasicGame, GameSnapshot
+from .basic_game_ini import load_ini_games
+from .basic_game_lazy import BasicLazyGame, create_lazy_game
+from .discovery_utils import collect_store_ids
+from .plugin_manifest import load_manifest
 
-BasicGame.setup()
+site.addsitedir(os.path.join(os.path.dirname(__file__), "lib"))
 
 
 def createPlugins():
     # List of game class from python:
-    game_plugins: typing.List[BasicGame] = []
+    game_plugins: typing.List[mobase.IPluginGame] = []
 
     # We are going to list all game plugins:
     curpath = os.path.abspath(os.path.dirname(__file__))
 
-    # List all the .ini files:
-    for file in glob.glob(os.path.join(curpath, "games", "*.ini")):
-        game_plugins.append(BasicIniGame(file))
+    # List all the games from the .ini files, a file may define several games:
+    game_plugins.extend(
+        load_ini_games(glob.glob(os.path.join(curpath, "games", "*.ini")))
+    )
 
-    # List all the python plugins:
-    for file in glob.glob(os.path.join(curpath, "games", "*.py")):
-        module_p = os.path.relpath(file, os.path.join(curpath, "games"))
-        if module_p == "__init__.py":
-            continue
+    # List all the python plugins from the manifest, modules are only imported when
+    # the plugin is actually needed:
+    manifest = load_manifest(Path(curpath, "games"), __package__)
+    for module_name, module_info in manifest.items():
+        for class_info in module_info["classes"]:
+            game_plugins.append(create_lazy_game(__package__, module_name, class_info))
 
-        # Import the module:
-        try:
-            module = importlib.import_module(".games." + module_p[:-3], __package__)
-        except ImportError as e:
-            print("Failed to import module {}: {}".format(module_p, e), file=sys.stderr)
-        except Exception as e:
-            print("Failed to import module {}: {}".format(module_p, e), file=sys.stderr)
-
-        # Lookup game plugins:
-        for name in dir(module):
-            if hasattr(module, name):
-                obj = getattr(module, name)
-                if (
-                    isinstance(obj, type)
-                    and issubclass(obj, BasicGame)
-                    and obj is not BasicGame
-                ):
-                    try:
-                        game_plugins.append(obj())
-                    except Exception as e:
-                        print(
-                            "Failed to instantiate {}: {}".format(name, e),
-                            file=sys.stderr,
-                        )
+    # Only look for the games declared by the plugins:
+    BasicGame.setup(
+        collect_store_ids(
+            plugin.store_ids()
+            for plugin in game_plugins
+            if isinstance(plugin, (BasicGame, BasicLazyGame))
+        ),
+        watch=True,
+    )
 
     return game_plugins
+
+
+def createSnapshots(
+    plugins: typing.Iterable[mobase.IPluginGame] | None = None,
+) -> typing.List[GameSnapshot]:
+    """
+    Resolve the properties of all the basic game plugins at once, e.g. for listings
+    or diagnostics.
+
+    Args:
+        plugins: The plugins, as returned by createPlugins(), None to create them.
+
+    Returns:
+        The snapshots of the plugins, see BasicGame.snapshot(). Plugins created from
+        the manifest are loaded to resolve their properties, plugins that fail to
+        resolve them are skipped.
+    """
+    if plugins is None:
+        plugins = createPlugins()
+
+    snapshots: typing.List[GameSnapshot] = []
+    for plugin in plugins:
+        if not isinstance(plugin, (BasicGame, BasicLazyGame)):
+            continue
+        try:
+            if isinstance(plugin, BasicLazyGame):
+                plugin = plugin._game()  # pyright: ignore[reportPrivateUsage]
+            snapshots.append(plugin.snapshot())
+        except Exception as e:
+            print("Failed to snapshot {}: {}".format(plugin.name(), e), file=sys.stderr)
+    return snapshots
@@ -1,16 +1,45 @@
 # -*- encoding: utf-8 -*-
 
+import os
 import sys
-from collections.abc import Mapping
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Self, Sequence
 
 import mobase
-from PyQt6.QtCore import QDateTime, QLocale, Qt
+from PyQt6.QtCore import (
+    QDateTime,
+    QLocale,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QFormLayout, QLabel, QSizePolicy, QVBoxLayout, QWidget
 
+from ..cache_utils import FileSignature, file_signature, metadata_cache
+from ..savegame_utils import SaveIndex
+
+# Number of scaled previews kept in memory, and number of threads loading previews
+# and metadata for the info widgets:
+PREVIEW_CACHE_SIZE = 32
+PREVIEW_THREADS = 2
+
+# Number of threads loading the metadata of saves ahead of time, and default number
+# of saves loaded by prefetch_metadata():
+METADATA_THREADS = 1
+METADATA_PREFETCH_LIMIT = 16
+
+# Delay, in milliseconds, before asking for a refresh of the saves once metadata has
+# been loaded in the background, so that loads are batched:
+METADATA_REFRESH_DELAY = 500
+
 
 def format_date(date_time: QDateTime | datetime | str, format_str: str | None = None):
     """Default format for date and time in the `BasicGameSaveGameInfoWidget`.
@@ -29,18 +58,169 @@ def format_date(date_time: QDateTime | datetime | str, format_str: str | None =
 
 
 class BasicGameSaveGame(mobase.ISaveGame):
-    def __init__(self, filepath: Path):
+    """
+    Save game, with optional metadata read from the save itself.
+
+    Subclasses that read metadata from the save override `_load_metadata()`. The
+    metadata is only loaded when first needed, e.g. by the info widget, or ahead of
+    time by `prefetch()` (opt-in), so listing the saves stays cheap. Accessors called
+    by Mod Organizer on the GUI thread, e.g. `getName()`, use `peek_metadata()` and
+    never parse the save. The metadata is also cached across sessions, see
+    `cache_utils.MetadataCache`.
+    """
+
+    # Version of the metadata returned by _load_metadata(), to bump whenever the
+    # loader changes so that metadata cached by previous versions is not used:
+    _metadata_version: int = 1
+
+    # Metadata of the save, None until loaded:
+    _metadata: Mapping[str, Any] | None
+
+    def __init__(self, filepath: Path, stat: os.stat_result | None = None):
+        """
+        Args:
+            filepath: Path to the save file (or folder).
+            stat (optional): Result of stat() on the save, e.g. as cached by a scan
+                of the saves directory, to avoid reading it again.
+        """
         super().__init__()
         self._filepath = filepath
+        self._stat = stat
+        self._metadata = None
+        self._metadata_lock = threading.Lock()
+
+    def _load_metadata(self) -> Mapping[str, Any]:
+        """
+        Read the metadata of the save, only called once per save, possibly from a
+        worker thread.
+
+        The "name" entry, if any, is used as the name of the save. Values should be
+        plain values (strings, numbers, lists, ...) rather than custom objects, since
+        only metadata serializable to JSON is cached.
+
+        Returns:
+            The metadata of the save.
+
+        Raises:
+            Exception: Any error, reported and treated as empty metadata.
+        """
+        return {}
+
+    def _metadata_source(self) -> Path:
+        """
+        Returns:
+            The file read by `_load_metadata()`, cached metadata is only used while
+            this file is unchanged. The save file by default.
+        """
+        return self._filepath
+
+    def _cache_key(self) -> tuple[str, FileSignature | None, str]:
+        # Path, signature and parser of the metadata in the metadata cache:
+        source = str(self._metadata_source())
+        cls = type(self)
+        parser = f"{cls.__module__}.{cls.__qualname__}/{cls._metadata_version}"
+        return source, file_signature(source), parser
+
+    def _read_metadata(self) -> Mapping[str, Any]:
+        source, signature, parser = self._cache_key()
+        if signature is not None:
+            metadata = metadata_cache().get(source, signature, parser)
+            if metadata is not None:
+                return metadata
+
+        metadata = self._load_metadata()
+        if signature is not None:
+            metadata_cache().put(source, signature, parser, metadata)
+        return metadata
+
+    def has_metadata(self) -> bool:
+        """
+        Returns:
+            True if this save reads metadata from the save, i.e. overrides
+            `_load_metadata()`.
+        """
+        return type(self)._load_metadata is not BasicGameSaveGame._load_metadata
+
+    def metadata(self) -> Mapping[str, Any]:
+        """
+        Retrieve the metadata of the save, from the cache or by loading it if needed.
+        If the metadata is being loaded by another thread, wait for it.
+
+        Returns:
+            The metadata of the save, empty if it could not be loaded.
+        """
+        if self._metadata is None:
+            with self._metadata_lock:
+                if self._metadata is None:
+                    try:
+                        self._metadata = self._read_metadata()
+                    except Exception as e:
+                        print(
+                            f"Failed to read the save {self._filepath}: {e}",
+                            file=sys.stderr,
+                        )
+                        self._metadata = {}
+        return self._metadata
+
+    def peek_metadata(self) -> Mapping[str, Any] | None:
+        """
+        Retrieve the metadata of the save without parsing it, for accessors called
+        on the GUI thread, e.g. `getName()`. If the metadata is neither loaded nor
+        cached, it is loaded on a worker thread (see `prefetch()`), and Mod Organizer
+        is then asked to refresh the saves, see `set_metadata_refresh()`.
+
+        Returns:
+            The metadata of the save, or None if it is not available yet.
+        """
+        if self._metadata is not None:
+            return self._metadata
+        if not self.has_metadata():
+            return {}
+
+        # the metadata is being loaded by another thread otherwise:
+        if self._metadata_lock.acquire(blocking=False):
+            try:
+                if self._metadata is None:
+                    source, signature, parser = self._cache_key()
+                    if signature is not None:
+                        self._metadata = metadata_cache().get(source, signature, parser)
+            finally:
+                self._metadata_lock.release()
+
+        if self._metadata is None:
+            self.prefetch()
+        return self._metadata
+
+    def metadata_loaded(self) -> bool:
+        """
+        Returns:
+            True if the metadata has already been loaded.
+        """
+        return self._metadata is not None
+
+    def prefetch(self, pool: QThreadPool | None = None) -> None:
+        """
+        Load the metadata of the save on a worker thread, if not loaded yet.
+
+        Args:
+            pool (optional): The thread pool to use, a pool dedicated to metadata by
+                default.
+        """
+        if self.has_metadata() and not self.metadata_loaded():
+            (pool or _metadata_pool()).start(_MetadataLoader(self))
 
     def getFilepath(self) -> str:
         return self._filepath.as_posix()
 
     def getName(self) -> str:
+        if (metadata := self.peek_metadata()) and (name := metadata.get("name")):
+            return str(name)
         return self._filepath.name
 
     def getCreationTime(self):
-        return QDateTime.fromSecsSinceEpoch(int(self._filepath.stat().st_mtime))
+        if self._stat is None:
+            self._stat = self._filepath.stat()
+        return QDateTime.fromSecsSinceEpoch(int(self._stat.st_mtime))
 
     def getSaveGroupIdentifier(self) -> str:
         return ""
@@ -49,38 +229,429 @@ class BasicGameSaveGame(mobase.ISaveGame):
         return [self.getFilepath()]
 
 
+_metadata_thread_pool: QThreadPool | None = None
+
+
+def _metadata_pool() -> QThreadPool:
+    global _metadata_thread_pool
+    if _metadata_thread_pool is None:
+        _metadata_thread_pool = QThreadPool()
+        _metadata_thread_pool.setMaxThreadCount(METADATA_THREADS)
+    return _metadata_thread_pool
+
+
+class _MetadataLoader(QRunnable):
+    def __init__(
+        self,
+        save: BasicGameSaveGame,
+        on_loaded: Callable[[Mapping[str, Any]], None] | None = None,
+        cancelled: Callable[[], bool] | None = None,
+    ):
+        super().__init__()
+        self._save = save
+        self._on_loaded = on_loaded
+        self._cancelled = cancelled
+
+    def run(self):
+        if self._cancelled is not None and self._cancelled():
+            return
+        loaded = self._save.metadata_loaded()
+        metadata = self._save.metadata()
+        if not loaded and _metadata_refresh is not None:
+            _metadata_refresh.loaded.emit(self._save)
+        if self._on_loaded is not None:
+            self._on_loaded(metadata)
+
+
+class _MetadataRefresh(QObject):
+    """
+    Calls a refresh function once metadata has been loaded in the background, at
+    most once per METADATA_REFRESH_DELAY. Each metadata source only triggers one
+    refresh, so that saves whose metadata cannot be cached do not trigger a refresh
+    on every listing.
+    """
+
+    # Emitted, possibly from a worker thread, with a save whose metadata has been
+    # loaded:
+    loaded = pyqtSignal(object)
+
+    def __init__(self, refresh: Callable[[], None]):
+        super().__init__()
+        self.refresh = refresh
+        self._sources: set[str] = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(METADATA_REFRESH_DELAY)
+        self._timer.timeout.connect(self._refresh)
+        self.loaded.connect(self._on_loaded)
+
+    def _on_loaded(self, save: BasicGameSaveGame):
+        source = str(save._metadata_source())  # pyright: ignore[reportPrivateUsage]
+        if source not in self._sources:
+            self._sources.add(source)
+            if not self._timer.isActive():
+                self._timer.start()
+
+    def _refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"Failed to refresh the saves: {e}", file=sys.stderr)
+
+
+_metadata_refresh: _MetadataRefresh | None = None
+
+
+def set_metadata_refresh(refresh: Callable[[], None]) -> None:
+    """
+    Set the function refreshing the saves listed by Mod Organizer, called when the
+    metadata of saves has been loaded in the background, since their names may have
+    changed (see `BasicGameSaveGame.peek_metadata()`). Must be called from the GUI
+    thread.
+
+    Args:
+        refresh: The function refreshing the saves.
+    """
+    global _metadata_refresh
+    if _metadata_refresh is None:
+        _metadata_refresh = _MetadataRefresh(refresh)
+    else:
+        _metadata_refresh.refresh = refresh
+
+
+def prefetch_metadata(
+    saves: Iterable[mobase.ISaveGame],
+    limit: int = METADATA_PREFETCH_LIMIT,
+    pool: QThreadPool | None = None,
+) -> None:
+    """
+    Load the metadata of the first saves of the given ones on worker threads, see
+    `BasicGameSaveGame.prefetch()`. Other saves are ignored.
+
+    This is opt-in: the metadata is otherwise only loaded when needed, e.g. by the
+    info widget. Games whose saves are slow to parse can call it from `listSaves()`
+    with the saves most likely to be displayed first.
+
+    Args:
+        saves: The saves to prefetch.
+        limit (optional): Maximum number of saves to prefetch.
+        pool (optional): The thread pool to use, a pool dedicated to metadata by
+            default.
+    """
+    for save in saves:
+        if limit <= 0:
+            break
+        if (
+            isinstance(save, BasicGameSaveGame)
+            and save.has_metadata()
+            and not save.metadata_loaded()
+        ):
+            save.prefetch(pool)
+            limit -= 1
+
+
+class SaveMetadataLoader(QObject):
+    """
+    Loads the metadata of saves on a worker thread for info widgets that display the
+    metadata of `BasicGameSaveGame`, so that hovering a save does not parse it on
+    the GUI thread. Only the metadata of the last requested save is delivered.
+    """
+
+    # Emitted on the thread of the loader with the save and its metadata:
+    loaded = pyqtSignal(object, object)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._generation = 0
+
+    def request(self, save: BasicGameSaveGame) -> None:
+        """
+        Load the metadata of the given save, `loaded` is emitted immediately if the
+        metadata is already loaded. Pending requests are cancelled.
+
+        Args:
+            save: The save.
+        """
+        self._generation += 1
+        if save.metadata_loaded():
+            self.loaded.emit(save, save.metadata())
+            return
+
+        generation = self._generation
+
+        def cancelled() -> bool:
+            return generation != self._generation
+
+        def on_loaded(metadata: Mapping[str, Any]):
+            if cancelled():
+                return
+            try:
+                self.loaded.emit(save, metadata)
+            except RuntimeError:
+                # the loader has been deleted:
+                pass
+
+        # before the prefetched saves, since the save is being displayed:
+        _metadata_pool().start(_MetadataLoader(save, on_loaded, cancelled), 1)
+
+
 def get_filedate_metadata(p: Path, save: mobase.ISaveGame) -> Mapping[str, str]:
     """Returns saves file date as the metadata for `BasicGameSaveGameInfoWidget`."""
     return {"File Date:": format_date(save.getCreationTime())}
 
 
+PreviewCallback = Callable[[Path], QPixmap | QImage | Path | str | None]
+MetadataCallback = Callable[[Path, mobase.ISaveGame], Mapping[str, Any] | None]
+
+# Key of a scaled preview: path and signature of the save, and width of the preview:
+_PreviewKey = tuple[str, FileSignature | None, int]
+
+
+class _PreviewCache:
+    """Thread-safe LRU cache of scaled previews, None for saves without preview."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._previews: OrderedDict[_PreviewKey, QImage | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: _PreviewKey) -> tuple[bool, QImage | None]:
+        with self._lock:
+            if key not in self._previews:
+                return False, None
+            self._previews.move_to_end(key)
+            return True, self._previews[key]
+
+    def put(self, key: _PreviewKey, preview: QImage | None) -> None:
+        with self._lock:
+            self._previews[key] = preview
+            self._previews.move_to_end(key)
+            while len(self._previews) > self._size:
+                self._previews.popitem(last=False)
+
+
+_preview_cache = _PreviewCache(PREVIEW_CACHE_SIZE)
+_preview_pool: QThreadPool | None = None
+
+
+def _pool() -> QThreadPool:
+    global _preview_pool
+    if _preview_pool is None:
+        _preview_pool = QThreadPool()
+        _preview_pool.setMaxThreadCount(PREVIEW_THREADS)
+    return _preview_pool
+
+
+def _preview_key(save_path: Path, width: int) -> _PreviewKey:
+    return str(save_path), file_signature(save_path), width
+
+
+# Source of a preview, as returned by the preview callback and converted on the GUI
+# thread: an image, or the path to an image that is decoded on a worker thread:
+_PreviewSource = QImage | Path | None
+
+# Preview of a save to decode, with its key in the cache:
+_PendingPreview = tuple[_PreviewKey, _PreviewSource]
+
+
+def _preview_source(get_preview: PreviewCallback, save_path: Path) -> _PreviewSource:
+    """
+    Retrieve the preview of a save from the preview callback, must be called from
+    the GUI thread since the callback may create a `QPixmap`. Errors are reported
+    and result in no preview.
+    """
+    try:
+        preview = get_preview(save_path)
+    except Exception as e:
+        print(f"Failed to retrieve the preview of {save_path}: {e}", file=sys.stderr)
+        return None
+
+    if isinstance(preview, str):
+        return Path(preview)
+    if isinstance(preview, QPixmap):
+        return preview.toImage()
+    return preview
+
+
+def _decode_preview(source: _PreviewSource, width: int) -> QImage | None:
+    """
+    Decode a preview and scale it to the given width, can be called from a worker
+    thread. Errors are reported and result in no preview.
+    """
+    if source is None:
+        return None
+    if isinstance(source, Path):
+        if not source.exists():
+            print(
+                f"Failed to retrieve the preview, file not found: {source}",
+                file=sys.stderr,
+            )
+            return None
+        image = QImage(str(source))
+    else:
+        image = source
+
+    if image.isNull():
+        return None
+    return image.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+
+
+class _SaveInfoLoader(QObject):
+    """
+    Loads the preview and metadata of saves for a `BasicGameSaveGameInfoWidget`.
+    The preview callback is called on the GUI thread, and the previews are decoded
+    and the metadata loaded on worker threads. Each request has a generation, and
+    requests from a previous generation are cancelled.
+    """
+
+    # Emitted with the generation, preview and metadata of a request:
+    loaded = pyqtSignal(int, object, object)
+
+    def __init__(
+        self,
+        parent: QObject,
+        get_preview: PreviewCallback,
+        get_metadata: MetadataCallback,
+        width: int,
+    ):
+        super().__init__(parent)
+        self.get_preview = get_preview
+        self.get_metadata = get_metadata
+        self.width = width
+        self.generation = 0
+
+    def cached_preview(self, save_path: Path) -> tuple[bool, QImage | None]:
+        return _preview_cache.lookup(_preview_key(save_path, self.width))
+
+    def _pending_preview(self, save_path: Path) -> _PendingPreview | None:
+        # Preview to decode for the given save, None if already cached:
+        key = _preview_key(save_path, self.width)
+        if _preview_cache.lookup(key)[0]:
+            return None
+        return key, _preview_source(self.get_preview, save_path)
+
+    def request(self, save_path: Path, save: mobase.ISaveGame) -> None:
+        """
+        Load the preview and metadata of a save, and then prefetch the previews of
+        the saves listed next to it, if known (see `SaveIndex.find_neighbours()`).
+        Pending requests are cancelled.
+        """
+        self.generation += 1
+        previews = [self._pending_preview(save_path)]
+        for neighbour in SaveIndex.find_neighbours(save):
+            previews.append(self._pending_preview(Path(neighbour.getFilepath())))
+        _pool().start(
+            _SaveInfoRequest(
+                self,
+                self.generation,
+                save_path,
+                save,
+                [preview for preview in previews if preview is not None],
+            )
+        )
+
+
+class _SaveInfoRequest(QRunnable):
+    def __init__(
+        self,
+        loader: _SaveInfoLoader,
+        generation: int,
+        save_path: Path,
+        save: mobase.ISaveGame,
+        previews: list[_PendingPreview],
+    ):
+        super().__init__()
+        self._loader = loader
+        self._generation = generation
+        self._save_path = save_path
+        self._save = save
+        self._previews = previews
+
+    def _cancelled(self) -> bool:
+        return self._loader.generation != self._generation
+
+    def _preview(
+        self, key: _PreviewKey, sources: Mapping[_PreviewKey, _PreviewSource]
+    ) -> QImage | None:
+        found, preview = _preview_cache.lookup(key)
+        if not found and key in sources:
+            preview = _decode_preview(sources[key], key[2])
+            _preview_cache.put(key, preview)
+        return preview
+
+    def run(self):
+        loader = self._loader
+        if self._cancelled():
+            return
+
+        # the preview of the save comes first, followed by its neighbours:
+        sources = dict(self._previews)
+        key = _preview_key(self._save_path, loader.width)
+        preview = self._preview(key, sources)
+
+        if self._cancelled():
+            return
+        try:
+            metadata = loader.get_metadata(self._save_path, self._save)
+        except Exception as e:
+            print(
+                f"Failed to retrieve the metadata of {self._save_path}: {e}",
+                file=sys.stderr,
+            )
+            metadata = None
+
+        try:
+            loader.loaded.emit(self._generation, preview, metadata)
+        except RuntimeError:
+            # the widget has been deleted:
+            return
+
+        for neighbour_key in sources.keys() - {key}:
+            if self._cancelled():
+                return
+            self._preview(neighbour_key, sources)
+
+
 class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
-    """Save game info widget to display metadata and a preview."""
+    """
+    Save game info widget to display metadata and a preview.
+
+    The preview is decoded and the metadata loaded on worker threads, a placeholder
+    is shown meanwhile. For saves listed by a `SaveIndex` (e.g. by the default
+    `BasicGame.listSaves()`), the previews of the saves next to the displayed one
+    are prefetched.
+    """
 
     def __init__(
         self,
         parent: QWidget | None,
-        get_preview: Callable[[Path], QPixmap | QImage | Path | str | None]
-        | None = lambda p: None,
-        get_metadata: Callable[[Path, mobase.ISaveGame], Mapping[str, Any] | None]
-        | None = get_filedate_metadata,
+        get_preview: PreviewCallback | None = lambda p: None,
+        get_metadata: MetadataCallback | None = get_filedate_metadata,
         max_width: int = 320,
     ):
         """
         Args:
             parent: parent widget
             get_preview (optional): `callback(savegame_path)` returning the
-                saves preview image or the path to it.
+                saves preview image or the path to it. Called from the GUI thread,
+                so it should be cheap: returning a path is preferred since images
+                are then read and scaled on a worker thread.
             get_metadata (optional): `callback(savegame_path, ISaveGame)` returning
-                the saves metadata. By default the saves file date is shown.
+                the saves metadata, called from a worker thread. By default the
+                saves file date is shown.
             max_width (optional): The maximum widget and (scaled) preview width.
                 Defaults to 320.
         """
         super().__init__(parent)
 
-        self._get_preview = get_preview or (lambda p: None)
-        self._get_metadata = get_metadata or get_filedate_metadata
         self._max_width = max_width or 320
+        self._loader = _SaveInfoLoader(
+            self,
+            get_preview or (lambda p: None),
+            get_metadata or get_filedate_metadata,
+            self._max_width,
+        )
+        self._loader.loaded.connect(self._on_loaded)
 
         layout = QVBoxLayout()
 
@@ -108,42 +679,35 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         # Clear previous
         self.hide()
         self._label.clear()
-        while self._metadata_layout.count():
-            layoutItem = self._metadata_layout.takeAt(0)
-            if layoutItem is not None and (w := layoutItem.widget()):
-                w.deleteLater()
-
-        # Retrieve the pixmap and metadata:
-        preview = self._get_preview(save_path)
-        pixmap = None
+        self._clear_metadata()
 
-        # Set the preview pixmap if the preview file exits
-        if preview is not None:
-            if isinstance(preview, str):
-                preview = Path(preview)
-            if isinstance(preview, Path):
-                if preview.exists():
-                    pixmap = QPixmap(str(preview))
-                else:
-                    print(
-                        f"Failed to retrieve the preview, file not found: {preview}",
-                        file=sys.stderr,
-                    )
-            elif isinstance(preview, QImage):
-                pixmap = QPixmap.fromImage(preview)
-            else:
-                pixmap = preview
-        if pixmap and not pixmap.isNull():
-            # Scale the pixmap and show it:
-            pixmap = pixmap.scaledToWidth(self._max_width)
-            self._label.setPixmap(pixmap)
-            self._label.show()
+        # Show the preview if already loaded, a placeholder otherwise, until the
+        # request completes:
+        found, preview = self._loader.cached_preview(save_path)
+        if found:
+            self._set_preview(preview)
         else:
-            self._label.hide()
-            pixmap = None
+            self._label.setText(f"Loading {save_path.name}...")
+            self._label.show()
+        self._metadata_widget.hide()
+        self.adjustSize()
+        self.show()
+
+        self._loader.request(save_path, save)
+
+    def _on_loaded(
+        self,
+        generation: int,
+        preview: QImage | None,
+        metadata: Mapping[str, Any] | None,
+    ):
+        if generation != self._loader.generation:
+            return
+
+        self._set_preview(preview)
 
         # Add metadata, file date by default.
-        metadata = self._get_metadata(save_path, save)
+        self._clear_metadata()
         if metadata:
             for key, value in metadata.items():
                 self._metadata_layout.addRow(*self._new_form_row(key, str(value)))
@@ -153,9 +717,24 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         else:
             self._metadata_widget.hide()
 
-        if metadata or pixmap:
+        if metadata or preview:
             self.adjustSize()
-            self.show()
+        else:
+            self.hide()
+
+    def _set_preview(self, preview: QImage | None):
+        if preview is not None:
+            self._label.setPixmap(QPixmap.fromImage(preview))
+            self._label.show()
+        else:
+            self._label.clear()
+            self._label.hide()
+
+    def _clear_metadata(self):
+        while self._metadata_layout.count():
+            layoutItem = self._metadata_layout.takeAt(0)
+            if layoutItem is not None and (w := layoutItem.widget()):
+                w.deleteLater()
 
     def _new_form_row(self, label: str = "", field: str = ""):
         qLabel = QLabel(text=label)
@@ -171,6 +750,7 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
 
     def set_maximum_width(self, width: int):
         self._max_width = width
+        self._loader.width = width
         self._metadata_widget.setMaximumWidth(width)
 
 
@@ -179,10 +759,8 @@ class BasicGameSaveGameInfo(mobase.SaveGameInfo):
 
     def __init__(
         self,
-        get_preview: Callable[[Path], QPixmap | QImage | Path | str | None]
-        | None = None,
-        get_metadata: Callable[[Path, mobase.ISaveGame], Mapping[str, Any] | None]
-        | None = None,
+        get_preview: PreviewCallback | None = None,
+        get_metadata: MetadataCallback | None = None,
         max_width: int = 0,
     ):
         """Args from: `BasicGameSaveGameInfoWidget`."""
@@ -1,53 +1,297 @@
 from __future__ import annotations
 
+import functools
+import os
+import re
 import shutil
 import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Generic, TypeVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Generic,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+    overload,
+)
 
 import mobase
-from PyQt6.QtCore import QDir, QFileInfo, QStandardPaths
+from PyQt6.QtCore import QCoreApplication, QDir, QFileInfo, QStandardPaths
 from PyQt6.QtGui import QIcon
 
 from .basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    set_metadata_refresh,
 )
+from .discovery_utils import DiscoveryRefresher, GameInstallIndex, StoreDiscovery
+from .savegame_utils import SAVE_MAX_DEPTH, SaveEntry, SaveIndex, scan_folder
 
 
-def replace_variables(value: str, game: BasicGame) -> str:
-    """Replace special paths in the given value."""
+# Convert Union[int, str, List[Union[int, str]]] to List[str].
+def ids_apply(v: list[int] | list[str] | int | str) -> list[str]:
+    """
+    Convert various types to a list of string. If the given value is already a
+    list, returns a new list with all values converted to string, otherwise
+    returns a list with the value convert to a string as its only element.
+    """
+    if isinstance(v, (int, str)):
+        v = [str(v)]
+    return [str(x) for x in v]
 
-    if value.find("%DOCUMENTS%") != -1:
-        value = value.replace(
-            "%DOCUMENTS%",
-            QStandardPaths.writableLocation(
-                QStandardPaths.StandardLocation.DocumentsLocation
-            ),
-        )
-    if value.find("%USERPROFILE%") != -1:
-        value = value.replace(
-            "%USERPROFILE%",
-            QStandardPaths.writableLocation(
-                QStandardPaths.StandardLocation.HomeLocation
-            ),
-        )
-    if value.find("%GAME_DOCUMENTS%") != -1:
-        value = value.replace(
-            "%GAME_DOCUMENTS%", game.documentsDirectory().absolutePath()
+
+_T = TypeVar("_T")
+
+# Interval, in seconds, between two checks of the location of the documents folder
+# by cached mappings:
+DOCUMENTS_CHECK_INTERVAL = 5.0
+
+_documents_location: str | None = None
+_documents_checked: float | None = None
+_documents_generation = 0
+
+
+def _get_documents_generation() -> int:
+    """
+    Return a number that changes each time the location of the documents folder
+    changes. The location is checked at most every DOCUMENTS_CHECK_INTERVAL.
+    """
+    global _documents_location, _documents_checked, _documents_generation
+
+    now = time.monotonic()
+    if (
+        _documents_checked is None
+        or now - _documents_checked >= DOCUMENTS_CHECK_INTERVAL
+    ):
+        location = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.DocumentsLocation
         )
-    if value.find("%GAME_PATH%") != -1:
-        value = value.replace("%GAME_PATH%", game.gameDirectory().absolutePath())
+        if location != _documents_location:
+            _documents_location = location
+            _documents_generation += 1
+        _documents_checked = now
+
+    return _documents_generation
+
 
+def _copy_value(value: _T) -> _T:
+    # Cached values are copied so that callers cannot modify the cache:
+    if isinstance(value, QDir):
+        return QDir(value)  # type: ignore
+    if isinstance(value, list):
+        return list(value)  # type: ignore
     return value
 
 
-_T = TypeVar("_T")
+def _environment_path(name: str, *home_parts: str) -> str:
+    # Windows folders such as %APPDATA%, with a fallback relative to the home folder:
+    return os.environ.get(name) or os.path.join(
+        QStandardPaths.writableLocation(QStandardPaths.StandardLocation.HomeLocation),
+        *home_parts,
+    )
+
+
+# Variables that can be used in the paths of the game mappings, e.g. %GAME_PATH%,
+# mapped to the functions computing their value for a game:
+PATH_VARIABLES: dict[str, Callable[[BasicGame], str]] = {
+    "DOCUMENTS": lambda game: QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.DocumentsLocation
+    ),
+    "USERPROFILE": lambda game: QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.HomeLocation
+    ),
+    "APPDATA": lambda game: _environment_path("APPDATA", "AppData", "Roaming"),
+    "LOCALAPPDATA": lambda game: _environment_path("LOCALAPPDATA", "AppData", "Local"),
+    "GAME_DOCUMENTS": lambda game: game.documentsDirectory().absolutePath(),
+    "GAME_PATH": lambda game: game.gameDirectory().absolutePath(),
+}
+
+# Variables whose value comes from a mapping of the game, which are only cached if
+# the mapping itself is cached:
+_MAPPING_VARIABLES: dict[str, str] = {"GAME_DOCUMENTS": "documentsDirectory"}
+
+
+class PathTemplate:
+
+    """
+    Value containing %VARIABLE% placeholders, split once into literal segments and
+    the names of the variables to replace. Variables are looked up when the template
+    is resolved, so variables registered afterwards are replaced too, and unknown
+    variables are kept as-is.
+    """
+
+    __slots__ = ("_segments",)
+
+    # Literal segments at even indices, names of variables at odd indices:
+    _segments: tuple[str, ...]
+
+    # Pattern matching the placeholders:
+    _PATTERN = re.compile(r"%([A-Za-z_][A-Za-z0-9_]*)%")
+
+    def __init__(self, value: str):
+        segments: list[str] = []
+        start = 0
+        if "%" in value:
+            for match in self._PATTERN.finditer(value):
+                segments.extend((value[start : match.start()], match[1]))
+                start = match.end()
+        segments.append(value[start:])
+        self._segments = tuple(segments)
+
+    @property
+    def is_constant(self) -> bool:
+        """True if the template does not contain any placeholder."""
+        return len(self._segments) == 1
+
+    @property
+    def variables(self) -> tuple[str, ...]:
+        """Names of the variables in the template, including unknown ones."""
+        return self._segments[1::2]
+
+    def resolve(self, variables: PathVariables) -> str:
+        """
+        Args:
+            variables: Values of the variables.
+
+        Returns:
+            The value of the template with all the known variables replaced.
+        """
+        if len(self._segments) == 1:
+            return self._segments[0]
+        parts = list(self._segments)
+        parts[1::2] = [
+            variables.get(name) if name in PATH_VARIABLES else "%{}%".format(name)
+            for name in self.variables
+        ]
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_template(value: str) -> PathTemplate:
+    """
+    Args:
+        value: A value containing %VARIABLE% placeholders.
+
+    Returns:
+        The compiled template for the value. Templates are cached, so compiling the
+        same value twice is cheap.
+    """
+    return PathTemplate(value)
+
+
+def register_path_variable(name: str, fn: Callable[[BasicGame], str]):
+    """
+    Add a variable that can be used in the paths of the game mappings. The variable
+    is also replaced in the mappings of the game classes created before, the values
+    already cached by a game are only updated when the game invalidates them.
+
+    Args:
+        name: Name of the variable, without the surrounding %.
+        fn: Function computing the value of the variable for a game.
+
+    Raises:
+        ValueError: If the name is not a valid variable name.
+    """
+    if not PathTemplate._PATTERN.fullmatch(  # pyright: ignore[reportPrivateUsage]
+        "%{}%".format(name)
+    ):
+        raise ValueError("Invalid path variable name: {}.".format(name))
+    PATH_VARIABLES[name] = fn
+
+
+class PathVariables:
+
+    """
+    Values of the path variables for a game. Each value is computed on first use and
+    kept until the table is cleared or the location of the documents folder changes,
+    except for the variables coming from a mapping that is not cached.
+    """
+
+    def __init__(self, game: BasicGame):
+        self._game = game
+        self._values: dict[str, str] = {}
+        self._generation: int | None = None
+
+    def clear(self):
+        """Clear the values of the variables, e.g. when the game path changes."""
+        self._values.clear()
+
+    def get(self, name: str) -> str:
+        """
+        Args:
+            name: Name of the variable, without the surrounding %.
+
+        Returns:
+            The value of the variable for the game.
+        """
+        generation = _get_documents_generation()
+        if generation != self._generation:
+            self._values.clear()
+            self._generation = generation
+
+        value = self._values.get(name)
+        if value is None:
+            value = PATH_VARIABLES[name](self._game)
+            mapping = _MAPPING_VARIABLES.get(name)
+            mappings = self._game._mappings  # pyright: ignore[reportPrivateUsage]
+            if mapping is None or mappings.cacheable(mapping):
+                self._values[name] = value
+        return value
+
+
+def _game_variables(game: BasicGame) -> PathVariables:
+    return game._mappings.variables  # pyright: ignore[reportPrivateUsage]
+
+
+def replace_variables(value: str, game: BasicGame) -> str:
+    """Replace special paths in the given value."""
+    return compile_template(value).resolve(_game_variables(game))
+
+
+class CompiledMapping(NamedTuple):
+    """
+    Mapping compiled for a game class (or instance), see BasicGameMapping.compile().
+    """
+
+    # Callable returning the value of the mapping for a game:
+    default: Callable[[BasicGame], Any]
+
+    # True if the value comes from an attribute of the game, in which case the
+    # variables are replaced by default:
+    static: bool
+
+    # False if the value must be computed on each access:
+    cache: bool
 
 
 class BasicGameMapping(Generic[_T]):
-    # The game:
-    _game: "BasicGame"
+
+    """
+    Mapping from an attribute of the game (e.g. GameName) to the value returned by one
+    of its methods (e.g. gameName()).
+
+    Mappings are declared once, as attributes of BasicGameMappings, and compiled once
+    per game class. Accessing a mapping on a BasicGameMappings instance returns a
+    BoundGameMapping for the game.
+    """
+
+    __slots__ = (
+        "name",
+        "_exposed_name",
+        "_internal_method_name",
+        "_default",
+        "_apply_fn",
+        "_cache",
+    )
+
+    # Name of the mapping in BasicGameMappings:
+    name: str
 
     # Name of the attribute for exposure:
     _exposed_name: str
@@ -55,30 +299,86 @@ class BasicGameMapping(Generic[_T]):
     # Name of the internal method:
     _internal_method_name: str
 
-    # Required:
-    _required: bool
-
     # Callable returning a default value (if not required):
-    _default: Callable[["BasicGame"], _T]
+    _default: Callable[[BasicGame], _T] | None
 
     # Function to apply to the value:
     _apply_fn: Callable[[_T | str], _T] | None
 
+    # Whether the value can be cached, or a function deciding it from the game class:
+    _cache: bool | Callable[[Any], bool]
+
     def __init__(
         self,
-        game: BasicGame,
         exposed_name: str,
         internal_method: str,
         default: Callable[[BasicGame], _T] | None = None,
         apply_fn: Callable[[_T | str], _T] | None = None,
+        cache: bool | Callable[[Any], bool] = True,
     ):
-        self._game = game
+        """
+        Args:
+            exposed_name: Name of the attribute of the game containing the value.
+            internal_method: Name of the method of the game returning the value.
+            default: Callable returning the value if the game has no such attribute.
+            apply_fn: Function to apply to the value of the attribute.
+            cache: If False, the value is computed on each call to get(), for values
+                that may change without the inputs of the game changing. May be a
+                function called with the game class.
+        """
+        self.name = ""
         self._exposed_name = exposed_name
         self._internal_method_name = internal_method
+        self._default = default
         self._apply_fn = apply_fn
+        self._cache = cache
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    @property
+    def exposed_name(self) -> str:
+        return self._exposed_name
+
+    @property
+    def internal_method(self) -> str:
+        return self._internal_method_name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> BasicGameMapping[_T]:
+        ...
 
-        if hasattr(game, self._exposed_name):
-            value = getattr(game, self._exposed_name)
+    @overload
+    def __get__(self, instance: BasicGameMappings, owner: type) -> BoundGameMapping[_T]:
+        ...
+
+    def __get__(
+        self, instance: BasicGameMappings | None, owner: type
+    ) -> BasicGameMapping[_T] | BoundGameMapping[_T]:
+        if instance is None:
+            return self
+        return BoundGameMapping(instance, self.name)
+
+    def compile(self, source: Any, from_name: str) -> CompiledMapping:
+        """
+        Compile this mapping for a game.
+
+        Args:
+            source: The game class, or a game instance for games whose attributes are
+                set on the instance.
+            from_name: Name of the game, for error messages.
+
+        Returns:
+            The compiled mapping.
+
+        Raises:
+            ValueError: If the attribute of the game is invalid, or if the game has
+                neither the attribute nor an implementation of the method.
+        """
+        cache = self._cache(source) if callable(self._cache) else self._cache
+
+        if hasattr(source, self._exposed_name):
+            value = getattr(source, self._exposed_name)
 
             if self._apply_fn is not None:
                 try:
@@ -86,37 +386,33 @@ class BasicGameMapping(Generic[_T]):
                 except:  # noqa
                     raise ValueError(
                         "Basic game plugin from {} has an invalid {} property.".format(
-                            game._fromName,  # pyright: ignore[reportPrivateUsage]
-                            self._exposed_name,
+                            from_name, self._exposed_name
                         )
                     )
-            self._default = lambda game: value  # type: ignore
-        elif default is not None:
-            self._default = default  # type: ignore
-        elif getattr(game.__class__, self._internal_method_name) is getattr(
+            return CompiledMapping(_static_default(value), True, cache)
+
+        if self._default is not None:
+            return CompiledMapping(self._default, False, cache)
+
+        owner = source if isinstance(source, type) else type(source)
+        if getattr(owner, self._internal_method_name) is getattr(
             BasicGame, self._internal_method_name
         ):
             raise ValueError(
                 "Basic game plugin from {} is missing {} property.".format(
-                    game._fromName,  # pyright: ignore[reportPrivateUsage]
-                    self._exposed_name,
+                    from_name, self._exposed_name
                 )
             )
 
-    def get(self) -> _T:
-        """Return the value of this mapping."""
-        value = self._default(self._game)  # type: ignore
-
-        if isinstance(value, str):
-            return replace_variables(value, self._game)  # type: ignore
-        elif isinstance(value, QDir):
-            return QDir(replace_variables(value.path(), self._game))  # type: ignore
-
-        # MO2 does not support Path anywhere so we always convert to str:
-        elif isinstance(value, Path):
-            return replace_variables(str(value), self._game)  # type: ignore
+        # the method is overridden, so the mapping is never used:
+        def missing(game: BasicGame) -> Any:
+            raise ValueError(
+                "Basic game plugin from {} is missing {} property.".format(
+                    from_name, self._exposed_name
+                )
+            )
 
-        return value
+        return CompiledMapping(missing, False, cache)
 
 
 class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
@@ -126,19 +422,87 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
     plugin is responsible to choose the right option depending on the context.
     """
 
-    _index: int
+    __slots__ = ("current_default",)
+
+    # Callable returning the current value if there are no options:
+    current_default: Callable[[BasicGame], _T] | None
 
     def __init__(
         self,
-        game: BasicGame,
         exposed_name: str,
         internal_method: str,
         default: Callable[[BasicGame], _T] | None = None,
         apply_fn: Callable[[list[_T] | str], list[_T]] | None = None,
+        cache: bool | Callable[[Any], bool] = True,
     ):
-        super().__init__(game, exposed_name, internal_method, lambda g: [], apply_fn)
-        self._index = -1
-        self._current_default = default
+        super().__init__(exposed_name, internal_method, lambda g: [], apply_fn, cache)
+        self.current_default = default
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> BasicGameOptionsMapping[_T]:
+        ...
+
+    @overload
+    def __get__(
+        self, instance: BasicGameMappings, owner: type
+    ) -> BoundGameOptionsMapping[_T]:
+        ...
+
+    def __get__(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, instance: BasicGameMappings | None, owner: type
+    ) -> BasicGameOptionsMapping[_T] | BoundGameOptionsMapping[_T]:
+        if instance is None:
+            return self
+        return BoundGameOptionsMapping(instance, self.name)
+
+
+def _static_default(value: Any) -> Callable[[BasicGame], Any]:
+    # Values with variables are compiled once, constant values are returned as-is:
+    if isinstance(value, Path):
+        value = str(value)
+    if not isinstance(value, (str, QDir)):
+        return lambda game: value
+
+    template = compile_template(value if isinstance(value, str) else value.path())
+    if template.is_constant:
+        return lambda game: value
+    elif isinstance(value, QDir):
+        return lambda game: QDir(template.resolve(_game_variables(game)))
+    return lambda game: template.resolve(_game_variables(game))
+
+
+class BoundGameMapping(Generic[_T]):
+
+    """
+    Mapping of a game, as returned by the attributes of BasicGameMappings.
+    """
+
+    __slots__ = ("_mappings", "_name")
+
+    def __init__(self, mappings: BasicGameMappings, name: str):
+        self._mappings = mappings
+        self._name = name
+
+    def invalidate(self):
+        """Clear the cached value of this mapping."""
+        self._mappings.invalidate(self._name)
+
+    def get(self) -> _T:
+        """
+        Return the value of this mapping. The value is cached until the mapping is
+        invalidated (see BasicGameMappings.invalidate()) or the location of the
+        documents folder changes.
+        """
+        return self._mappings.get(self._name)
+
+
+class BoundGameOptionsMapping(BoundGameMapping[list[_T]]):
+
+    """
+    Options mapping of a game, as returned by the attributes of BasicGameMappings.
+    """
+
+    __slots__ = ()
 
     def set_index(self, index: int):
         """
@@ -147,7 +511,7 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
         Args:
             index: Index of the option to use.
         """
-        self._index = index
+        self._mappings.set_option_index(self._name, index)
 
     def set_value(self, value: _T):
         """
@@ -158,9 +522,10 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
             value: The value to set the index to.
         """
         try:
-            self._index = self.get().index(value)
+            index = self.get().index(value)
         except ValueError:
-            self._index = -1
+            index = -1
+        self._mappings.set_option_index(self._name, index)
 
     def has_value(self) -> bool:
         """
@@ -169,192 +534,331 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
         Returns:
             True if a value was set, False otherwise.
         """
-        return self._index != -1
+        return self._mappings.option_index(self._name) != -1
 
     def current(self) -> _T:
-        values = self._default(self._game)  # type: ignore
+        return self._mappings.current(self._name)
 
-        if not values:
-            return self._current_default(self._game)  # type: ignore
 
-        if self._index == -1:
-            value = values[0]
-        else:
-            value = values[self._index]
+def _default_documents_directory(game: mobase.IPluginGame):
+    folders = [
+        "{}/My Games/{}".format(
+            QStandardPaths.writableLocation(
+                QStandardPaths.StandardLocation.DocumentsLocation
+            ),
+            game.gameName(),
+        ),
+        "{}/{}".format(
+            QStandardPaths.writableLocation(
+                QStandardPaths.StandardLocation.DocumentsLocation
+            ),
+            game.gameName(),
+        ),
+    ]
+    for folder in folders:
+        qdir = QDir(folder)
+        if qdir.exists():
+            return qdir
 
-        if isinstance(value, str):
-            return replace_variables(value, self._game)  # type: ignore
-        elif isinstance(value, QDir):
-            return QDir(replace_variables(value.path(), self._game))  # type: ignore
+    return QDir()
 
-        return value
+
+def _saves_directory_cacheable(game: Any) -> bool:
+    # the saves directory depends on the documents directory if it is not set or if
+    # it contains %GAME_DOCUMENTS%:
+    if hasattr(game, "GameSavesDirectory"):
+        value = getattr(game, "GameSavesDirectory")
+        path = value.path() if isinstance(value, QDir) else str(value)
+        if "GAME_DOCUMENTS" not in compile_template(path).variables:
+            return True
+    return hasattr(game, "GameDocumentsDirectory")
 
 
 class BasicGameMappings:
-    name: BasicGameMapping[str]
-    author: BasicGameMapping[str]
-    version: BasicGameMapping[mobase.VersionInfo]
-    description: BasicGameMapping[str]
-    gameName: BasicGameMapping[str]
-    gameShortName: BasicGameMapping[str]
-    gameNexusName: BasicGameMapping[str]
-    validShortNames: BasicGameMapping[list[str]]
-    nexusGameId: BasicGameMapping[int]
-    binaryName: BasicGameMapping[str]
-    launcherName: BasicGameMapping[str]
-    dataDirectory: BasicGameMapping[str]
-    documentsDirectory: BasicGameMapping[QDir]
-    iniFiles: BasicGameMapping[list[str]]
-    savesDirectory: BasicGameMapping[QDir]
-    savegameExtension: BasicGameMapping[str]
-    steamAPPId: BasicGameOptionsMapping[str]
-    gogAPPId: BasicGameOptionsMapping[str]
-    originManifestIds: BasicGameOptionsMapping[str]
-    originWatcherExecutables: BasicGameMapping[list[str]]
-    epicAPPId: BasicGameOptionsMapping[str]
-    eaDesktopContentId: BasicGameOptionsMapping[str]
-    supportURL: BasicGameMapping[str]
 
-    @staticmethod
-    def _default_documents_directory(game: mobase.IPluginGame):
-        folders = [
-            "{}/My Games/{}".format(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.DocumentsLocation
-                ),
-                game.gameName(),
-            ),
-            "{}/{}".format(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.DocumentsLocation
-                ),
-                game.gameName(),
-            ),
-        ]
-        for folder in folders:
-            qdir = QDir(folder)
-            if qdir.exists():
-                return qdir
+    """
+    Values of the mappings of a game.
 
-        return QDir()
+    The mappings are declared once, as class attributes, and compiled once per game
+    class (see compile_mappings()). Instances only hold the values cached for the game
+    and the selected store options.
+    """
+
+    __slots__ = ("_game", "_table", "_cached", "_indices", "variables")
 
     # Game mappings:
+    name: BasicGameMapping[str] = BasicGameMapping("Name", "name")
+    author: BasicGameMapping[str] = BasicGameMapping("Author", "author")
+    version: BasicGameMapping[mobase.VersionInfo] = BasicGameMapping(
+        "Version",
+        "version",
+        apply_fn=lambda s: mobase.VersionInfo(s) if isinstance(s, str) else s,
+    )
+    description: BasicGameMapping[str] = BasicGameMapping(
+        "Description",
+        "description",
+        lambda g: "Adds basic support for game {}.".format(g.gameName()),
+    )
+    gameName: BasicGameMapping[str] = BasicGameMapping("GameName", "gameName")
+    gameShortName: BasicGameMapping[str] = BasicGameMapping(
+        "GameShortName", "gameShortName"
+    )
+    gameNexusName: BasicGameMapping[str] = BasicGameMapping(
+        "GameNexusName",
+        "gameNexusName",
+        default=lambda g: g.gameShortName(),
+    )
+    validShortNames: BasicGameMapping[list[str]] = BasicGameMapping(
+        "GameValidShortNames",
+        "validShortNames",
+        default=lambda g: [],
+        apply_fn=lambda value: [c.strip() for c in value.split(",")]  # type: ignore
+        if isinstance(value, str)
+        else value,
+    )
+    nexusGameId: BasicGameMapping[int] = BasicGameMapping(
+        "GameNexusId", "nexusGameID", default=lambda g: 0, apply_fn=int
+    )
+    binaryName: BasicGameMapping[str] = BasicGameMapping("GameBinary", "binaryName")
+    launcherName: BasicGameMapping[str] = BasicGameMapping(
+        "GameLauncher",
+        "getLauncherName",
+        default=lambda g: "",
+    )
+    dataDirectory: BasicGameMapping[str] = BasicGameMapping(
+        "GameDataPath", "dataDirectory"
+    )
+    documentsDirectory: BasicGameMapping[QDir] = BasicGameMapping(
+        "GameDocumentsDirectory",
+        "documentsDirectory",
+        apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
+        default=_default_documents_directory,
+        # the default documents directory depends on the existing folders:
+        cache=lambda game: hasattr(game, "GameDocumentsDirectory"),
+    )
+    iniFiles: BasicGameMapping[list[str]] = BasicGameMapping(
+        "GameIniFiles",
+        "iniFiles",
+        lambda g: [],
+        apply_fn=lambda value: [c.strip() for c in value.split(",")]
+        if isinstance(value, str)
+        else value,
+    )
+    savesDirectory: BasicGameMapping[QDir] = BasicGameMapping(
+        "GameSavesDirectory",
+        "savesDirectory",
+        apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
+        default=lambda g: g.documentsDirectory(),
+        cache=_saves_directory_cacheable,
+    )
+    savegameExtension: BasicGameMapping[str] = BasicGameMapping(
+        "GameSaveExtension", "savegameExtension", default=lambda g: "save"
+    )
+    saveMaxDepth: BasicGameMapping[int] = BasicGameMapping(
+        "GameSaveMaxDepth",
+        "saveMaxDepth",
+        default=lambda g: SAVE_MAX_DEPTH,
+        apply_fn=int,
+    )
+
+    steamAPPId: BasicGameOptionsMapping[str] = BasicGameOptionsMapping(
+        "GameSteamId", "steamAPPId", default=lambda g: "", apply_fn=ids_apply
+    )
+    gogAPPId: BasicGameOptionsMapping[str] = BasicGameOptionsMapping(
+        "GameGogId", "gogAPPId", default=lambda g: "", apply_fn=ids_apply
+    )
+    originManifestIds: BasicGameOptionsMapping[str] = BasicGameOptionsMapping(
+        "GameOriginManifestIds",
+        "originManifestIds",
+        default=lambda g: "",
+        apply_fn=ids_apply,
+    )
+    originWatcherExecutables: BasicGameMapping[list[str]] = BasicGameMapping(
+        "GameOriginWatcherExecutables",
+        "originWatcherExecutables",
+        apply_fn=lambda s: [s] if isinstance(s, str) else s,
+        default=lambda g: [],
+    )
+    epicAPPId: BasicGameOptionsMapping[str] = BasicGameOptionsMapping(
+        "GameEpicId", "epicAPPId", default=lambda g: "", apply_fn=ids_apply
+    )
+    eaDesktopContentId: BasicGameOptionsMapping[str] = BasicGameOptionsMapping(
+        "GameEaDesktopId",
+        "eaDesktopContentId",
+        default=lambda g: "",
+        apply_fn=ids_apply,
+    )
+    supportURL: BasicGameMapping[str] = BasicGameMapping(
+        "GameSupportURL", "supportURL", default=lambda g: ""
+    )
+
+    # The game:
+    _game: BasicGame
+
+    # Compiled mappings of the game, shared by all instances of the game class:
+    _table: Mapping[str, CompiledMapping]
+
+    # Cached values, with the generation of the documents location they were
+    # computed with:
+    _cached: dict[str, tuple[Any, int]]
+
+    # Index of the selected option of the options mappings, if set:
+    _indices: dict[str, int]
+
+    # Values of the variables used by the mappings:
+    variables: PathVariables
+
     def __init__(self, game: BasicGame):
+        """
+        Args:
+            game: The game.
+
+        Raises:
+            ValueError: If the game has invalid or missing attributes.
+        """
         self._game = game
+        self._cached = {}
+        self._indices = {}
+        self.variables = PathVariables(game)
+
+        # games can set their attributes on the instance, in which case the mappings
+        # are compiled for the instance:
+        if not _MAPPING_ATTRIBUTES.isdisjoint(vars(game)):
+            self._table = compile_mappings(
+                game, game._fromName  # pyright: ignore[reportPrivateUsage]
+            )
+        else:
+            self._table = type(game).mapping_table()
 
-        self.name = BasicGameMapping(game, "Name", "name")
-        self.author = BasicGameMapping(game, "Author", "author")
-        self.version = BasicGameMapping(
-            game,
-            "Version",
-            "version",
-            apply_fn=lambda s: mobase.VersionInfo(s) if isinstance(s, str) else s,
-        )
-        self.description = BasicGameMapping(
-            game,
-            "Description",
-            "description",
-            lambda g: "Adds basic support for game {}.".format(g.gameName()),
-        )
-        self.gameName = BasicGameMapping(game, "GameName", "gameName")
-        self.gameShortName = BasicGameMapping(game, "GameShortName", "gameShortName")
-        self.gameNexusName = BasicGameMapping(
-            game,
-            "GameNexusName",
-            "gameNexusName",
-            default=lambda g: g.gameShortName(),
-        )
-        self.validShortNames = BasicGameMapping(
-            game,
-            "GameValidShortNames",
-            "validShortNames",
-            default=lambda g: [],
-            apply_fn=lambda value: [c.strip() for c in value.split(",")]  # type: ignore
-            if isinstance(value, str)
-            else value,
-        )
-        self.nexusGameId = BasicGameMapping(
-            game, "GameNexusId", "nexusGameID", default=lambda g: 0, apply_fn=int
-        )
-        self.binaryName = BasicGameMapping(game, "GameBinary", "binaryName")
-        self.launcherName = BasicGameMapping(
-            game,
-            "GameLauncher",
-            "getLauncherName",
-            default=lambda g: "",
-        )
-        self.dataDirectory = BasicGameMapping(game, "GameDataPath", "dataDirectory")
-        self.documentsDirectory = BasicGameMapping(
-            game,
-            "GameDocumentsDirectory",
-            "documentsDirectory",
-            apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
-            default=BasicGameMappings._default_documents_directory,
-        )
-        self.iniFiles = BasicGameMapping(
-            game,
-            "GameIniFiles",
-            "iniFiles",
-            lambda g: [],
-            apply_fn=lambda value: [c.strip() for c in value.split(",")]
-            if isinstance(value, str)
-            else value,
-        )
-        self.savesDirectory = BasicGameMapping(
-            game,
-            "GameSavesDirectory",
-            "savesDirectory",
-            apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
-            default=lambda g: g.documentsDirectory(),
-        )
-        self.savegameExtension = BasicGameMapping(
-            game, "GameSaveExtension", "savegameExtension", default=lambda g: "save"
-        )
+    def invalidate(self, name: str | None = None):
+        """
+        Clear the cached values of the mappings. Must be called when an input of the
+        mappings changes, e.g. the game path.
 
-        # Convert Union[int, str, List[Union[int, str]]] to List[str].
-        def ids_apply(v: list[int] | list[str] | int | str) -> list[str]:
-            """
-            Convert various types to a list of string. If the given value is already a
-            list, returns a new list with all values converted to string, otherwise
-            returns a list with the value convert to a string as its only element.
-            """
-            if isinstance(v, (int, str)):
-                v = [str(v)]
-            return [str(x) for x in v]
-
-        self.steamAPPId = BasicGameOptionsMapping(
-            game, "GameSteamId", "steamAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.gogAPPId = BasicGameOptionsMapping(
-            game, "GameGogId", "gogAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.originManifestIds = BasicGameOptionsMapping(
-            game,
-            "GameOriginManifestIds",
-            "originManifestIds",
-            default=lambda g: "",
-            apply_fn=ids_apply,
-        )
-        self.originWatcherExecutables = BasicGameMapping(
-            game,
-            "GameOriginWatcherExecutables",
-            "originWatcherExecutables",
-            apply_fn=lambda s: [s] if isinstance(s, str) else s,
-            default=lambda g: [],
-        )
-        self.epicAPPId = BasicGameOptionsMapping(
-            game, "GameEpicId", "epicAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.eaDesktopContentId = BasicGameOptionsMapping(
-            game,
-            "GameEaDesktopId",
-            "eaDesktopContentId",
-            default=lambda g: "",
-            apply_fn=ids_apply,
-        )
-        self.supportURL = BasicGameMapping(
-            game, "GameSupportURL", "supportURL", default=lambda g: ""
-        )
+        Args:
+            name: Name of the mapping to invalidate, or None for all the mappings.
+        """
+        if name is None:
+            self.variables.clear()
+            self._cached.clear()
+        else:
+            self._cached.pop(name, None)
+
+    def cacheable(self, name: str) -> bool:
+        """
+        Args:
+            name: Name of the mapping.
+
+        Returns:
+            True if the value of the mapping is cached, False if it is computed on
+            each access.
+        """
+        return self._table[name].cache
+
+    def get(self, name: str) -> Any:
+        """
+        Args:
+            name: Name of the mapping.
+
+        Returns:
+            The value of the mapping, see BoundGameMapping.get().
+        """
+        compiled = self._table[name]
+        if not compiled.cache:
+            return self._compute(compiled)
+
+        generation = _get_documents_generation()
+        cached = self._cached.get(name)
+        if cached is None or cached[1] != generation:
+            cached = self._cached[name] = (self._compute(compiled), generation)
+        return _copy_value(cached[0])
+
+    def _compute(self, compiled: CompiledMapping) -> Any:
+        value = compiled.default(self._game)
+
+        if compiled.static:
+            return value
+        elif isinstance(value, str):
+            return replace_variables(value, self._game)
+        elif isinstance(value, QDir):
+            return QDir(replace_variables(value.path(), self._game))
+
+        # MO2 does not support Path anywhere so we always convert to str:
+        elif isinstance(value, Path):
+            return replace_variables(str(value), self._game)
+
+        return value
+
+    def option_index(self, name: str) -> int:
+        """
+        Args:
+            name: Name of the options mapping.
+
+        Returns:
+            The index of the selected option, or -1 if none was selected.
+        """
+        return self._indices.get(name, -1)
+
+    def set_option_index(self, name: str, index: int):
+        """
+        Args:
+            name: Name of the options mapping.
+            index: Index of the option to select, -1 to clear the selection.
+        """
+        self._indices[name] = index
+
+    def current(self, name: str) -> Any:
+        """
+        Args:
+            name: Name of the options mapping.
+
+        Returns:
+            The selected option of the mapping, see BoundGameOptionsMapping.current().
+        """
+        values = self._table[name].default(self._game)
+
+        if not values:
+            mapping: BasicGameOptionsMapping[Any] = getattr(BasicGameMappings, name)
+            return mapping.current_default(self._game)  # type: ignore
+
+        index = self._indices.get(name, -1)
+        value = values[0] if index == -1 else values[index]
+
+        if isinstance(value, str):
+            return replace_variables(value, self._game)
+        elif isinstance(value, QDir):
+            return QDir(replace_variables(value.path(), self._game))
+
+        return value
+
+
+# The mappings declared by BasicGameMappings:
+_MAPPINGS: tuple[BasicGameMapping[Any], ...] = tuple(
+    value
+    for value in vars(BasicGameMappings).values()
+    if isinstance(value, BasicGameMapping)
+)
+
+# Names of the attributes of the game used by the mappings:
+_MAPPING_ATTRIBUTES = frozenset(mapping.exposed_name for mapping in _MAPPINGS)
+
+
+def compile_mappings(source: Any, from_name: str) -> dict[str, CompiledMapping]:
+    """
+    Compile the mappings for a game.
+
+    Args:
+        source: The game class, or a game instance for games whose attributes are set
+            on the instance.
+        from_name: Name of the game, for error messages.
+
+    Returns:
+        A mapping from name of the mapping to the compiled mapping.
+
+    Raises:
+        ValueError: If an attribute of the game is invalid or missing.
+    """
+    return {mapping.name: mapping.compile(source, from_name) for mapping in _MAPPINGS}
 
 
 _GameFeature = (
@@ -370,32 +874,161 @@ _GameFeature = (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class GameSnapshot:
+
+    """
+    Resolved properties of a game, see BasicGame.snapshot(). There is one field per
+    mapping of BasicGameMappings, lists are stored as tuples and directories as
+    absolute paths.
+    """
+
+    # Path to the game, empty if the game was not found:
+    gamePath: str
+
+    name: str
+    author: str
+    version: mobase.VersionInfo
+    description: str
+    gameName: str
+    gameShortName: str
+    gameNexusName: str
+    validShortNames: tuple[str, ...]
+    nexusGameId: int
+    binaryName: str
+    launcherName: str
+    dataDirectory: str
+    documentsDirectory: str
+    iniFiles: tuple[str, ...]
+    savesDirectory: str
+    savegameExtension: str
+    saveMaxDepth: int
+    steamAPPId: tuple[str, ...]
+    gogAPPId: tuple[str, ...]
+    originManifestIds: tuple[str, ...]
+    originWatcherExecutables: tuple[str, ...]
+    epicAPPId: tuple[str, ...]
+    eaDesktopContentId: tuple[str, ...]
+    supportURL: str
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, QDir):
+        return value.absolutePath()
+    if isinstance(value, list):
+        return tuple(value)  # pyright: ignore[reportUnknownArgumentType]
+    return value
+
+
+# Public getter of the mappings whose getter is not named after the mapping:
+_SNAPSHOT_GETTERS = {"supportURL": "getSupportURL"}
+
+
+# Name of the mapping (in BasicGameMappings) containing the IDs of each store:
+_STORE_MAPPINGS = {
+    "steam": "steamAPPId",
+    "gog": "gogAPPId",
+    "origin": "originManifestIds",
+    "epic": "epicAPPId",
+    "eadesktop": "eaDesktopContentId",
+}
+
+
 class BasicGame(mobase.IPluginGame):
 
     """This class implements some methods from mobase.IPluginGame
     to make it easier to create game plugins without having to implement
     all the methods of mobase.IPluginGame."""
 
-    # List of steam, GOG, origin and Epic games:
-    steam_games: dict[str, Path]
-    gog_games: dict[str, Path]
-    origin_games: dict[str, Path]
-    epic_games: dict[str, Path]
-    eadesktop_games: dict[str, Path]
+    # Index of the steam, GOG, origin, Epic and EA Desktop games, built by setup():
+    install_index: GameInstallIndex = GameInstallIndex()
+
+    # Discovery filling install_index, and its refresher, created by setup():
+    _discovery: StoreDiscovery | None = None
+    _refresher: DiscoveryRefresher | None = None
+
+    # List of steam, GOG, origin and Epic games, views of install_index kept for
+    # compatibility:
+    steam_games: Mapping[str, Path] = {}
+    gog_games: Mapping[str, Path] = {}
+    origin_games: Mapping[str, Path] = {}
+    epic_games: Mapping[str, Path] = {}
+    eadesktop_games: Mapping[str, Path] = {}
+
+    # Attributes containing the IDs of the game for each store, in detection order:
+    STORE_ID_ATTRIBUTES = {
+        "steam": "GameSteamId",
+        "gog": "GameGogId",
+        "origin": "GameOriginManifestIds",
+        "epic": "GameEpicId",
+        "eadesktop": "GameEaDesktopId",
+    }
+
+    @staticmethod
+    def setup(wanted: Mapping[str, Collection[str]] | None = None, watch: bool = False):
+        """
+        Prepare the discovery of the installed games of each store.
+
+        No store is scanned by this method, each store is scanned the first time a
+        game with an ID in this store is looked up (see find_game_path()).
+
+        Args:
+            wanted: IDs to look for in each store, typically the IDs declared by
+                the loaded plugins (see discovery_utils.collect_store_ids()). If
+                None, all the installed games are listed.
+            watch: If True, the stores are scanned again in the background when
+                their libraries change. Requires a Qt application.
+        """
+        BasicGame._discovery = StoreDiscovery(
+            BasicGame.STORE_ID_ATTRIBUTES,
+            wanted=wanted,
+            on_index_changed=BasicGame._set_install_index,
+        )
+        BasicGame._set_install_index(BasicGame._discovery.index)
+
+        if watch and QCoreApplication.instance() is not None:
+            BasicGame._refresher = DiscoveryRefresher(BasicGame._discovery)
 
     @staticmethod
-    def setup():
-        from .eadesktop_utils import find_games as find_eadesktop_games
-        from .epic_utils import find_games as find_epic_games
-        from .gog_utils import find_games as find_gog_games
-        from .origin_utils import find_games as find_origin_games
-        from .steam_utils import find_games as find_steam_games
-
-        BasicGame.steam_games = find_steam_games()
-        BasicGame.gog_games = find_gog_games()
-        BasicGame.origin_games = find_origin_games()
-        BasicGame.epic_games = find_epic_games()
-        BasicGame.eadesktop_games = find_eadesktop_games()
+    def _set_install_index(index: GameInstallIndex):
+        # The index is published with a single assignment, so threads calling
+        # detectGame() see either the previous or the new index, never a partial one:
+        BasicGame.install_index = index
+        for store in BasicGame.STORE_ID_ATTRIBUTES:
+            setattr(BasicGame, f"{store}_games", index.games(store))
+
+    @staticmethod
+    def find_game_path(store_ids: Mapping[str, Sequence[str]]) -> Path | None:
+        """
+        Find the installation path of a game from its store IDs.
+
+        The stores in which the game has an ID are scanned on demand, concurrently,
+        and looked up in detection order. Stores in which the game has no ID are
+        never scanned for it.
+
+        Args:
+            store_ids: Mapping from store name (see STORE_ID_ATTRIBUTES) to the IDs
+                of the game in this store.
+
+        Returns:
+            The path of the first installation found, or None if the game is not
+            installed with any of the given stores.
+        """
+        stores = [
+            store for store in BasicGame.STORE_ID_ATTRIBUTES if store_ids.get(store)
+        ]
+
+        # All the stores are scanned concurrently, but looked up in detection order:
+        if BasicGame._discovery is not None:
+            BasicGame._discovery.scan_all(stores)
+        for store in stores:
+            if BasicGame._discovery is not None:
+                BasicGame._discovery.ensure(store)
+            if (
+                path := BasicGame.install_index.find_path({store: store_ids[store]})
+            ) is not None:
+                return path
+        return None
 
     # File containing the plugin:
     _fromName: str
@@ -406,8 +1039,51 @@ class BasicGame(mobase.IPluginGame):
     # Path to the game, as set by MO2:
     _gamePath: str
 
-    # The feature map:
-    _featureMap: dict[type[_GameFeature], _GameFeature]
+    # The feature map, features can be registered as factories (e.g. the feature
+    # class) which are only called on the first access to the features, so that
+    # features are only built for the managed game, see _featureList():
+    _featureMap: dict[type[_GameFeature], _GameFeature | Callable[[], _GameFeature]]
+
+    # Index of the saves, with its folder and patterns, see save_index():
+    _save_index: tuple[tuple[str, tuple[str, ...]], SaveIndex] | None
+
+    # Mappings compiled from the attributes of the class, or the error raised when
+    # compiling them, see mapping_table():
+    _mapping_table: ClassVar[dict[str, CompiledMapping] | None] = None
+    _mapping_error: ClassVar[str | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._compile_mappings()
+
+    @classmethod
+    def _compile_mappings(cls):
+        # Errors are only raised when instantiating the class, since intermediate
+        # classes may not define all the attributes:
+        try:
+            cls._mapping_table = compile_mappings(
+                cls, getattr(cls, "_fromName", cls.__name__)
+            )
+            cls._mapping_error = None
+        except ValueError as e:
+            cls._mapping_table = None
+            cls._mapping_error = str(e)
+
+    @classmethod
+    def mapping_table(cls) -> Mapping[str, CompiledMapping]:
+        """
+        Returns:
+            The mappings compiled from the attributes of the class, see
+            compile_mappings().
+
+        Raises:
+            ValueError: If an attribute of the class is invalid or missing.
+        """
+        if "_mapping_error" not in vars(cls):
+            cls._compile_mappings()
+        if cls._mapping_table is None:
+            raise ValueError(cls._mapping_error)
+        return cls._mapping_table
 
     def __init__(self):
         super(BasicGame, self).__init__()
@@ -417,6 +1093,7 @@ class BasicGame(mobase.IPluginGame):
 
         self._gamePath = ""
         self._featureMap = {}
+        self._save_index = None
 
         self._mappings: BasicGameMappings = BasicGameMappings(self)
 
@@ -436,11 +1113,101 @@ class BasicGame(mobase.IPluginGame):
     def is_eadesktop(self) -> bool:
         return self._mappings.eaDesktopContentId.has_value()
 
+    def scan_saves(self, folder: QDir, *patterns: str) -> list[list[SaveEntry]]:
+        """
+        Find the saves matching several glob patterns in a single traversal of the
+        given folder, down to GameSaveMaxDepth folders.
+
+        Args:
+            folder: The saves folder.
+            patterns: Glob patterns relative to the folder, e.g. "**/*.sav".
+
+        Returns:
+            The entries matching each pattern, in the order of the patterns.
+        """
+        return scan_folder(
+            folder.absolutePath(), patterns, self._mappings.saveMaxDepth.get()
+        )
+
+    def save_index(
+        self,
+        folder: QDir,
+        patterns: Sequence[str],
+        factory: Callable[[int, SaveEntry], mobase.ISaveGame],
+    ) -> SaveIndex:
+        """
+        Retrieve the index of the saves matching the given patterns in the given
+        folder, created on first use. After the first scan, the index only scans the
+        directories that changed, and reuses the saves that did not change.
+
+        A game has a single index: when the folder or the patterns change, e.g. when
+        switching to a profile with local saves, the previous index is closed and
+        replaced.
+
+        Args:
+            folder: The saves folder.
+            patterns: Glob patterns relative to the folder, e.g. "**/*.sav".
+            factory: Function creating a save from the index of the pattern it
+                matched and its entry, only used when creating the index.
+
+        Returns:
+            The index of the saves, see SaveIndex.saves() and SaveIndex.update().
+        """
+        key = (folder.absolutePath(), tuple(patterns))
+        if self._save_index is not None:
+            current_key, index = self._save_index
+            if current_key == key:
+                return index
+            index.close()
+
+        index = SaveIndex(key[0], patterns, factory, self._mappings.saveMaxDepth.get())
+        self._save_index = (key, index)
+        return index
+
+    def store_ids(self) -> dict[str, list[str]]:
+        """
+        Returns:
+            A mapping from store name (see STORE_ID_ATTRIBUTES) to the IDs of the game
+            in this store.
+        """
+        return {
+            "steam": self._mappings.steamAPPId.get(),
+            "gog": self._mappings.gogAPPId.get(),
+            "origin": self._mappings.originManifestIds.get(),
+            "epic": self._mappings.epicAPPId.get(),
+            "eadesktop": self._mappings.eaDesktopContentId.get(),
+        }
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Resolve all the mappings of the game at once.
+
+        Returns:
+            An immutable snapshot of the properties of the game. Each field is read
+            from the public getter of the game (e.g. dataDirectory()) when there is
+            one, so the snapshot matches the values seen by Mod Organizer, and the IDs
+            of all the stores are listed. The getters resolve the mappings against
+            the variable table of the game, so each variable is computed once.
+        """
+        values: dict[str, Any] = {"gamePath": self._gamePath}
+        for mapping in _MAPPINGS:
+            getter = getattr(
+                self, _SNAPSHOT_GETTERS.get(mapping.name, mapping.internal_method), None
+            )
+            if isinstance(mapping, BasicGameOptionsMapping) or not callable(getter):
+                value = self._mappings.get(mapping.name)
+            else:
+                value = getter()
+            values[mapping.name] = _freeze(value)
+        return GameSnapshot(**values)
+
     # IPlugin interface:
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         self._organizer = organizer
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo()
+        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo
+        # the names of the saves may change once their metadata has been loaded:
+        set_metadata_refresh(lambda: organizer.refresh(False))
         if self._mappings.originWatcherExecutables.get():
             from .origin_utils import OriginWatcher
 
@@ -484,30 +1251,9 @@ class BasicGame(mobase.IPluginGame):
     # IPluginGame interface:
 
     def detectGame(self):
-        for steam_id in self._mappings.steamAPPId.get():
-            if steam_id in BasicGame.steam_games:
-                self.setGamePath(BasicGame.steam_games[steam_id])
-                return
-
-        for gog_id in self._mappings.gogAPPId.get():
-            if gog_id in BasicGame.gog_games:
-                self.setGamePath(BasicGame.gog_games[gog_id])
-                return
-
-        for origin_manifest_id in self._mappings.originManifestIds.get():
-            if origin_manifest_id in BasicGame.origin_games:
-                self.setGamePath(BasicGame.origin_games[origin_manifest_id])
-                return
-
-        for epic_id in self._mappings.epicAPPId.get():
-            if epic_id in BasicGame.epic_games:
-                self.setGamePath(BasicGame.epic_games[epic_id])
-                return
-
-        for eadesktop_content_id in self._mappings.eaDesktopContentId.get():
-            if eadesktop_content_id in BasicGame.eadesktop_games:
-                self.setGamePath(BasicGame.eadesktop_games[eadesktop_content_id])
-                return
+        path = BasicGame.find_game_path(self.store_ids())
+        if path is not None:
+            self.setGamePath(path)
 
     def gameName(self) -> str:
         return self._mappings.gameName.get()
@@ -580,10 +1326,11 @@ class BasicGame(mobase.IPluginGame):
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
-        return [
-            BasicGameSaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
-        ]
+        return self.save_index(
+            folder,
+            [f"**/*.{ext}"],
+            lambda _, save: BasicGameSaveGame(save.path, save.stat),
+        ).saves()
 
     def initializeProfile(
         self, directory: QDir, settings: mobase.ProfileSetting
@@ -601,7 +1348,7 @@ class BasicGame(mobase.IPluginGame):
                     ).touch()
 
     def setGameVariant(self, variant: str) -> None:
-        pass
+        self._mappings.invalidate()
 
     def gameVersion(self) -> str:
         return mobase.getFileVersion(
@@ -627,26 +1374,15 @@ class BasicGame(mobase.IPluginGame):
 
     def setGamePath(self, path: Path | str) -> None:
         self._gamePath = str(path)
+        self._mappings.invalidate()
 
-        path = Path(path)
-
-        # Check if we have a matching steam, GOG, Origin or EA Desktop id and set the
-        # index accordingly:
-        for steamid, steampath in BasicGame.steam_games.items():
-            if steampath == path:
-                self._mappings.steamAPPId.set_value(steamid)
-        for gogid, gogpath in BasicGame.gog_games.items():
-            if gogpath == path:
-                self._mappings.steamAPPId.set_value(gogid)
-        for originid, originpath in BasicGame.origin_games.items():
-            if originpath == path:
-                self._mappings.originManifestIds.set_value(originid)
-        for epicid, epicpath in BasicGame.epic_games.items():
-            if epicpath == path:
-                self._mappings.epicAPPId.set_value(epicid)
-        for eadesktopid, eadesktoppath in BasicGame.eadesktop_games.items():
-            if eadesktoppath == path:
-                self._mappings.eaDesktopContentId.set_value(eadesktopid)
+        # Check if we have a matching steam, GOG, Origin, Epic or EA Desktop id and
+        # set the index accordingly:
+        for store, store_id in BasicGame.install_index.find_ids(path):
+            mapping: BasicGameOptionsMapping[str] = getattr(
+                self._mappings, _STORE_MAPPINGS[store]
+            )
+            mapping.set_value(store_id)
 
     def documentsDirectory(self) -> QDir:
         return self._mappings.documentsDirectory.get()
@@ -655,4 +1391,17 @@ class BasicGame(mobase.IPluginGame):
         return self._mappings.savesDirectory.get()
 
     def _featureList(self):
+        for feature, value in list(self._featureMap.items()):
+            if isinstance(value, feature):
+                continue
+            try:
+                self._featureMap[feature] = value()  # type: ignore
+            except Exception as e:
+                print(
+                    "Failed to create feature {} for {}: {}".format(
+                        feature.__name__, self.gameName(), e
+                    ),
+                    file=sys.stderr,
+                )
+                del self._featureMap[feature]
         return self._featureMap
@@ -2,22 +2,131 @@
 
 import configparser
 import os
+import re
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
 
 from .basic_game import BasicGame
+from .cache_utils import file_signature, load_cache, save_cache
+
+# Name and version of the cache of the INI definitions, the version must be bumped
+# whenever the format of the cache changes:
+INI_CACHE_NAME = "ini_games.json"
+INI_CACHE_VERSION = 2
 
 
 class BasicIniGame(BasicGame):
-    def __init__(self, path: str):
-        # Set the _fromName to get more "correct" errors:
-        self._fromName = os.path.basename(path)
 
-        # Read the file:
-        config = configparser.ConfigParser()
-        config.optionxform = str  # type: ignore
-        config.read(path)
+    """
+    Base class of the games defined by INI files, see compile_ini_game().
+    """
+
+
+def read_ini_definitions(path: str) -> list[tuple[str, dict[str, str]]]:
+    """
+    Read the game definitions from an INI file.
+
+    A file without sections defines a single game in its DEFAULT section. A file with
+    sections is a catalog with one game per section, and the values of the DEFAULT
+    section are shared by all the games. Values are interpolated by configparser, so
+    a literal % must be written %%, e.g. %%GAME_PATH%%.
+
+    Args:
+        path: Path to the INI file.
+
+    Returns:
+        A list of (section, values) for each game, the section is empty for a file
+        without sections.
+
+    Raises:
+        configparser.Error: If the file is invalid.
+    """
+    config = configparser.ConfigParser()
+    config.optionxform = str  # type: ignore
+    config.read(path)
+
+    if not config.sections():
+        return [("", dict(config["DEFAULT"]))]
+    return [(section, dict(config[section])) for section in config.sections()]
+
+
+def _from_name(path: str, section: str) -> str:
+    return os.path.basename(path) + (f"[{section}]" if section else "")
+
+
+def compile_ini_game(
+    path: str, section: str, values: dict[str, str]
+) -> type[BasicGame]:
+    """
+    Create the game class for a game definition, see read_ini_definitions().
+
+    Args:
+        path: Path to the INI file.
+        section: Section of the game, empty for a file without sections.
+        values: Values of the game definition.
+
+    Returns:
+        The game class, a subclass of BasicIniGame with one attribute per value.
+
+    Raises:
+        ValueError: If a value is invalid or a required value is missing.
+    """
+    name = re.sub(r"\W", "_", section or Path(path).stem)
+    cls: type[BasicGame] = type(BasicIniGame)(
+        name,
+        (BasicIniGame,),
+        {**values, "_fromName": _from_name(path, section), "__module__": __name__},
+    )
+    cls.mapping_table()
+    return cls
+
+
+def load_ini_games(paths: Iterable[str]) -> list[BasicGame]:
+    """
+    Load the games defined by the given INI files.
+
+    The definitions are cached, keyed by the signature of each file, so that files
+    that did not change are not parsed again. Invalid definitions are reported and
+    skipped.
+
+    Args:
+        paths: Paths to the INI files.
+
+    Returns:
+        The games, one per definition.
+    """
+    cached = load_cache(INI_CACHE_NAME, INI_CACHE_VERSION)
+
+    entries: dict[str, Any] = {}
+    games: list[BasicGame] = []
+    for path in sorted(paths):
+        signature = list(sig) if (sig := file_signature(path)) else None
+
+        entry = cached.get(path)
+        if entry is None or entry["signature"] != signature:
+            try:
+                definitions = read_ini_definitions(path)
+            except configparser.Error as e:
+                print("Failed to read {}: {}".format(path, e), file=sys.stderr)
+                continue
+            entry = {
+                "signature": signature,
+                "games": [[section, values] for section, values in definitions],
+            }
+        entries[path] = entry
+
+        for section, values in entry["games"]:
+            try:
+                games.append(compile_ini_game(path, section, values)())
+            except Exception as e:
+                print(
+                    "Failed to instantiate {}: {}".format(_from_name(path, section), e),
+                    file=sys.stderr,
+                )
 
-        # Just fill the class with values:
-        for k, v in config["DEFAULT"].items():
-            setattr(self, k, v)
+    if entries != cached:
+        save_cache(INI_CACHE_NAME, INI_CACHE_VERSION, entries)
 
-        super().__init__()
+    return games
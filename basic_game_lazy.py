@@ -0,0 +1,316 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Any, Callable
+
+import mobase
+from PyQt6.QtCore import QDir
+from PyQt6.QtGui import QIcon
+
+from .basic_game import BasicGame, ids_apply
+from .plugin_manifest import GameClassInfo
+
+
+class BasicLazyGame(mobase.IPluginGame):
+
+    """
+    Lightweight stand-in for a BasicGame plugin, created from the plugin manifest.
+
+    The cheap methods that MO2 queries for every game plugin (name, game name,
+    detection, ...) are answered from the static attributes recorded in the
+    manifest. The actual plugin is only imported and instantiated when a method
+    that cannot be answered this way is called, after which every call is
+    forwarded to it.
+    """
+
+    # Package, module and class of the actual plugin:
+    _package: str | None
+    _module_name: str
+    _class_name: str
+
+    # Static attributes of the actual plugin:
+    _metadata: dict[str, Any]
+
+    # The actual plugin, once created:
+    _plugin: BasicGame | None
+
+    # State to forward to the actual plugin when created:
+    _organizer: mobase.IOrganizer | None
+    _gamePath: str
+    _gameVariant: str | None
+
+    def __init__(self, package: str | None, module_name: str, info: GameClassInfo):
+        super().__init__()
+        for interface in type(self).__bases__[1:]:
+            interface.__init__(self)
+
+        self._package = package
+        self._module_name = module_name
+        self._class_name = info["name"]
+        self._metadata = info["metadata"]
+
+        self._plugin = None
+        self._organizer = None
+        self._gamePath = ""
+        self._gameVariant = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the proxy, e.g. is_steam():
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._game(), name)
+
+    def _game(self) -> BasicGame:
+        """Return the actual plugin, creating it if needed."""
+        if self._plugin is None:
+            module = importlib.import_module(
+                ".games." + self._module_name, self._package
+            )
+            plugin: BasicGame = getattr(module, self._class_name)()
+            if self._organizer is not None:
+                plugin.init(self._organizer)
+            if self._gameVariant is not None:
+                plugin.setGameVariant(self._gameVariant)
+            if self._gamePath:
+                plugin.setGamePath(self._gamePath)
+            self._plugin = plugin
+        return self._plugin
+
+    def _static(self, name: str, default: Any = None) -> Any:
+        """
+        Return the static value of the given attribute, the given default if the
+        attribute is not defined, or None if the value cannot be used without the
+        actual plugin (not a static value, variables to replace, plugin created).
+        """
+        if self._plugin is not None:
+            return None
+        value = self._metadata.get(name, default)
+        if isinstance(value, str) and "%" in value:
+            return None
+        return value
+
+    # Specific to BasicGame:
+
+    def store_ids(self) -> dict[str, list[str]]:
+        # IDs that are not static (e.g. computed properties) are stored as None in
+        # the manifest, the actual plugin is needed to retrieve them:
+        if self._plugin is not None or any(
+            attribute in self._metadata and self._metadata[attribute] is None
+            for attribute in BasicGame.STORE_ID_ATTRIBUTES.values()
+        ):
+            return self._game().store_ids()
+        return {
+            store: ids_apply(self._metadata.get(attribute) or [])
+            for store, attribute in BasicGame.STORE_ID_ATTRIBUTES.items()
+        }
+
+    # IPlugin interface:
+
+    def init(self, organizer: mobase.IOrganizer) -> bool:
+        self._organizer = organizer
+        if self._plugin is not None:
+            return self._plugin.init(organizer)
+        return True
+
+    def name(self) -> str:
+        if (value := self._static("Name")) is not None:
+            return value
+        return self._game().name()
+
+    def author(self) -> str:
+        if (value := self._static("Author")) is not None:
+            return value
+        return self._game().author()
+
+    def description(self) -> str:
+        if "Description" not in self._metadata and self._plugin is None:
+            return "Adds basic support for game {}.".format(self.gameName())
+        if (value := self._static("Description")) is not None:
+            return value
+        return self._game().description()
+
+    def version(self) -> mobase.VersionInfo:
+        if (value := self._static("Version")) is not None:
+            return mobase.VersionInfo(value)
+        return self._game().version()
+
+    def isActive(self) -> bool:
+        if self._plugin is not None:
+            return self._plugin.isActive()
+        if self._organizer is None or not self._organizer.managedGame():
+            return False
+        return self.name() == self._organizer.managedGame().name()
+
+    def settings(self) -> list[mobase.PluginSetting]:
+        if self._plugin is not None:
+            return self._plugin.settings()
+        return []
+
+    # IPluginGame interface:
+
+    def detectGame(self):
+        if self._plugin is not None:
+            return self._plugin.detectGame()
+
+        path = BasicGame.find_game_path(self.store_ids())
+        if path is not None:
+            self.setGamePath(path)
+
+    def gameName(self) -> str:
+        if (value := self._static("GameName")) is not None:
+            return value
+        return self._game().gameName()
+
+    def gameShortName(self) -> str:
+        if (value := self._static("GameShortName")) is not None:
+            return value
+        return self._game().gameShortName()
+
+    def gameNexusName(self) -> str:
+        if "GameNexusName" not in self._metadata and self._plugin is None:
+            return self.gameShortName()
+        if (value := self._static("GameNexusName")) is not None:
+            return value
+        return self._game().gameNexusName()
+
+    def validShortNames(self) -> list[str]:
+        value = self._static("GameValidShortNames", [])
+        if isinstance(value, str):
+            return [c.strip() for c in value.split(",")]
+        if value is not None:
+            return value
+        return self._game().validShortNames()
+
+    def nexusModOrganizerID(self) -> int:
+        return 0
+
+    def nexusGameID(self) -> int:
+        if (value := self._static("GameNexusId", 0)) is not None:
+            return int(value)
+        return self._game().nexusGameID()
+
+    def binaryName(self) -> str:
+        if (value := self._static("GameBinary")) is not None:
+            return value
+        return self._game().binaryName()
+
+    def getLauncherName(self) -> str:
+        if (value := self._static("GameLauncher", "")) is not None:
+            return value
+        return self._game().getLauncherName()
+
+    def getSupportURL(self) -> str:
+        if (value := self._static("GameSupportURL", "")) is not None:
+            return value
+        return self._game().getSupportURL()
+
+    def gameIcon(self) -> QIcon:
+        if self._plugin is not None:
+            return self._plugin.gameIcon()
+        return mobase.getIconForExecutable(
+            self.gameDirectory().absoluteFilePath(self.binaryName())
+        )
+
+    def looksValid(self, directory: QDir):
+        if self._plugin is not None:
+            return self._plugin.looksValid(directory)
+        return directory.exists(self.binaryName())
+
+    def isInstalled(self) -> bool:
+        if self._plugin is not None:
+            return self._plugin.isInstalled()
+        return bool(self._gamePath)
+
+    def gameDirectory(self) -> QDir:
+        if self._plugin is not None:
+            return self._plugin.gameDirectory()
+        return QDir(self._gamePath)
+
+    def setGamePath(self, path: Path | str) -> None:
+        self._gamePath = str(path)
+        if self._plugin is not None:
+            self._plugin.setGamePath(path)
+
+    def setGameVariant(self, variant: str) -> None:
+        self._gameVariant = variant
+        if self._plugin is not None:
+            self._plugin.setGameVariant(variant)
+
+    # Methods that always require the actual plugin:
+
+    def steamAPPId(self) -> str:
+        return self._game().steamAPPId()
+
+    def gogAPPId(self) -> str:
+        return self._game().gogAPPId()
+
+    def epicAPPId(self) -> str:
+        return self._game().epicAPPId()
+
+    def eaDesktopContentId(self) -> str:
+        return self._game().eaDesktopContentId()
+
+    def iniFiles(self) -> list[str]:
+        return self._game().iniFiles()
+
+    def executables(self) -> list[mobase.ExecutableInfo]:
+        return self._game().executables()
+
+    def executableForcedLoads(self) -> list[mobase.ExecutableForcedLoadSetting]:
+        return self._game().executableForcedLoads()
+
+    def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
+        return self._game().listSaves(folder)
+
+    def initializeProfile(
+        self, directory: QDir, settings: mobase.ProfileSetting
+    ) -> None:
+        return self._game().initializeProfile(directory, settings)
+
+    def gameVersion(self) -> str:
+        return self._game().gameVersion()
+
+    def dataDirectory(self) -> QDir:
+        return self._game().dataDirectory()
+
+    def documentsDirectory(self) -> QDir:
+        return self._game().documentsDirectory()
+
+    def savesDirectory(self) -> QDir:
+        return self._game().savesDirectory()
+
+    def _featureList(self):
+        return self._game()._featureList()  # pyright: ignore[reportPrivateUsage]
+
+
+def _forward(name: str) -> Callable[..., Any]:
+    def method(self: BasicLazyGame, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self._game(), name)(*args, **kwargs)  # pyright: ignore
+
+    method.__name__ = name
+    return method
+
+
+def create_lazy_game(
+    package: str | None, module_name: str, info: GameClassInfo
+) -> BasicLazyGame:
+    """
+    Create a proxy for the given game class from the plugin manifest.
+
+    Args:
+        package: Name of the basic games package.
+        module_name: Name of the module containing the game, relative to the games
+            package.
+        info: Description of the game class from the manifest.
+
+    Returns:
+        A proxy for the game, implementing the same interfaces as the game.
+    """
+    bases = (BasicLazyGame, *(getattr(mobase, name) for name in info["interfaces"]))
+    # init() is always handled by the proxy and replayed on the actual plugin:
+    namespace = {name: _forward(name) for name in info["methods"] if name != "init"}
+    cls = type("Lazy" + info["name"], bases, namespace)
+    return cls(package, module_name, info)
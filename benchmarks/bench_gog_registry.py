@@ -0,0 +1,90 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Measure the discovery of GOG games against a synthetic registry file, so that it
+can be run without Windows.
+
+Usage (from the basic_games folder):
+
+    python benchmarks/bench_gog_registry.py [--count COUNT] [--wanted WANTED]
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from bench_utils import import_module
+
+gog_utils = import_module("gog_utils")
+registry_utils = import_module("registry_utils")
+
+GOG_GAMES_KEY = r"HKEY_LOCAL_MACHINE\Software\Wow6432Node\GOG.com\Games"
+
+
+def write_registry(path: Path, count: int):
+    """
+    Write a synthetic registry file with the given number of GOG games.
+    """
+    subkeys = {
+        str(1000000000 + index): {
+            "values": {
+                "gameID": str(1000000000 + index),
+                "gameName": f"Synthetic Game {index}",
+                "path": f"C:\\GOG Games\\Synthetic Game {index}",
+                "exe": f"C:\\GOG Games\\Synthetic Game {index}\\game.exe",
+            }
+        }
+        for index in range(count)
+    }
+    content = {
+        r"HKEY_CURRENT_USER\Software\Valve\Steam": {},
+        GOG_GAMES_KEY: {"subkeys": subkeys},
+    }
+    path.write_text(json.dumps(content), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=5000, help="number of games")
+    parser.add_argument(
+        "--wanted", type=int, default=50, help="number of games looked for"
+    )
+    args = parser.parse_args()
+
+    wanted = {
+        str(1000000000 + index)
+        for index in random.sample(range(args.count), min(args.wanted, args.count))
+    }
+
+    with tempfile.TemporaryDirectory() as folder:
+        registry_path = Path(folder, "registry.json")
+        write_registry(registry_path, args.count)
+
+        start = time.perf_counter()
+        registry = registry_utils.FileRegistry(registry_path)
+        load_time = time.perf_counter() - start
+
+    registry_utils.set_registry(registry)
+
+    start = time.perf_counter()
+    games = gog_utils.find_games(wanted)
+    first_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    all_games = gog_utils.find_games()
+    cached_time = time.perf_counter() - start
+
+    if len(games) != len(wanted) or len(all_games) != args.count:
+        raise SystemExit("Unexpected number of games found.")
+
+    print(f"{args.count} GOG games, {len(wanted)} wanted:")
+    print(f"  load registry file       {load_time * 1000:8.1f}ms")
+    print(f"  first lookup (snapshot)  {first_time * 1000:8.1f}ms")
+    print(f"  full listing (cached)    {cached_time * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
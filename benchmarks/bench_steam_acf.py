@@ -0,0 +1,131 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Compare the time needed to read the application ID and installation folder from
+Steam application manifests with vdf.load() and with steam_utils.read_acf_values().
+
+Usage (from the basic_games folder):
+
+    python benchmarks/bench_steam_acf.py [--count COUNT] [--depots DEPOTS]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import vdf  # pyright: ignore[reportMissingTypeStubs]
+from bench_utils import import_module
+
+read_acf_values = import_module("steam_utils").read_acf_values
+
+
+def write_manifest(path: Path, appid: int, depots: int):
+    """
+    Write a synthetic application manifest, with the application ID and
+    installation folder in their usual place, between a few scalar values and large
+    depot and configuration blocks.
+    """
+    lines = [
+        '"AppState"',
+        "{",
+        f'\t"appid"\t\t"{appid}"',
+        '\t"Universe"\t\t"1"',
+        f'\t"name"\t\t"Synthetic Game {appid}"',
+        '\t"StateFlags"\t\t"4"',
+        f'\t"installdir"\t\t"Synthetic Game {appid}"',
+        '\t"LastUpdated"\t\t"1690000000"',
+        '\t"SizeOnDisk"\t\t"123456789"',
+        '\t"buildid"\t\t"1234567"',
+        '\t"InstalledDepots"',
+        "\t{",
+    ]
+    for depot in range(depots):
+        lines += [
+            f'\t\t"{appid + depot + 1}"',
+            "\t\t{",
+            f'\t\t\t"manifest"\t\t"{depot * 7919 + 1234567890123456789}"',
+            '\t\t\t"size"\t\t"987654321"',
+            "\t\t}",
+        ]
+    lines += [
+        "\t}",
+        '\t"SharedDepots"',
+        "\t{",
+        '\t\t"228983"\t\t"228980"',
+        "\t}",
+        '\t"UserConfig"',
+        "\t{",
+        '\t\t"language"\t\t"english"',
+        "\t}",
+        '\t"MountedConfig"',
+        "\t{",
+        '\t\t"language"\t\t"english"',
+        "\t}",
+        "}",
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def read_with_vdf(path: Path) -> tuple[str, str]:
+    with open(path, "r", encoding="utf-8") as fp:
+        app_state = vdf.load(fp)["AppState"]  # pyright: ignore
+    return app_state["appid"], app_state["installdir"]  # pyright: ignore
+
+
+def read_with_stream(path: Path) -> tuple[str, str]:
+    with open(path, "r", encoding="utf-8") as fp:
+        app_state = read_acf_values(fp, ("appid", "installdir"))
+    return app_state["appid"], app_state["installdir"]
+
+
+def measure(
+    reader: Callable[[Path], tuple[str, str]], paths: list[Path], repeat: int
+) -> tuple[float, list[tuple[str, str]]]:
+    best = float("inf")
+    results: list[tuple[str, str]] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [reader(path) for path in paths]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=2000, help="number of manifests")
+    parser.add_argument(
+        "--depots", type=int, default=20, help="number of depots per manifest"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        paths = [
+            Path(folder, f"appmanifest_{appid}.acf")
+            for appid in range(10, 10 * (args.count + 1), 10)
+        ]
+        for path in paths:
+            write_manifest(
+                path, int(path.stem.removeprefix("appmanifest_")), args.depots
+            )
+
+        vdf_time, vdf_results = measure(read_with_vdf, paths, args.repeat)
+        stream_time, stream_results = measure(read_with_stream, paths, args.repeat)
+
+    if vdf_results != stream_results:
+        sys.exit("Results of vdf.load() and read_acf_values() differ.")
+
+    print(f"{args.count} manifests, {args.depots} depots each, best of {args.repeat}:")
+    for name, elapsed in (("vdf.load", vdf_time), ("read_acf_values", stream_time)):
+        print(
+            f"  {name:<16} {elapsed * 1000:8.1f}ms"
+            f" ({elapsed / args.count * 1e6:6.1f}us per manifest)"
+        )
+    print(f"  speedup          {vdf_time / stream_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
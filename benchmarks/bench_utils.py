@@ -0,0 +1,33 @@
+# -*- encoding: utf-8 -*-
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+def import_module(name: str) -> ModuleType:
+    """
+    Import a module of the basic games package without MO2.
+
+    The package is registered without running its __init__.py, which requires
+    mobase, so that modules that do not depend on mobase (store utilities, ...) can
+    be imported.
+
+    Args:
+        name: Name of the module, relative to the package, e.g. "steam_utils".
+
+    Returns:
+        The imported module.
+    """
+    root = Path(__file__).parent.parent
+    package = root.name
+    if package not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            package,
+            root.joinpath("__init__.py"),
+            submodule_search_locations=[str(root)],
+        )
+        assert spec is not None
+        sys.modules[package] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"{package}.{name}")
@@ -0,0 +1,364 @@
+# -*- encoding: utf-8 -*-
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from PyQt6.QtCore import QStandardPaths
+
+FileSignature = tuple[int, int]
+
+
+def cache_directory() -> Path:
+    """
+    Retrieve the directory where basic games stores its caches.
+
+    Returns:
+        The cache directory. The directory is not created by this function.
+    """
+    location = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation
+    )
+    if not location:
+        return Path(__file__).parent.joinpath(".cache")
+    return Path(location).joinpath("basic_games")
+
+
+def file_signature(path: Path | str) -> FileSignature | None:
+    """
+    Compute a cheap signature of a file or directory, suitable to check if it
+    changed since the signature was taken.
+
+    Args:
+        path: Path to the file or directory.
+
+    Returns:
+        A (modification time in nanoseconds, size) tuple, or None if the path does
+        not exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_cache(name: str, version: int) -> dict[str, Any]:
+    """
+    Load a JSON cache from the cache directory.
+
+    Args:
+        name: Name of the cache file.
+        version: Expected version of the cache. Caches written with a different
+            version are discarded.
+
+    Returns:
+        The cached data, or an empty dictionary if the cache does not exist, is
+        invalid or has an unexpected version.
+    """
+    try:
+        with open(cache_directory().joinpath(name), "r", encoding="utf-8") as fp:
+            content = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(content, dict) or content.get("version") != version:
+        return {}
+
+    data = content.get("data")  # pyright: ignore[reportUnknownMemberType]
+    return data if isinstance(data, dict) else {}  # pyright: ignore
+
+
+def save_cache(name: str, version: int, data: dict[str, Any]) -> None:
+    """
+    Save a JSON cache in the cache directory. The file is written atomically so
+    that a concurrent reader never sees a partially written cache.
+
+    Args:
+        name: Name of the cache file.
+        version: Version of the cache.
+        data: Data to store, must be serializable to JSON.
+    """
+    path = cache_directory().joinpath(name)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump({"version": version, "data": data}, fp)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f'Failed to write cache "{path}": {e}', file=sys.stderr)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+# Name and version of the persistent cache of save metadata, the version must be
+# bumped whenever the schema changes (the content of the metadata is versioned by
+# each parser):
+METADATA_CACHE_NAME = "save_metadata.sqlite"
+METADATA_CACHE_VERSION = 1
+
+# Maximum number of entries in the metadata cache, the least recently used entries
+# beyond this are evicted when the cache is opened and periodically afterwards:
+METADATA_CACHE_MAX_ENTRIES = 20000
+
+# Entries used within this delay (in seconds) are not marked as used again, to
+# avoid a write for every read:
+_METADATA_TOUCH_DELAY = 3600
+
+# Number of insertions between two evictions of the least recently used entries:
+_METADATA_EVICT_INTERVAL = 256
+
+
+def _is_corruption(error: Exception) -> bool:
+    # corrupted or non-database files raise DatabaseError itself, while transient
+    # errors (locked database, I/O errors, ...) raise an OperationalError:
+    return isinstance(error, sqlite3.DatabaseError) and not isinstance(
+        error, sqlite3.OperationalError
+    )
+
+
+class MetadataCache:
+
+    """
+    Persistent cache of the metadata of saves, stored in a SQLite database.
+
+    Entries are keyed by the path of the save, its signature (modification time
+    and size) and the parser that read it, so an entry is only used while both the
+    file and the parser are unchanged. A corrupted database is recreated, and the
+    cache is disabled for the session if the database cannot be used.
+    """
+
+    def __init__(
+        self, path: Path | str | None, max_entries: int = METADATA_CACHE_MAX_ENTRIES
+    ):
+        """
+        Args:
+            path: Path to the database, or None for an in-memory database.
+            max_entries (optional): Maximum number of entries to keep.
+        """
+        self._path = None if path is None else Path(path)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._opened = False
+        self._insertions = 0
+
+    def _open(self) -> sqlite3.Connection:
+        if self._path is None:
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+        try:
+            if self._path is not None:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != METADATA_CACHE_VERSION:
+                with connection:
+                    connection.execute("DROP TABLE IF EXISTS metadata")
+                    connection.execute(
+                        "CREATE TABLE metadata ("
+                        " path TEXT NOT NULL,"
+                        " parser TEXT NOT NULL,"
+                        " mtime_ns INTEGER NOT NULL,"
+                        " size INTEGER NOT NULL,"
+                        " data TEXT NOT NULL,"
+                        " used INTEGER NOT NULL,"
+                        " PRIMARY KEY (path, parser))"
+                    )
+                    connection.execute("CREATE INDEX metadata_used ON metadata (used)")
+                    connection.execute(f"PRAGMA user_version={METADATA_CACHE_VERSION}")
+            self._evict(connection)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        with connection:
+            connection.execute(
+                "DELETE FROM metadata WHERE rowid IN ("
+                " SELECT rowid FROM metadata ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def _remove_database(self) -> None:
+        if self._path is None:
+            return
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                self._path.with_name(self._path.name + suffix).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _database(self) -> sqlite3.Connection | None:
+        """
+        Open the database on first use, recreating it if corrupted. Must be called
+        with the lock held.
+        """
+        if self._opened:
+            return self._connection
+        self._opened = True
+
+        try:
+            self._connection = self._open()
+        except (sqlite3.Error, OSError) as e:
+            print(
+                f'Failed to open the metadata cache "{self._path}": {e}',
+                file=sys.stderr,
+            )
+            if _is_corruption(e):
+                try:
+                    self._remove_database()
+                    self._connection = self._open()
+                except (sqlite3.Error, OSError) as e:
+                    print(
+                        f'Failed to recreate the metadata cache "{self._path}": {e}',
+                        file=sys.stderr,
+                    )
+        return self._connection
+
+    def _fail(self, error: sqlite3.Error) -> None:
+        """
+        Handle an error while using the database: a corrupted database is removed
+        and recreated on next use, otherwise the cache is disabled for the session.
+        Must be called with the lock held.
+        """
+        print(f'Error in the metadata cache "{self._path}": {error}', file=sys.stderr)
+        self._close()
+        if _is_corruption(error):
+            try:
+                self._remove_database()
+            except OSError:
+                return
+            self._opened = False
+
+    def get(
+        self, path: str, signature: FileSignature, parser: str
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve cached metadata.
+
+        Args:
+            path: Path of the save.
+            signature: Current signature of the save, see file_signature().
+            parser: Name and version of the parser of the metadata.
+
+        Returns:
+            The metadata, or None if there is no entry for this version of the save
+            and parser.
+        """
+        with self._lock:
+            connection = self._database()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT data, used FROM metadata"
+                    " WHERE path = ? AND parser = ? AND mtime_ns = ? AND size = ?",
+                    (path, parser, *signature),
+                ).fetchone()
+                if row is None:
+                    return None
+                now = time.time_ns()
+                if row[1] < now - _METADATA_TOUCH_DELAY * 1_000_000_000:
+                    with connection:
+                        connection.execute(
+                            "UPDATE metadata SET used = ?"
+                            " WHERE path = ? AND parser = ?",
+                            (now, path, parser),
+                        )
+            except sqlite3.Error as e:
+                self._fail(e)
+                return None
+
+        try:
+            data = json.loads(row[0])
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None  # pyright: ignore
+
+    def put(
+        self,
+        path: str,
+        signature: FileSignature,
+        parser: str,
+        metadata: Mapping[str, Any],
+    ) -> None:
+        """
+        Store metadata in the cache, replacing the entry of a previous version of
+        the save.
+
+        Args:
+            path: Path of the save.
+            signature: Signature of the save when the metadata was read.
+            parser: Name and version of the parser of the metadata.
+            metadata: The metadata, metadata that is not serializable to JSON is not
+                cached.
+        """
+        try:
+            data = json.dumps(metadata)
+        except (TypeError, ValueError):
+            return
+
+        with self._lock:
+            connection = self._database()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?)",
+                        (path, parser, *signature, data, time.time_ns()),
+                    )
+                self._insertions += 1
+                if self._insertions % _METADATA_EVICT_INTERVAL == 0:
+                    self._evict(connection)
+            except sqlite3.Error as e:
+                self._fail(e)
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:
+                pass
+            self._connection = None
+
+    def close(self) -> None:
+        """
+        Close the database, it is reopened on next use.
+        """
+        with self._lock:
+            self._close()
+            self._opened = False
+
+
+_metadata_cache: MetadataCache | None = None
+_metadata_cache_lock = threading.Lock()
+
+
+def metadata_cache() -> MetadataCache:
+    """
+    Retrieve the metadata cache of the session, see MetadataCache.
+
+    Returns:
+        The metadata cache, stored in the cache directory.
+    """
+    global _metadata_cache
+    with _metadata_cache_lock:
+        if _metadata_cache is None:
+            _metadata_cache = MetadataCache(
+                cache_directory().joinpath(METADATA_CACHE_NAME)
+            )
+        return _metadata_cache
@@ -0,0 +1,650 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import Any
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from .cache_utils import file_signature, load_cache, save_cache
+from .registry_utils import refresh_registry
+
+# Name and version of the discovery cache, the version must be bumped whenever the
+# format of the cache or the behavior of a scanner changes:
+DISCOVERY_CACHE_NAME = "store_discovery.json"
+DISCOVERY_CACHE_VERSION = 5
+
+# Default timeout, in seconds, for the discovery of the games of a single store:
+DEFAULT_TIMEOUT = 10.0
+
+# Environment variable enabling a report (wall time, number of games) of each scan on
+# the standard error, e.g. for benchmarks:
+DISCOVERY_REPORT_ENVIRON = "BASIC_GAMES_DISCOVERY_REPORT"
+
+# Lock protecting the read-modify-write of the discovery cache from scanning threads:
+_cache_lock = threading.Lock()
+
+# Delay, in milliseconds, between the last change of the sources of a store and the
+# refresh of its games:
+REFRESH_DELAY_MS = 2000
+
+# Module containing the find_games() function of each store. Modules can also provide
+# a find_sources() function returning the files and folders whose modification
+# invalidates the games found, in which case the result of the scan is cached:
+STORE_MODULES = {
+    "steam": "steam_utils",
+    "gog": "gog_utils",
+    "origin": "origin_utils",
+    "epic": "epic_utils",
+    "eadesktop": "eadesktop_utils",
+}
+
+
+@dataclass(frozen=True)
+class StoreScanResult:
+    # Name of the store:
+    store: str
+
+    # Games found, empty if the scan failed or timed out:
+    games: dict[str, Path] = field(default_factory=dict)
+
+    # Wall time of the scan, in seconds:
+    elapsed: float = 0.0
+
+    # Error raised by the scan, if any:
+    error: Exception | None = None
+
+    # True if the scan did not complete in time:
+    timed_out: bool = False
+
+    # True if the games were retrieved from the cache:
+    cached: bool = False
+
+    # Signatures of the sources of the scan, None if the scan cannot be cached:
+    sources: dict[str, list[int] | None] | None = None
+
+    # IDs the scan was restricted to, None if all the games were listed:
+    wanted: frozenset[str] | None = None
+
+
+class GameInstallIndex:
+    """
+    Immutable index of the games installed with each store, built once after the
+    discovery of the games.
+
+    The index supports looking up the installation path of a game from its store
+    IDs and, conversely, the store IDs of a game from its installation path.
+    """
+
+    __slots__ = ("_games", "_paths")
+
+    _games: Mapping[str, Mapping[str, Path]]
+    _paths: Mapping[str, tuple[tuple[str, str], ...]]
+
+    def __init__(self, games: Mapping[str, Mapping[str, Path]] | None = None):
+        """
+        Args:
+            games: Mapping from store name to the games installed with this store,
+                as mappings from store ID to installation path. The order of the
+                stores is the detection order.
+        """
+        if games is None:
+            games = {}
+
+        paths: dict[str, list[tuple[str, str]]] = {}
+        for store, store_games in games.items():
+            for store_id, path in store_games.items():
+                paths.setdefault(self.normalize_path(path), []).append(
+                    (store, store_id)
+                )
+
+        object.__setattr__(
+            self,
+            "_games",
+            MappingProxyType(
+                {store: MappingProxyType(dict(g)) for store, g in games.items()}
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_paths",
+            MappingProxyType({path: tuple(ids) for path, ids in paths.items()}),
+        )
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @staticmethod
+    def normalize_path(path: Path | str) -> str:
+        """
+        Normalize a path for lookups, i.e. remove redundant separators and, on
+        case-insensitive platforms, the case.
+        """
+        return os.path.normcase(os.path.normpath(path))
+
+    def games(self, store: str) -> Mapping[str, Path]:
+        """
+        Args:
+            store: Name of the store.
+
+        Returns:
+            A read-only mapping from store ID to installation path of the games
+            installed with the given store.
+        """
+        return self._games.get(store, MappingProxyType({}))
+
+    def with_games(self, store: str, games: Mapping[str, Path]) -> GameInstallIndex:
+        """
+        Args:
+            store: Name of the store.
+            games: New games of the store.
+
+        Returns:
+            A new index with the games of the given store replaced.
+        """
+        return GameInstallIndex({**self._games, store: games})
+
+    def find_path(self, store_ids: Mapping[str, Sequence[str]]) -> Path | None:
+        """
+        Find the installation path of a game from its store IDs.
+
+        Args:
+            store_ids: Mapping from store name to the IDs of the game in this
+                store.
+
+        Returns:
+            The path of the first installation found, following the detection
+            order of the stores, or None if the game is not installed with any of
+            the given stores.
+        """
+        for store, games in self._games.items():
+            for store_id in store_ids.get(store, ()):
+                if store_id in games:
+                    return games[store_id]
+        return None
+
+    def find_ids(self, path: Path | str) -> tuple[tuple[str, str], ...]:
+        """
+        Find the store IDs of the game installed at the given path.
+
+        Args:
+            path: Installation path of the game.
+
+        Returns:
+            The (store name, store ID) pairs of the games installed at the given
+            path, in detection order, usually zero or one pair.
+        """
+        return self._paths.get(self.normalize_path(path), ())
+
+
+def _signatures(paths: Iterable[Path | str]) -> dict[str, list[int] | None]:
+    return {
+        str(path): list(signature) if (signature := file_signature(path)) else None
+        for path in paths
+    }
+
+
+def _cached_games(entry: Any, wanted: frozenset[str] | None) -> dict[str, Path] | None:
+    """
+    Retrieve the games from a cache entry, if the sources of the entry did not
+    change since it was created and the entry covers the wanted IDs.
+    """
+    if not isinstance(entry, dict):
+        return None
+
+    cached_wanted: list[str] | None = entry.get("wanted")  # type: ignore
+    if cached_wanted is not None and (
+        wanted is None or not wanted.issubset(cached_wanted)
+    ):
+        return None
+
+    sources: dict[str, list[int] | None] = entry.get("sources")  # type: ignore
+    if not sources or _signatures(sources) != sources:
+        return None
+
+    games: dict[str, str] = entry["games"]  # type: ignore
+    return {k: Path(v) for k, v in games.items() if wanted is None or k in wanted}
+
+
+def _scan_store(
+    store: str, module: ModuleType, wanted: frozenset[str] | None, cache_entry: Any
+) -> StoreScanResult:
+    start = time.perf_counter()
+    try:
+        games = _cached_games(cache_entry, wanted)
+        if games is not None:
+            return StoreScanResult(
+                store,
+                games,
+                elapsed=time.perf_counter() - start,
+                cached=True,
+                sources=cache_entry["sources"],
+                wanted=wanted,
+            )
+
+        # The sources must be stat-ed before the scan so that a modification during
+        # the scan invalidates the cache:
+        sources = None
+        if hasattr(module, "find_sources"):
+            sources = _signatures(module.find_sources())
+
+        games = module.find_games(wanted)
+    except Exception as e:
+        return StoreScanResult(store, elapsed=time.perf_counter() - start, error=e)
+    return StoreScanResult(
+        store,
+        games,
+        elapsed=time.perf_counter() - start,
+        sources=sources,
+        wanted=wanted,
+    )
+
+
+def _start_scan(
+    store: str,
+    wanted: frozenset[str] | None,
+    cache_entry: Any,
+    on_result: Callable[[StoreScanResult], None],
+) -> Future[StoreScanResult]:
+    """
+    Start the scan of a store in its own thread.
+
+    The given function is called with the result of the scan before the returned
+    future completes, so that waiters on the future see its effects.
+    """
+    future: Future[StoreScanResult] = Future()
+
+    def complete(result: StoreScanResult):
+        try:
+            on_result(result)
+        finally:
+            future.set_result(result)
+
+    # No game declares an ID for this store:
+    if wanted is not None and not wanted:
+        complete(StoreScanResult(store, wanted=wanted))
+        return future
+
+    # The module is imported by the calling thread, importing from the scanning
+    # threads could dead-lock if the calling thread is itself importing:
+    try:
+        module = importlib.import_module("." + STORE_MODULES[store], __package__)
+    except Exception as e:
+        complete(StoreScanResult(store, error=e))
+        return future
+
+    def run():
+        complete(_scan_store(store, module, wanted, cache_entry))
+
+    # Daemon threads are used so that a scan stuck on an unresponsive drive does not
+    # prevent MO2 from exiting:
+    threading.Thread(
+        target=run, name=f"basic_games-discovery-{store}", daemon=True
+    ).start()
+
+    return future
+
+
+def _update_cache(cache: dict[str, Any], results: Iterable[StoreScanResult]) -> bool:
+    """
+    Store the given scan results in the given cache, returns True if the cache was
+    modified.
+    """
+    updated = False
+    for result in results:
+        if result.sources is not None and not result.cached:
+            cache[result.store] = {
+                "sources": result.sources,
+                "wanted": None if result.wanted is None else sorted(result.wanted),
+                "games": {k: str(v) for k, v in result.games.items()},
+            }
+            updated = True
+    return updated
+
+
+class StoreDiscovery:
+    """
+    Lazy discovery of the games installed with each store.
+
+    A store is only scanned the first time its games are needed (see ensure()),
+    the result of the scan is memoised. Each scan result replaces the games of
+    its store in the index of the discovery, which is published as a new
+    immutable GameInstallIndex, so readers on other threads never see a partially
+    updated index.
+    """
+
+    def __init__(
+        self,
+        stores: Iterable[str] | None = None,
+        wanted: Mapping[str, Collection[str]] | None = None,
+        timeouts: Mapping[str, float] | None = None,
+        on_index_changed: Callable[[GameInstallIndex], None] | None = None,
+    ):
+        """
+        Args:
+            stores: Names of the stores (see STORE_MODULES), all stores by default.
+                The order of the stores is the detection order.
+            wanted: IDs to look for in specific stores (see collect_store_ids()).
+                The scan of these stores is restricted to these IDs and stores with
+                no wanted IDs are not scanned. Stores not in this mapping are fully
+                scanned.
+            timeouts: Time in seconds ensure() waits for specific stores, stores not
+                in this mapping use DEFAULT_TIMEOUT.
+            on_index_changed: Function called with the new index each time the
+                index changes, from the thread that changed it.
+        """
+        if stores is None:
+            stores = STORE_MODULES
+        self._stores = list(stores)
+
+        self._wanted: dict[str, frozenset[str] | None] = {
+            store: frozenset(wanted[store])
+            if wanted is not None and store in wanted
+            else None
+            for store in self._stores
+        }
+        self._timeouts = timeouts or {}
+        self._on_index_changed = on_index_changed
+
+        # Scan of each store, once started, and callbacks to call on each scan. The
+        # lock is re-entrant since scans that complete immediately are published
+        # while it is held:
+        self._lock = threading.RLock()
+        self._futures: dict[str, Future[StoreScanResult]] = {}
+        self._listeners: list[Callable[[StoreScanResult], None]] = []
+
+        self._index_lock = threading.Lock()
+        self._index = GameInstallIndex({store: {} for store in self._stores})
+
+    @property
+    def index(self) -> GameInstallIndex:
+        """The current index of the games found."""
+        return self._index
+
+    def wanted(self, store: str) -> frozenset[str] | None:
+        """
+        Returns:
+            The IDs looked for in the given store, or None if all the games of the
+            store are listed.
+        """
+        return self._wanted.get(store)
+
+    def add_listener(self, listener: Callable[[StoreScanResult], None]):
+        """
+        Add a function called with the result of each scan, from the scanning thread.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def scan(self, store: str) -> Future[StoreScanResult]:
+        """
+        Start the scan of the given store if it was not started yet.
+
+        Args:
+            store: Name of the store.
+
+        Returns:
+            The memoised scan of the store.
+        """
+        with self._lock:
+            future = self._futures.get(store)
+            if future is not None:
+                return future
+
+            cache = load_cache(DISCOVERY_CACHE_NAME, DISCOVERY_CACHE_VERSION)
+            future = _start_scan(
+                store, self._wanted.get(store), cache.get(store), self._scanned
+            )
+            self._futures[store] = future
+        return future
+
+    def scan_all(self, stores: Iterable[str]) -> None:
+        """
+        Start the scans of the given stores that were not started yet, so that they
+        run concurrently, see scan().
+
+        Args:
+            stores: Names of the stores.
+        """
+        for store in stores:
+            self.scan(store)
+
+    def refresh(self, store: str) -> Future[StoreScanResult]:
+        """
+        Scan the given store again, ignoring the cache and the registry keys read
+        so far. The games of the store are replaced in the index when the scan
+        completes successfully.
+
+        Args:
+            store: Name of the store.
+
+        Returns:
+            The new scan of the store.
+        """
+        refresh_registry()
+        with self._lock:
+            future = _start_scan(store, self._wanted.get(store), None, self._scanned)
+            self._futures[store] = future
+        return future
+
+    def ensure(self, store: str) -> StoreScanResult:
+        """
+        Scan the given store if needed and wait for the scan to complete.
+
+        A scan that does not complete in time keeps running in the background and
+        its games are added to the index when it completes.
+
+        Args:
+            store: Name of the store.
+
+        Returns:
+            The result of the scan, or a result with no games and timed_out set if
+            the scan did not complete in time.
+        """
+        future = self.scan(store)
+        timeout = self._timeouts.get(store, DEFAULT_TIMEOUT)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            print(
+                f"Discovery of {store} games timed out after {timeout:.1f}s.",
+                file=sys.stderr,
+            )
+            result = StoreScanResult(
+                store, elapsed=timeout, timed_out=True, wanted=self._wanted.get(store)
+            )
+            _report(result)
+            return result
+
+    def _scanned(self, result: StoreScanResult):
+        if result.error is not None:
+            # The previous games of the store are kept:
+            print(
+                f"Failed to discover {result.store} games: {result.error!r}",
+                file=sys.stderr,
+            )
+        else:
+            with self._index_lock:
+                self._index = self._index.with_games(result.store, result.games)
+                if self._on_index_changed is not None:
+                    self._on_index_changed(self._index)
+
+            with _cache_lock:
+                cache = load_cache(DISCOVERY_CACHE_NAME, DISCOVERY_CACHE_VERSION)
+                if _update_cache(cache, (result,)):
+                    save_cache(DISCOVERY_CACHE_NAME, DISCOVERY_CACHE_VERSION, cache)
+
+        _report(result)
+
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(result)
+
+
+class DiscoveryRefresher(QObject):
+    """
+    Watch the sources of the scanned stores (Steam libraries, Epic manifests, Origin
+    LocalContent, ...) and scan a store again, in the background, when its sources
+    change.
+
+    Stores are watched once they have been scanned by the discovery. Only the store
+    whose sources changed is scanned again, with the same wanted IDs.
+    """
+
+    _scanned = pyqtSignal(StoreScanResult)
+
+    def __init__(self, discovery: StoreDiscovery, parent: QObject | None = None):
+        """
+        Args:
+            discovery: The discovery to refresh.
+            parent: Parent of the refresher.
+        """
+        super().__init__(parent)
+
+        self._discovery = discovery
+
+        # Watched paths, and store of each path:
+        self._stores: dict[str, str] = {}
+
+        # Stores being refreshed, and stores that changed during their refresh:
+        self._scanning: set[str] = set()
+        self._pending: set[str] = set()
+
+        self._timers: dict[str, QTimer] = {}
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._scanned.connect(self._on_scanned)
+
+        discovery.add_listener(self._emit_scanned)
+
+    def _watch(self, result: StoreScanResult):
+        if result.sources is None:
+            return
+
+        # Paths that do not exist cannot be watched, they are watched again when the
+        # store is refreshed (e.g. a new library):
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        paths = [
+            path
+            for path in result.sources
+            if path not in watched and os.path.exists(path)
+        ]
+        for path in paths:
+            self._stores[path] = result.store
+        if paths:
+            self._watcher.addPaths(paths)
+
+    def _on_path_changed(self, path: str):
+        store = self._stores.get(path)
+        if store is None:
+            return
+
+        # A game being installed or updated modifies its sources many times, so
+        # the refresh is delayed until the sources are stable:
+        timer = self._timers.get(store)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(REFRESH_DELAY_MS)
+            timer.timeout.connect(lambda: self.refresh(store))
+            self._timers[store] = timer
+        timer.start()
+
+    def refresh(self, store: str):
+        """
+        Scan the given store again in the background.
+
+        Args:
+            store: Name of the store.
+        """
+        if store in self._scanning:
+            self._pending.add(store)
+            return
+
+        self._scanning.add(store)
+        self._discovery.refresh(store)
+
+    def _emit_scanned(self, result: StoreScanResult):
+        # Called from the scanning thread, the signal is queued to the thread of the
+        # refresher, which may have been deleted if MO2 is exiting:
+        try:
+            self._scanned.emit(result)
+        except RuntimeError:
+            pass
+
+    def _on_scanned(self, result: StoreScanResult):
+        self._scanning.discard(result.store)
+
+        if result.error is None:
+            self._watch(result)
+
+        if result.store in self._pending:
+            self._pending.discard(result.store)
+            self.refresh(result.store)
+
+
+def collect_store_ids(
+    store_ids: Iterable[Mapping[str, Iterable[str]]]
+) -> dict[str, set[str]]:
+    """
+    Compute the union of the IDs declared by game plugins for each store.
+
+    Args:
+        store_ids: The IDs declared by each game plugin, as mappings from store name
+            to IDs (see BasicGame.store_ids()).
+
+    Returns:
+        A mapping from store name to the IDs declared for this store by at least
+        one plugin, suitable for the wanted argument of StoreDiscovery. Every
+        store in STORE_MODULES is present in the mapping.
+    """
+    wanted: dict[str, set[str]] = {store: set() for store in STORE_MODULES}
+    for ids in store_ids:
+        for store, values in ids.items():
+            wanted.setdefault(store, set()).update(values)
+    return wanted
+
+
+def _report(result: StoreScanResult):
+    # Scans restricted to no ID are not reported since they do not scan anything:
+    if os.environ.get(DISCOVERY_REPORT_ENVIRON) and (
+        result.wanted is None or result.wanted
+    ):
+        print(format_report({result.store: result}), file=sys.stderr)
+
+
+def format_report(results: Mapping[str, StoreScanResult]) -> str:
+    """
+    Format the wall time and number of games found of the given scan results.
+
+    Args:
+        results: Results of scans, by store.
+
+    Returns:
+        A one-line summary of the discovery.
+    """
+    parts: list[str] = []
+    for store, result in results.items():
+        if result.timed_out:
+            status = "timed out"
+        elif result.error is not None:
+            status = "failed"
+        else:
+            status = f"{len(result.games)} games"
+            if result.cached:
+                status += " (cached)"
+        parts.append(f"{store}: {status} in {result.elapsed * 1000:.0f}ms")
+    return "Store discovery: " + ", ".join(parts)
@@ -2,34 +2,48 @@
 
 import configparser
 import os
+import sys
 import xml.etree.ElementTree as et
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from configparser import NoOptionError
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List
 
+from .cache_utils import file_signature, load_cache, save_cache
+
+# Maximum number of game folders probed concurrently:
+PROBE_MAX_WORKERS = 8
+
+# Name and version of the cache of the content IDs of the game folders:
+INSTALLER_CACHE_NAME = "eadesktop_installers.json"
+INSTALLER_CACHE_VERSION = 1
 
-def find_games() -> Dict[str, Path]:
-    """
-    Find the list of EA Desktop games installed.
 
+def find_settings_path() -> Path:
+    """
     Returns:
-        A mapping from EA Desktop content IDs to install locations for available
-        EA Desktop games.
+        The path to the EA Desktop settings folder.
     """
-    games: Dict[str, Path] = {}
-
     local_app_data_path = os.path.expandvars("%LocalAppData%")
-    ea_desktop_settings_path = Path(local_app_data_path).joinpath(
-        "Electronic Arts", "EA Desktop"
-    )
+    return Path(local_app_data_path).joinpath("Electronic Arts", "EA Desktop")
+
+
+def find_install_path() -> Path | None:
+    """
+    Returns:
+        The path to the folder where EA Desktop installs games, or None if EA Desktop
+        is not installed.
+    """
+    ea_desktop_settings_path = find_settings_path()
 
     if not ea_desktop_settings_path.exists():
-        return games
+        return None
 
     try:
         user_ini, *_ = list(ea_desktop_settings_path.glob("user_*.ini"))
     except ValueError:
-        return games
+        return None
 
     # The INI file in its current form has no section headers.
     # So we wrangle the input to add it all under a fake section.
@@ -45,25 +59,131 @@ def find_games() -> Dict[str, Path]:
         install_path = Path(os.environ["ProgramW6432"]) / "EA Games"
         config.set("mod_organizer", "user.downloadinplacedir", install_path.__str__())
 
-    if not install_path.exists():
+    return install_path
+
+
+def find_sources() -> List[Path]:
+    """
+    Find the files and folders the list of EA Desktop games is read from.
+
+    Returns:
+        The EA Desktop settings folder and user settings, the install folder and
+        the installer data file of each game.
+    """
+    ea_desktop_settings_path = find_settings_path()
+
+    sources = [ea_desktop_settings_path]
+    sources.extend(ea_desktop_settings_path.glob("user_*.ini"))
+
+    install_path = find_install_path()
+    if install_path is not None and install_path.exists():
+        sources.append(install_path)
+        sources.extend(
+            game_dir.joinpath("__Installer", "installerdata.xml")
+            for game_dir in install_path.iterdir()
+        )
+
+    return sources
+
+
+def read_content_id(installer_file: Path) -> str | None:
+    """
+    Read the numeric content ID of a game from its installer data file.
+
+    The file is parsed incrementally and only until the first content ID is found,
+    parsed elements are freed as they are read.
+
+    Args:
+        installer_file: The installerdata.xml file of the game.
+
+    Returns:
+        The first numeric content ID of the game, or None if the file contains none.
+    """
+    # For all manifest files the first contentIDs/contentID element contains the
+    # numeric ID. There are, in some cases, also name IDs but we do not consider
+    # these.
+    content_ids_depth = 0
+    with open(installer_file, "rb") as fp:
+        for event, element in et.iterparse(fp, events=("start", "end")):
+            if element.tag == "contentIDs":
+                content_ids_depth += 1 if event == "start" else -1
+            elif event == "end":
+                if element.tag == "contentID" and content_ids_depth and element.text:
+                    return element.text
+                element.clear()
+    return None
+
+
+def _probe_game_dir(game_dir: Path, cached: Any) -> Dict[str, Any] | None:
+    """
+    Read the content ID of the game in the given folder, or reuse the cached one if
+    the installer data file did not change.
+    """
+    installer_file = game_dir.joinpath("__Installer", "installerdata.xml")
+    signature = file_signature(installer_file)
+    if signature is None:
+        return None
+
+    if isinstance(cached, dict) and cached.get("signature") == list(signature):
+        return cached  # pyright: ignore[reportUnknownVariableType]
+
+    try:
+        content_id = read_content_id(installer_file)
+    except (OSError, et.ParseError) as e:
+        print(f'Unable to parse "{installer_file}": {e}', file=sys.stderr)
+        return None
+    return {"signature": list(signature), "content_id": content_id}
+
+
+def find_games(wanted: Collection[str] | None = None) -> Dict[str, Path]:
+    """
+    Find the list of EA Desktop games installed.
+
+    The game folders are probed in parallel, and the content ID of each folder is
+    cached until its installer data file changes.
+
+    Args:
+        wanted: If not None, only look for these EA Desktop content IDs.
+
+    Returns:
+        A mapping from EA Desktop content IDs to install locations for available
+        EA Desktop games.
+    """
+    games: Dict[str, Path] = {}
+
+    install_path = find_install_path()
+    if install_path is None or not install_path.exists():
+        return games
+
+    game_dirs = [path for path in install_path.iterdir() if path.is_dir()]
+    if not game_dirs:
         return games
 
-    for game_dir in install_path.iterdir():
-        try:
-            installer_file = game_dir.joinpath("__Installer", "installerdata.xml")
-            xml_tree = et.parse(installer_file)
-            root = xml_tree.getroot()
-
-            # For all manifest files the following XPath expression returns the
-            # numeric ID. There are, in some cases, also name IDs but we do not
-            # consider these.
-            content_id = root.find(".//contentIDs/contentID[1]")
-
-            if content_id and content_id.text:
-                game_id = content_id.text
-                games[game_id] = game_dir
-        except FileNotFoundError:
-            pass
+    cache = load_cache(INSTALLER_CACHE_NAME, INSTALLER_CACHE_VERSION)
+
+    with ThreadPoolExecutor(
+        max_workers=min(PROBE_MAX_WORKERS, len(game_dirs)),
+        thread_name_prefix="basic_games-eadesktop",
+    ) as executor:
+        entries = list(
+            executor.map(
+                lambda game_dir: _probe_game_dir(game_dir, cache.get(str(game_dir))),
+                game_dirs,
+            )
+        )
+
+    updated_cache: Dict[str, Any] = {}
+    for game_dir, entry in zip(game_dirs, entries):
+        if entry is None:
+            continue
+        updated_cache[str(game_dir)] = entry
+
+        game_id: str | None = entry["content_id"]
+        if game_id and (wanted is None or game_id in wanted):
+            games[game_id] = game_dir
+
+    if updated_cache != cache:
+        save_cache(INSTALLER_CACHE_NAME, INSTALLER_CACHE_VERSION, updated_cache)
 
     return games
 
@@ -1,35 +1,131 @@
 # -*- encoding: utf-8 -*-
 from __future__ import annotations
 
-import itertools
 import json
 import os
+import re
 import sys
-import winreg
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable
 from pathlib import Path
+from typing import TextIO
 
+from .registry_utils import read_key
 
-def find_epic_games() -> Iterable[tuple[str, Path]]:
-    try:
-        with winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE,
-            r"Software\Wow6432Node\Epic Games\EpicGamesLauncher",
-        ) as key:
-            epic_app_data_path, _ = winreg.QueryValueEx(key, "AppDataPath")
-    except FileNotFoundError:
-        return
 
-    manifests_path = Path(os.path.expandvars(epic_app_data_path)).joinpath("Manifests")
-    if manifests_path.exists():
+def find_manifests_path() -> Path | None:
+    """
+    Returns:
+        The path to the folder containing the Epic Games manifests, or None if the
+        Epic Games launcher is not installed.
+    """
+    key = read_key(
+        r"HKEY_LOCAL_MACHINE\Software\Wow6432Node\Epic Games\EpicGamesLauncher"
+    )
+    if key is None or not (epic_app_data_path := key.value("AppDataPath")):
+        return None
+
+    return Path(os.path.expandvars(epic_app_data_path)).joinpath("Manifests")
+
+
+# Characters that start or end a JSON string, object, array or member:
+_JSON_STRUCTURE = re.compile(r'["{}\[\],]')
+
+
+def read_json_values(
+    fp: TextIO, keys: Collection[str], chunk_size: int = 1 << 16
+) -> dict[str, str]:
+    """
+    Read some string values of the root object of a JSON file.
+
+    Contrary to json.load(), the file is read by chunks and only until all the
+    requested values are found, and nested values are skipped without being
+    decoded.
+
+    Args:
+        fp: The JSON file.
+        keys: Keys of the values to read, values that are not strings are ignored.
+        chunk_size: Number of characters read at once.
+
+    Returns:
+        A mapping from key to value, for the keys found in the root object.
+
+    Raises:
+        ValueError: If the file is not valid JSON.
+    """
+    wanted = set(keys)
+    values: dict[str, str] = {}
+
+    buffer, position = "", 0
+
+    # depth of the current object or array, and key of the current member of the
+    # root object, if any:
+    depth = 0
+    key: str | None = None
+    expect_key = False
+
+    while len(values) < len(wanted):
+        match = _JSON_STRUCTURE.search(buffer, position)
+        if match is None:
+            chunk = fp.read(chunk_size)
+            if not chunk:
+                break
+            buffer, position = chunk, 0
+            continue
+
+        position = match.end()
+        character = match[0]
+
+        if character == '"':
+            try:
+                value, position = json.decoder.scanstring(buffer, position)
+            except json.JSONDecodeError:
+                # the string continues in the next chunk
+                chunk = fp.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer, position = buffer[match.start() :] + chunk, 0
+                continue
+
+            if depth == 1:
+                if expect_key:
+                    key, expect_key = value, False
+                elif key is not None:
+                    if key in wanted:
+                        values.setdefault(key, value)
+                    key = None
+
+        elif character in "{[":
+            depth += 1
+            expect_key = depth == 1 and character == "{"
+
+        elif character in "}]":
+            depth -= 1
+            if depth <= 0:
+                # end of the root value
+                break
+            if depth == 1:
+                key = None
+
+        elif depth == 1:
+            # comma between two members of the root object
+            key, expect_key = None, True
+
+    return values
+
+
+def find_epic_games() -> Iterable[tuple[str, Path]]:
+    manifests_path = find_manifests_path()
+    if manifests_path is not None and manifests_path.exists():
         for manifest_file_path in manifests_path.glob("*.item"):
             try:
                 with open(manifest_file_path, encoding="utf-8") as manifest_file:
-                    manifest_file_data = json.load(manifest_file)
+                    manifest_file_data = read_json_values(
+                        manifest_file, ("AppName", "InstallLocation")
+                    )
                 yield manifest_file_data["AppName"], Path(
                     manifest_file_data["InstallLocation"]
                 )
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 print(
                     "Unable to parse Epic Games manifest file",
                     manifest_file_path,
@@ -37,7 +133,49 @@ def find_epic_games() -> Iterable[tuple[str, Path]]:
                 )
 
 
-def find_legendary_games() -> Iterable[tuple[str, Path]]:
+def find_launcher_installed_path() -> Path:
+    """
+    Returns:
+        The path to the file listing the games installed with the Epic Games
+        launcher.
+    """
+    program_data_path = os.environ.get("PROGRAMDATA", r"C:\ProgramData")
+    return Path(
+        program_data_path, "Epic", "UnrealEngineLauncher", "LauncherInstalled.dat"
+    )
+
+
+def read_launcher_installed_games() -> list[tuple[str, Path]] | None:
+    """
+    Returns:
+        The Epic ID (AppName) and install location of the games listed in the
+        installed games file of the Epic Games launcher, or None if this file does
+        not exist or cannot be parsed.
+    """
+    installed_path = find_launcher_installed_path()
+    try:
+        with open(installed_path, encoding="utf-8") as installed_file:
+            installed_games = json.load(installed_file)
+        return [
+            (game["AppName"], Path(game["InstallLocation"]))
+            for game in installed_games["InstallationList"]
+        ]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, KeyError):
+        print(
+            "Unable to parse installed games from Epic Games launcher",
+            installed_path,
+            file=sys.stderr,
+        )
+        return None
+
+
+def find_legendary_installed_path() -> Path:
+    """
+    Returns:
+        The path to the file listing the games installed with Legendary.
+    """
     # Based on legendary source:
     # https://github.com/derrod/legendary/blob/master/legendary/lfs/lgndry.py
     if config_path := os.environ.get("XDG_CONFIG_HOME"):
@@ -45,7 +183,11 @@ def find_legendary_games() -> Iterable[tuple[str, Path]]:
     else:
         legendary_config_path = Path("~/.config/legendary").expanduser()
 
-    installed_path = legendary_config_path / "installed.json"
+    return legendary_config_path / "installed.json"
+
+
+def find_legendary_games() -> Iterable[tuple[str, Path]]:
+    installed_path = find_legendary_installed_path()
     if installed_path.exists():
         try:
             with open(installed_path, encoding="utf-8") as installed_file:
@@ -60,8 +202,58 @@ def find_legendary_games() -> Iterable[tuple[str, Path]]:
             )
 
 
-def find_games() -> dict[str, Path]:
-    return dict(itertools.chain(find_epic_games(), find_legendary_games()))
+def find_sources() -> list[Path]:
+    """
+    Find the files and folders the list of Epic Games is read from.
+
+    Returns:
+        The Epic Games launcher installed games file, the Epic Games manifests
+        folder, if the launcher is installed, and the Legendary installed games
+        file.
+    """
+    sources = [find_launcher_installed_path(), find_legendary_installed_path()]
+    if (manifests_path := find_manifests_path()) is not None:
+        sources.append(manifests_path)
+    return sources
+
+
+def find_games(wanted: Collection[str] | None = None) -> dict[str, Path]:
+    """
+    Find the list of Epic Games installed, with the Epic Games launcher or Legendary.
+
+    The installed games file of the launcher (LauncherInstalled.dat) lists all the
+    games installed with the launcher, the manifests of the launcher are only read
+    if this file is missing or invalid. The installed games of Legendary are read
+    last, unless all the wanted games were already found. A game listed by several
+    sources keeps the location from the launcher.
+
+    Args:
+        wanted: If not None, only look for these Epic IDs (AppName), and stop as
+            soon as all of them are found.
+
+    Returns:
+        A mapping from Epic ID to install locations for available Epic games.
+    """
+    remaining = None if wanted is None else set(wanted)
+
+    games: dict[str, Path] = {}
+
+    def add_games(found: Iterable[tuple[str, Path]]):
+        for app_name, path in found:
+            if remaining is not None:
+                if app_name not in remaining:
+                    continue
+                remaining.discard(app_name)
+            games.setdefault(app_name, path)
+            if remaining is not None and not remaining:
+                break
+
+    launcher_games = read_launcher_installed_games()
+    add_games(find_epic_games() if launcher_games is None else launcher_games)
+    if remaining is None or remaining:
+        add_games(find_legendary_games())
+
+    return games
 
 
 if __name__ == "__main__":
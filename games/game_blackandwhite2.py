@@ -3,7 +3,7 @@ import os
 import struct
 import time
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 import mobase
 from PyQt6.QtCore import QDateTime, QDir, QFile, QFileInfo, Qt
@@ -172,29 +172,55 @@ class BlackAndWhite2SaveGame(BasicGameSaveGame):
         "empty2": [0x00000108, 0x0000011C],
     }
 
+    # 2: the date of the save is stored without the local time offset
+    _metadata_version = 2
+
     def __init__(self, filepath: Path):
         super().__init__(filepath)
         self._filepath = Path(filepath)
-        self.name: str = ""
-        self.land: int = -1
-        self.elapsed: int = 0
-        self.lastsave: int = 0
-        with open(self._filepath.joinpath("SaveGame.inf"), "rb") as info:
-            # Name embedded in "SaveGame.inf" with UTF-16 encoding
-            self.name = self.readInf(info, "name").decode("utf-16")
-            # Land number embedded in "SaveGame.inf" as an int written in binary
-            self.land = int.from_bytes(self.readInf(info, "land"), "little")
-            # Getting elapsed time in second
-            self.elapsed = int.from_bytes(self.readInf(info, "elapsed"), "little")
+
+    def _metadata_source(self) -> Path:
+        return self._filepath.joinpath("SaveGame.inf")
+
+    def _load_metadata(self) -> dict[str, Any]:
+        with open(self._metadata_source(), "rb") as info:
             # Getting date in 100th of nanosecond need to convert NT time
-            # to UNIX time and offset localtime
-            self.lastsave = (
-                (
-                    struct.unpack("q", self.readInf(info, "date"))[0] / 10000
-                    - 11644473600000
-                )
-            ) - (time.localtime().tm_gmtoff * 1000)
-            info.close()
+            # to UNIX time, the localtime offset is applied by lastsave since
+            # the metadata is cached
+            lastsave = (
+                struct.unpack("q", self.readInf(info, "date"))[0] / 10000
+                - 11644473600000
+            )
+            return {
+                # Name embedded in "SaveGame.inf" with UTF-16 encoding
+                "name": self.readInf(info, "name").decode("utf-16"),
+                # Land number embedded in "SaveGame.inf" as an int written in binary
+                "land": int.from_bytes(self.readInf(info, "land"), "little"),
+                # Getting elapsed time in second
+                "elapsed": int.from_bytes(self.readInf(info, "elapsed"), "little"),
+                "lastsave": int(lastsave),
+            }
+
+    # The accessors do not parse the save, see BasicGameSaveGame.peek_metadata():
+
+    @property
+    def name(self) -> str:
+        return (self.peek_metadata() or {}).get("name", "")
+
+    @property
+    def land(self) -> int:
+        return (self.peek_metadata() or {}).get("land", -1)
+
+    @property
+    def elapsed(self) -> int:
+        return (self.peek_metadata() or {}).get("elapsed", 0)
+
+    @property
+    def lastsave(self) -> int:
+        lastsave = (self.peek_metadata() or {}).get("lastsave", 0)
+        if not lastsave:
+            return 0
+        return lastsave - time.localtime().tm_gmtoff * 1000
 
     def readInf(self, inf: BinaryIO, key: str):
         inf.seek(self._saveInfLayout[key][0])
@@ -206,15 +232,14 @@ class BlackAndWhite2SaveGame(BasicGameSaveGame):
         return files
 
     def getCreationTime(self) -> QDateTime:
+        if not self.lastsave:
+            return super().getCreationTime()
         time = QDateTime.fromMSecsSinceEpoch(self.lastsave)
         return time
 
     def getElapsed(self) -> str:
         return str(datetime.timedelta(seconds=self.elapsed))
 
-    def getName(self) -> str:
-        return self.name
-
     def getLand(self) -> str:
         return str(self.land)
 
@@ -224,6 +249,8 @@ class BlackAndWhite2SaveGame(BasicGameSaveGame):
 
 def _getPreview(savepath: Path):
     save = BlackAndWhite2SaveGame(savepath)
+    # the preview is built from the metadata, usually already cached:
+    save.metadata()
     lines = [
         [
             ("Name : " + save.getName(), Qt.AlignmentFlag.AlignLeft),
@@ -308,11 +335,13 @@ class BlackAndWhite2Game(BasicGame, mobase.IPluginFileMapper):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         BasicGame.init(self, organizer)
-        self._featureMap[mobase.ModDataChecker] = BlackAndWhite2ModDataChecker()
-        self._featureMap[mobase.LocalSavegames] = BasicLocalSavegames(
+        self._featureMap[mobase.ModDataChecker] = BlackAndWhite2ModDataChecker
+        self._featureMap[mobase.LocalSavegames] = lambda: BasicLocalSavegames(
             self.savesDirectory()
         )
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(_getPreview)
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
+            _getPreview
+        )
         return True
 
     def detectGame(self):
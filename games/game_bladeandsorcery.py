@@ -1,6 +1,7 @@
 import json
 from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 import mobase
 from PyQt6.QtCore import QDateTime, QDir
@@ -14,46 +15,54 @@ from ..basic_game import BasicGame
 
 
 class BaSSaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
+    def _load_metadata(self) -> dict[str, Any]:
         with open(self._filepath, "rb") as save:
             save_data = json.load(save)
-        self._gameMode: str = save_data["gameModeId"]
-        self._gender = (
-            "Male" if save_data["creatureId"] == "PlayerDefaultMale" else "Female"
-        )
-        self._ethnicity: str = save_data["ethnicGroupId"]
+        gender = "Male" if save_data["creatureId"] == "PlayerDefaultMale" else "Female"
         h, m, s = save_data["playTime"].split(":")
-        self._elapsed = (int(h), int(m), float(s))
         f_stat = self._filepath.stat()
-        self._created = f_stat.st_ctime
-        self._modified = f_stat.st_mtime
+        return {
+            "gameMode": save_data["gameModeId"],
+            "gender": gender,
+            "ethnicity": save_data["ethnicGroupId"],
+            "elapsed": [int(h), int(m), float(s)],
+            "created": f_stat.st_ctime,
+            "modified": f_stat.st_mtime,
+        }
+
+    # The accessors do not parse the save, see BasicGameSaveGame.peek_metadata():
 
     def getName(self) -> str:
-        return f"{self.getPlayerSlug()} - {self._gameMode}"
+        if not self.peek_metadata():
+            return super().getName()
+        return f"{self.getPlayerSlug()} - {self.getGameMode()}"
 
     def getCreationTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(int(self._created))
+        if (created := (self.peek_metadata() or {}).get("created")) is None:
+            return super().getCreationTime()
+        return QDateTime.fromSecsSinceEpoch(int(created))
 
     def getModifiedTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(int(self._modified))
+        if (modified := (self.peek_metadata() or {}).get("modified")) is None:
+            return super().getCreationTime()
+        return QDateTime.fromSecsSinceEpoch(int(modified))
 
     def getPlayerSlug(self) -> str:
-        return f"{self._gender} {self._ethnicity}"
+        metadata = self.peek_metadata() or {}
+        return f"{metadata.get('gender', '')} {metadata.get('ethnicity', '')}"
 
     def getElapsed(self) -> str:
-        return (
-            f"{self._elapsed[0]} hours, "
-            f"{self._elapsed[1]} minutes, "
-            f"{int(self._elapsed[2])} seconds"
-        )
+        h, m, s = (self.peek_metadata() or {}).get("elapsed", (0, 0, 0))
+        return f"{h} hours, {m} minutes, {int(s)} seconds"
 
     def getGameMode(self) -> str:
-        return self._gameMode
+        return (self.peek_metadata() or {}).get("gameMode", "")
 
 
 def bas_parse_metadata(p: Path, save: mobase.ISaveGame) -> Mapping[str, str]:
     assert isinstance(save, BaSSaveGame)
+    # called from a worker thread, so the save can be parsed:
+    save.metadata()
     return {
         "Character": save.getPlayerSlug(),
         "Game Mode": save.getGameMode(),
@@ -83,7 +92,7 @@ class BaSGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         BasicGame.init(self, organizer)
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             get_metadata=bas_parse_metadata, max_width=400
         )
         return True
@@ -1,5 +1,6 @@
 import filecmp
 import json
+import os
 import re
 import shutil
 from collections import Counter
@@ -141,47 +142,73 @@ def time_from_seconds(s: int | float) -> str:
 
 
 def parse_cyberpunk_save_metadata(save_path: Path, save: mobase.ISaveGame):
-    metadata_file = save_path / "metadata.9.json"
-    try:
-        with open(metadata_file) as file:
-            meta_data = json.load(file)["Data"]["metadata"]
-            name = meta_data["name"]
-            if name != (save_name := save.getName()):
-                name = f"{save_name}  ({name})"
-            return {
-                "Name": name,
-                "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
-                "Play Time": time_from_seconds(meta_data["playthroughTime"]),
-                "Quest": meta_data["trackedQuestEntry"],
-                "Level": int(meta_data["level"]),
-                "Street Cred": int(meta_data["streetCred"]),
-                "Life Path": meta_data["lifePath"],
-                "Difficulty": meta_data["difficulty"],
-                "Gender": f'{meta_data["bodyGender"]} / {meta_data["brainGender"]}',
-                "Game version": meta_data["buildPatch"],
-            }
-    except (FileNotFoundError, json.JSONDecodeError):
+    if not isinstance(save, CyberpunkSaveGame) or not (meta_data := save.metadata()):
         return None
+    name = meta_data["name"]
+    if name != (save_name := save.getName()):
+        name = f"{save_name}  ({name})"
+    return {
+        "Name": name,
+        "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
+        "Play Time": time_from_seconds(meta_data["playthroughTime"]),
+        "Quest": meta_data["trackedQuestEntry"],
+        "Level": int(meta_data["level"]),
+        "Street Cred": int(meta_data["streetCred"]),
+        "Life Path": meta_data["lifePath"],
+        "Difficulty": meta_data["difficulty"],
+        "Gender": f'{meta_data["bodyGender"]} / {meta_data["brainGender"]}',
+        "Game version": meta_data["buildPatch"],
+    }
 
 
 class CyberpunkSaveGame(BasicGameSaveGame):
     _name_file = "NamedSave.txt"  # from mod: Named Saves
+    _metadata_file = "metadata.9.json"
+    _metadata_keys = (
+        "name",
+        "timestampString",
+        "playthroughTime",
+        "trackedQuestEntry",
+        "level",
+        "streetCred",
+        "lifePath",
+        "difficulty",
+        "bodyGender",
+        "brainGender",
+        "buildPatch",
+    )
 
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
+    def __init__(self, filepath: Path, stat: os.stat_result | None = None):
+        """
+        Args:
+            filepath: Path to the save folder.
+            stat (optional): Result of stat() on the sav.dat file of the save.
+        """
+        super().__init__(filepath, stat)
         try:  # Custom name from Named Saves
             with open(filepath / self._name_file) as file:
                 self._name = file.readline()
         except FileNotFoundError:
             self._name = ""
 
+    def _metadata_source(self) -> Path:
+        return self._filepath / self._metadata_file
+
+    def _load_metadata(self) -> dict[str, Any]:
+        try:
+            with open(self._metadata_source()) as file:
+                meta_data = json.load(file)["Data"]["metadata"]
+        except FileNotFoundError:
+            return {}
+        return {key: meta_data[key] for key in self._metadata_keys}
+
     def getName(self) -> str:
-        return self._name or super().getName()
+        return self._name or self._filepath.name
 
     def getCreationTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(
-            int((self._filepath / "sav.dat").stat().st_mtime)
-        )
+        if self._stat is None:
+            self._stat = (self._filepath / "sav.dat").stat()
+        return QDateTime.fromSecsSinceEpoch(int(self._stat.st_mtime))
 
 
 @dataclass
@@ -306,14 +333,14 @@ class Cyberpunk2077Game(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
-        self._featureMap[mobase.LocalSavegames] = BasicLocalSavegames(
+        self._featureMap[mobase.LocalSavegames] = lambda: BasicLocalSavegames(
             self.savesDirectory()
         )
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             lambda p: Path(p or "", "screenshot.png"),
             parse_cyberpunk_save_metadata,
         )
-        self._featureMap[mobase.ModDataChecker] = CyberpunkModDataChecker()
+        self._featureMap[mobase.ModDataChecker] = CyberpunkModDataChecker
 
         self._modlist_files = ModListFileManager[Literal["archive", "redmod"]](
             organizer,
@@ -360,10 +387,15 @@ class Cyberpunk2077Game(BasicGame):
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
-        return [
-            CyberpunkSaveGame(path.parent)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
-        ]
+        (files,) = self.scan_saves(folder, f"**/*.{ext}")
+        # one save per folder, with the stat of its sav.dat if found:
+        saves: dict[Path, os.stat_result | None] = {}
+        for file in files:
+            if file.path.name.lower() == "sav.dat" or file.path.parent not in saves:
+                saves[file.path.parent] = (
+                    file.stat if file.path.name.lower() == "sav.dat" else None
+                )
+        return [CyberpunkSaveGame(path, stat) for path, stat in saves.items()]
 
     def settings(self) -> list[mobase.PluginSetting]:
         return [
@@ -29,7 +29,7 @@ class DA2Game(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             lambda s: s.parent.joinpath("screen.dds")
         )
         return True
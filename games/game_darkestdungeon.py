@@ -5,7 +5,7 @@ import mobase
 from PyQt6.QtCore import QDir, QFileInfo, QStandardPaths
 
 from ..basic_game import BasicGame, BasicGameSaveGame
-from ..steam_utils import find_steam_path
+from ..steam_utils import find_cloud_save_directory
 
 
 class DarkestDungeonModDataChecker(mobase.ModDataChecker):
@@ -59,14 +59,18 @@ class DarkestDungeonModDataChecker(mobase.ModDataChecker):
 
 
 class DarkestDungeonSaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        dataPath = filepath.joinpath("persist.game.json")
-        self.name: str = ""
+    @property
+    def name(self) -> str:
+        return self.metadata().get("name", "")
+
+    def _metadata_source(self) -> Path:
+        return self._filepath.joinpath("persist.game.json")
+
+    def _load_metadata(self) -> dict[str, str]:
+        dataPath = self._metadata_source()
         if self.isBinary(dataPath):
-            self.loadBinarySaveFile(dataPath)
-        else:
-            self.loadJSONSaveFile(dataPath)
+            return {"name": self.loadBinarySaveFile(dataPath)}
+        return {"name": self.loadJSONSaveFile(dataPath)}
 
     @staticmethod
     def isBinary(dataPath: Path) -> bool:
@@ -75,13 +79,13 @@ class DarkestDungeonSaveGame(BasicGameSaveGame):
             # magic number in binary save files
             return magic == b"\x01\xb1\x00\x00"
 
-    def loadJSONSaveFile(self, dataPath: Path):
+    def loadJSONSaveFile(self, dataPath: Path) -> str:
         text = dataPath.read_text()
         content = json.loads(text)
         data = content["data"]
-        self.name = str(data["estatename"])
+        return str(data["estatename"])
 
-    def loadBinarySaveFile(self, dataPath: Path):
+    def loadBinarySaveFile(self, dataPath: Path) -> str:
         # see https://github.com/robojumper/DarkestDungeonSaveEditor
         with dataPath.open(mode="rb") as fp:
             # read Header
@@ -145,14 +149,8 @@ class DarkestDungeonSaveGame(BasicGameSaveGame):
                     continue
                 valueLength = int.from_bytes(fp.read(4), "little")
                 valueBytes = fp.read(valueLength - 1)
-                value = bytes.decode(valueBytes, "utf-8")
-                self.name = value
-                break
-
-    def getName(self) -> str:
-        if self.name == "":
-            return super().getName()
-        return self.name
+                return bytes.decode(valueBytes, "utf-8")
+        return ""
 
 
 class DarkestDungeonGame(BasicGame):
@@ -175,7 +173,7 @@ class DarkestDungeonGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
-        self._featureMap[mobase.ModDataChecker] = DarkestDungeonModDataChecker()
+        self._featureMap[mobase.ModDataChecker] = DarkestDungeonModDataChecker
         return True
 
     def executables(self):
@@ -191,23 +189,10 @@ class DarkestDungeonGame(BasicGame):
 
     @staticmethod
     def getCloudSaveDirectory() -> str | None:
-        steamPath = find_steam_path()
-        if steamPath is None:
+        cloudSaves = find_cloud_save_directory(262060)
+        if cloudSaves is None:
             return None
-
-        userData = steamPath.joinpath("userdata")
-        for child in userData.iterdir():
-            name = child.name
-            try:
-                userID = int(name)
-            except ValueError:
-                userID = -1
-            if userID == -1:
-                continue
-            cloudSaves = child.joinpath("262060", "remote")
-            if cloudSaves.exists() and cloudSaves.is_dir():
-                return str(cloudSaves)
-        return None
+        return str(cloudSaves)
 
     def savesDirectory(self) -> QDir:
         documentsSaves = QDir(
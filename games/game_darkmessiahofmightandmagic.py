@@ -43,7 +43,7 @@ class DarkMessiahOfMightAndMagicGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             self._read_save_tga
         )
         return True
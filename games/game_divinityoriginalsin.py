@@ -31,7 +31,7 @@ class DivinityOriginalSinGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             lambda s: s.with_suffix(".png")  # Not confirmed
         )
         return True
@@ -89,12 +89,12 @@ class DivinityOriginalSinEnhancedEditionGame(BasicGame, mobase.IPluginFileMapper
 
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             lambda s: s.with_suffix(".png")
         )
         self._featureMap[
             mobase.ModDataChecker
-        ] = DivinityOriginalSinEnhancedEditionModDataChecker()
+        ] = DivinityOriginalSinEnhancedEditionModDataChecker
         return True
 
     def mappings(self) -> list[mobase.Mapping]:
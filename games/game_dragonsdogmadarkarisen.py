@@ -1,12 +1,11 @@
 import os
 import re
-from pathlib import Path
 
 import mobase
 from PyQt6.QtCore import QDir, qInfo
 from PyQt6.QtWidgets import QMessageBox
-from ..basic_game import BasicGame
-from ..steam_utils import find_steam_path
+from ..basic_game import BasicGame, replace_variables
+from ..steam_utils import find_cloud_save_directory
 
 
 class DragonsDogmaDarkArisenModDataChecker(mobase.ModDataChecker):
@@ -187,29 +186,19 @@ class DragonsDogmaDarkArisen(BasicGame):
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
         self._organizer = organizer
-        self._featureMap[mobase.ModDataChecker] = DragonsDogmaDarkArisenModDataChecker()
+        self._featureMap[mobase.ModDataChecker] = DragonsDogmaDarkArisenModDataChecker
         return True
 
     @staticmethod
     def get_cloud_save_directory():
-        steam_path = Path(find_steam_path())
-        user_data = steam_path.joinpath("user_data")
-        for child in user_data.iterdir():
-            name = child.name
-            try:
-                steam_ident = int(name)
-            except ValueError:
-                steam_ident = -1
-            if steam_ident == -1:
-                continue
-            cloud_saves = child.joinpath("367500", "remote")
-            if cloud_saves.exists() and cloud_saves.is_dir():
-                return str(cloud_saves)
-        return None
+        cloud_saves = find_cloud_save_directory(367500)
+        if cloud_saves is None:
+            return None
+        return str(cloud_saves)
 
     def savesDirectory(self) -> QDir:
         documents_saves = QDir(
-            str(os.getenv("LOCALAPPDATA"))
+            replace_variables("%LOCALAPPDATA%", self)
             + "\\GOG.com\\Galaxy\\Applications\\49987265717041704"
             + "\\Storage\\Shared\\Files"
         )
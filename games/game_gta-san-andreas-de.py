@@ -46,7 +46,7 @@ class GTASanAndreasDefinitiveEditionGame(BasicGame):
         super().init(organizer)
         self._featureMap[
             mobase.ModDataChecker
-        ] = GTASanAndreasDefinitiveEditionModDataChecker()
+        ] = GTASanAndreasDefinitiveEditionModDataChecker
         return True
 
     def executables(self):
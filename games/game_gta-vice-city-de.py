@@ -46,7 +46,7 @@ class GTAViceCityDefinitiveEditionGame(BasicGame):
         super().init(organizer)
         self._featureMap[
             mobase.ModDataChecker
-        ] = GTAViceCitysDefinitiveEditionModDataChecker()
+        ] = GTAViceCitysDefinitiveEditionModDataChecker
         return True
 
     def executables(self):
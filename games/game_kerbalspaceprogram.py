@@ -43,7 +43,7 @@ class KerbalSpaceProgramGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             lambda s: str(
                 Path(s).parent.joinpath("banners").joinpath(f"{Path(s).stem}.png")
             )
@@ -3,7 +3,7 @@ import re
 
 from PyQt6.QtCore import QDir
 
-from ..basic_game import BasicGame
+from ..basic_game import BasicGame, replace_variables
 
 
 class MSFS2020Game(BasicGame):
@@ -22,7 +22,7 @@ class MSFS2020Game(BasicGame):
 
     def dataDirectory(self) -> QDir:
         # Find and use package path specified in Asobo engine options
-        AppDataPath = os.path.expandvars(r"%APPDATA%\Microsoft Flight Simulator")
+        AppDataPath = replace_variables(r"%APPDATA%\Microsoft Flight Simulator", self)
         UserCfgPath = os.path.join(AppDataPath, "UserCfg.opt")
         InstalledPackagesPathPattern = re.compile(
             r'InstalledPackagesPath\s*=\s*"(.*)"', re.IGNORECASE
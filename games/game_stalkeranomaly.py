@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 from ..basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    SaveMetadataLoader,
 )
 from ..basic_game import BasicGame
 from .stalkeranomaly import XRSave
@@ -130,21 +131,26 @@ class StalkerAnomalyModDataContent(mobase.ModDataContent):
 class StalkerAnomalySaveGame(BasicGameSaveGame):
     _filepath: Path
 
-    xr_save: XRSave
-
     def __init__(self, filepath: Path):
         super().__init__(filepath)
         self._filepath = filepath
-        self.xr_save = XRSave(self._filepath)
 
-    def getName(self) -> str:
-        xr_save = self.xr_save
-        player = xr_save.player
-        if player:
-            name = player.character_name_str
-            time = xr_save.time_fmt
-            return f"{name}, {xr_save.save_fmt} [{time}]"
-        return ""
+    def _load_metadata(self) -> dict[str, str]:
+        xr_save = XRSave(self._filepath)
+        player = getattr(xr_save, "player", None)
+        if not player:
+            return {}
+        name = player.character_name_str
+        return {
+            "name": f"{name}, {xr_save.save_fmt} [{xr_save.time_fmt}]",
+            "Save": xr_save.save_fmt,
+            "Name": name,
+            "Faction": xr_save.getFaction(),
+            "Health": f"{player.health:.2f}%",
+            "Money": f"{player.money} RU",
+            "Rank": f"{xr_save.getRank()} ({player.rank})",
+            "Reputation": f"{xr_save.getReputation()} ({player.reputation})",
+        }
 
     def allFiles(self) -> list[str]:
         filepath = str(self._filepath)
@@ -161,6 +167,10 @@ class StalkerAnomalySaveGame(BasicGameSaveGame):
 class StalkerAnomalySaveGameInfoWidget(mobase.ISaveGameInfoWidget):
     def __init__(self, parent: QWidget | None):
         super().__init__(parent)
+        # The metadata is parsed on a worker thread, see _on_loaded():
+        self._save: StalkerAnomalySaveGame | None = None
+        self._loader = SaveMetadataLoader(self)
+        self._loader.loaded.connect(self._on_loaded)
         layout = QVBoxLayout()
         self._labelSave = self.newLabel(layout)
         self._labelName = self.newLabel(layout)
@@ -191,19 +201,38 @@ class StalkerAnomalySaveGameInfoWidget(mobase.ISaveGameInfoWidget):
     def setSave(self, save: mobase.ISaveGame):
         self.resize(240, 32)
         if not isinstance(save, StalkerAnomalySaveGame):
+            self._save = None
+            return
+        self._save = save
+        if not save.metadata_loaded():
+            self._clearLabels()
+            self._labelSave.setText(f"Loading {Path(save.getFilepath()).name}...")
+        self._loader.request(save)
+
+    def _clearLabels(self):
+        for label in (
+            self._labelSave,
+            self._labelName,
+            self._labelFaction,
+            self._labelHealth,
+            self._labelMoney,
+            self._labelRank,
+            self._labelRep,
+        ):
+            label.clear()
+
+    def _on_loaded(self, save: StalkerAnomalySaveGame, metadata: dict[str, str]):
+        if save is not self._save:
             return
-        xr_save = save.xr_save
-        player = xr_save.player
-        if player:
-            self._labelSave.setText(f"Save: {xr_save.save_fmt}")
-            self._labelName.setText(f"Name: {player.character_name_str}")
-            self._labelFaction.setText(f"Faction: {xr_save.getFaction()}")
-            self._labelHealth.setText(f"Health: {player.health:.2f}%")
-            self._labelMoney.setText(f"Money: {player.money} RU")
-            self._labelRank.setText(f"Rank: {xr_save.getRank()} ({player.rank})")
-            self._labelRep.setText(
-                f"Reputation: {xr_save.getReputation()} ({player.reputation})"
-            )
+        self._clearLabels()
+        if metadata:
+            self._labelSave.setText(f"Save: {metadata['Save']}")
+            self._labelName.setText(f"Name: {metadata['Name']}")
+            self._labelFaction.setText(f"Faction: {metadata['Faction']}")
+            self._labelHealth.setText(f"Health: {metadata['Health']}")
+            self._labelMoney.setText(f"Money: {metadata['Money']}")
+            self._labelRank.setText(f"Rank: {metadata['Rank']}")
+            self._labelRep.setText(f"Reputation: {metadata['Reputation']}")
 
 
 class StalkerAnomalySaveGameInfo(BasicGameSaveGameInfo):
@@ -238,9 +267,9 @@ class StalkerAnomalyGame(BasicGame, mobase.IPluginFileMapper):
 
     def init(self, organizer: mobase.IOrganizer):
         BasicGame.init(self, organizer)
-        self._featureMap[mobase.ModDataChecker] = StalkerAnomalyModDataChecker()
-        self._featureMap[mobase.ModDataContent] = StalkerAnomalyModDataContent()
-        self._featureMap[mobase.SaveGameInfo] = StalkerAnomalySaveGameInfo()
+        self._featureMap[mobase.ModDataChecker] = StalkerAnomalyModDataChecker
+        self._featureMap[mobase.ModDataContent] = StalkerAnomalyModDataContent
+        self._featureMap[mobase.SaveGameInfo] = StalkerAnomalySaveGameInfo
         organizer.onAboutToRun(lambda _str: self.aboutToRun(_str))
         return True
 
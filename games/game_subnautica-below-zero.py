@@ -33,7 +33,7 @@ class SubnauticaBelowZeroGame(game_subnautica.SubnauticaGame):
         super().init(organizer)
         self._featureMap[
             mobase.ModDataChecker
-        ] = game_subnautica.SubnauticaModDataChecker(
+        ] = lambda: game_subnautica.SubnauticaModDataChecker(
             GlobPatterns(unfold=["BepInExPack_BelowZero"])
         )
         return True
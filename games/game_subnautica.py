@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 from collections.abc import Iterable
 from enum import Enum
 from pathlib import Path
@@ -13,7 +12,7 @@ from ..basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
 )
-from ..basic_game import BasicGame
+from ..basic_game import BasicGame, replace_variables
 
 
 class SubnauticaModDataChecker(BasicModDataChecker):
@@ -81,8 +80,8 @@ class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
-        self._featureMap[mobase.ModDataChecker] = SubnauticaModDataChecker()
-        self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo(
+        self._featureMap[mobase.ModDataChecker] = SubnauticaModDataChecker
+        self._featureMap[mobase.SaveGameInfo] = lambda: BasicGameSaveGameInfo(
             lambda s: Path(s or "", "screenshot.jpg")
         )
         return True
@@ -92,7 +91,7 @@ class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
             BasicGameSaveGame(folder)
             for save_path in (
                 folder.absolutePath(),
-                *(os.path.expandvars(p) for p in self._game_extra_save_paths),
+                *(replace_variables(p, self) for p in self._game_extra_save_paths),
             )
             for folder in Path(save_path).glob("slot*")
         ]
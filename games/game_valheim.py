@@ -306,7 +306,7 @@ class ValheimGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
-        self._featureMap[mobase.ModDataChecker] = BasicModDataChecker(
+        self._featureMap[mobase.ModDataChecker] = lambda: BasicModDataChecker(
             GlobPatterns(
                 unfold=[
                     "BepInExPack_Valheim",
@@ -358,7 +358,7 @@ class ValheimGame(BasicGame):
                 },
             )
         )
-        self._featureMap[mobase.LocalSavegames] = BasicLocalSavegames(
+        self._featureMap[mobase.LocalSavegames] = lambda: BasicLocalSavegames(
             self.savesDirectory()
         )
         self._overwrite_sync = OverwriteSync(organizer=self._organizer, game=self)
@@ -372,11 +372,14 @@ class ValheimGame(BasicGame):
         ]
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        save_games = super().listSaves(folder)
-        path = Path(folder.absolutePath())
-        save_games.extend(ValheimSaveGame(f) for f in path.glob("characters/*.fch"))
-        save_games.extend(ValheimWorldSaveGame(f) for f in path.glob("worlds/*.fwl"))
-        return save_games
+        ext = self._mappings.savegameExtension.get()
+        # save class for each pattern:
+        classes = (BasicGameSaveGame, ValheimSaveGame, ValheimWorldSaveGame)
+        return self.save_index(
+            folder,
+            [f"**/*.{ext}", "characters/*.fch", "worlds/*.fwl"],
+            lambda index, save: classes[index](save.path, save.stat),
+        ).saves()
 
     def settings(self) -> list[mobase.PluginSetting]:
         settings = super().settings()
@@ -406,7 +409,7 @@ class ValheimGame(BasicGame):
             self._sync_overwrite()
 
     def _sync_overwrite(self) -> None:
-        if self._organizer.managedGame() is not self:
+        if not self.isActive():
             return
         if self._organizer.pluginSetting(self.name(), "sync_overwrite") is not False:
             self._overwrite_sync.search_file_contents = (
@@ -73,8 +73,8 @@ class VampireTheMasqueradeBloodlinesGame(BasicGame):
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
-        self._featureMap[mobase.ModDataChecker] = VampireModDataChecker()
-        self._featureMap[mobase.LocalSavegames] = BasicLocalSavegames(
+        self._featureMap[mobase.ModDataChecker] = VampireModDataChecker
+        self._featureMap[mobase.LocalSavegames] = lambda: BasicLocalSavegames(
             self.savesDirectory()
         )
         return True
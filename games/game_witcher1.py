@@ -8,10 +8,12 @@ from ..basic_game import BasicGame, BasicGameSaveGame
 
 
 class Witcher1SaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        self.areaName: str = ""
-        self.parseSaveFile(filepath)
+    @property
+    def areaName(self) -> str:
+        return self.metadata().get("name", "")
+
+    def _load_metadata(self) -> dict[str, str]:
+        return {"name": self.parseSaveFile(self._filepath)}
 
     @staticmethod
     def readInt(fp: BinaryIO, length: int = 4) -> int:
@@ -23,7 +25,7 @@ class Witcher1SaveGame(BasicGameSaveGame):
         res = b.decode("utf-16")
         return res.rstrip("\0")
 
-    def parseSaveFile(self, filepath: Path):
+    def parseSaveFile(self, filepath: Path) -> str:
         # https://github.com/xoreos/xoreos/blob/82bd991052732ab1f8f75f512b3dfabfcc92ae8f/src/aurora/thewitchersavefile.cpp#L60
         with filepath.open(mode="rb") as fp:
             magic = fp.read(4)
@@ -50,10 +52,7 @@ class Witcher1SaveGame(BasicGameSaveGame):
             if areaName1 != areaName2:
                 raise ValueError("Invalid Area Name!")
 
-            self.areaName = areaName1
-
-    def getName(self) -> str:
-        return self.areaName
+            return areaName1
 
 
 class Witcher1Game(BasicGame):
@@ -1,35 +1,33 @@
 # Code adapted from EzioTheDeadPoet / erri120:
 #     https://github.com/ModOrganizer2/modorganizer-basic_games/pull/5
 
-import winreg
+from collections.abc import Collection
 from pathlib import Path
 
+from .registry_utils import read_key
 
-def find_games() -> dict[str, Path]:
-    # List the game IDs from the registry:
-    game_ids: list[str] = []
-    try:
-        with winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE, r"Software\Wow6432Node\GOG.com\Games"
-        ) as key:
-            nkeys = winreg.QueryInfoKey(key)[0]
-            for ik in range(nkeys):
-                game_key = winreg.EnumKey(key, ik)
-                if game_key.isdigit():
-                    game_ids.append(game_key)
-    except FileNotFoundError:
+
+def find_games(wanted: Collection[str] | None = None) -> dict[str, Path]:
+    """
+    Find the list of GOG games installed.
+
+    Args:
+        wanted: If not None, only look for these GOG game IDs.
+
+    Returns:
+        A mapping from GOG game ID to install locations for available GOG games.
+    """
+    games_key = read_key(r"HKEY_LOCAL_MACHINE\Software\Wow6432Node\GOG.com\Games")
+    if games_key is None:
         return {}
 
-    # For each game, query the path:
+    # The keys of all the games are read at once (see registry_utils):
     games: dict[str, Path] = {}
-    for game_id in game_ids:
-        try:
-            with winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                f"Software\\Wow6432Node\\GOG.com\\Games\\{game_id}",
-            ) as key:
-                games[game_id] = Path(winreg.QueryValueEx(key, "path")[0])
-        except FileNotFoundError:
-            pass
+    for game_key in games_key.subkeys():
+        game_id = game_key.name
+        if not game_id.isdigit() or (wanted is not None and game_id not in wanted):
+            continue
+        if path := game_key.value("path"):
+            games[game_id] = Path(path)
 
     return games
@@ -3,14 +3,18 @@
 # Heavily influenced by https://github.com/erri120/GameFinder
 
 import os
+import sys
 import threading
 import time
+from collections.abc import Collection, Iterator
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from urllib import parse
 
 import psutil
 
+from .cache_utils import load_cache, save_cache
+
 
 class OriginWatcher:
     """
@@ -62,38 +66,144 @@ class OriginWatcher:
             time.sleep(1)
 
 
-def find_games() -> Dict[str, Path]:
+# Manifests are stored in LocalContent/<game>/, sometimes one folder deeper, deeper
+# folders contain game data and are not walked:
+MANIFEST_MAX_DEPTH = 2
+
+# Name and version of the cache of parsed manifests:
+MANIFEST_CACHE_NAME = "origin_manifests.json"
+MANIFEST_CACHE_VERSION = 1
+
+
+def find_local_content_path() -> Path:
+    """
+    Returns:
+        The path to the Origin folder containing the manifests of installed games.
+    """
+    program_data_path = os.path.expandvars("%PROGRAMDATA%")
+    return Path(program_data_path).joinpath("Origin", "LocalContent")
+
+
+def _walk_local_content(path: Path, depth: int = 0) -> Iterator[os.DirEntry[str]]:
+    """
+    List the sub-folders and manifests of the given LocalContent folder, up to
+    MANIFEST_MAX_DEPTH.
+    """
+    folders: List[os.DirEntry[str]] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < MANIFEST_MAX_DEPTH:
+                        folders.append(entry)
+                elif entry.name.lower().endswith(".mfst"):
+                    yield entry
+    except OSError:
+        return
+
+    for folder in folders:
+        yield folder
+        yield from _walk_local_content(Path(folder.path), depth + 1)
+
+
+def _parse_manifest(path: str) -> List[Tuple[str, str]]:
+    """
+    Read the (id, install path) pairs from the given manifest.
+    """
+    # Read the file and look for &id= and &dipinstallpath=
+    with open(path, "r") as f:
+        manifest_query = f.read()
+    url = parse.urlparse(manifest_query)
+    query = parse.parse_qs(url.query)
+    if "id" not in query:
+        # If id is not present, we have no clue what to do.
+        return []
+    if "dipinstallpath" not in query:
+        # We could query the Origin server for the install location but... no?
+        return []
+
+    return [(id_, path_) for id_ in query["id"] for path_ in query["dipinstallpath"]]
+
+
+def find_sources() -> List[Path]:
+    """
+    Find the folders and manifests the list of Origin games is read from.
+
+    Returns:
+        The LocalContent folder, each of its sub-folders that can contain manifests,
+        and the manifests themselves, since a manifest modified in place does not
+        change the modification time of its folder.
+    """
+    local_content_path = find_local_content_path()
+    sources = [local_content_path]
+    sources.extend(
+        Path(entry.path)
+        for entry in _walk_local_content(local_content_path)
+        if entry.is_dir(follow_symlinks=False) or "@steam" not in entry.name.lower()
+    )
+    return sources
+
+
+def find_games(wanted: Collection[str] | None = None) -> Dict[str, Path]:
     """
     Find the list of Origin games installed.
 
+    The parsed manifests are cached, so manifests are only read again when they
+    are modified.
+
+    Args:
+        wanted: If not None, only look for these Origin manifest IDs, and stop as
+            soon as all of them are found.
+
     Returns:
         A mapping from Origin manifest IDs to install locations for available
         Origin games.
     """
     games: Dict[str, Path] = {}
 
-    program_data_path = os.path.expandvars("%PROGRAMDATA%")
-    local_content_path = Path(program_data_path).joinpath("Origin", "LocalContent")
-    for manifest in local_content_path.glob("**/*.mfst"):
-        # Skip any manifest file with '@steam'
-        if "@steam" in manifest.name.lower():
-            continue
+    remaining = None if wanted is None else set(wanted)
 
-        # Read the file and look for &id= and &dipinstallpath=
-        with open(manifest, "r") as f:
-            manifest_query = f.read()
-        url = parse.urlparse(manifest_query)
-        query = parse.parse_qs(url.query)
-        if "id" not in query:
-            # If id is not present, we have no clue what to do.
-            continue
-        if "dipinstallpath" not in query:
-            # We could query the Origin server for the install location but... no?
+    cache = load_cache(MANIFEST_CACHE_NAME, MANIFEST_CACHE_VERSION)
+    updated_cache: Dict[str, Any] = {}
+
+    local_content_path = find_local_content_path()
+    for manifest in _walk_local_content(local_content_path):
+        if remaining is not None and not remaining:
+            break
+
+        # Skip folders and any manifest file with '@steam'
+        if manifest.is_dir(follow_symlinks=False) or "@steam" in manifest.name.lower():
             continue
 
-        for id_ in query["id"]:
-            for path_ in query["dipinstallpath"]:
-                games[id_] = Path(path_)
+        try:
+            stat = manifest.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+            entry = cache.get(manifest.path)
+            if not isinstance(entry, dict) or entry.get("signature") != signature:
+                entry = {
+                    "signature": signature,
+                    "games": _parse_manifest(manifest.path),
+                }
+        except (OSError, ValueError) as e:
+            print(
+                f'Unable to read Origin manifest "{manifest.path}": {e}',
+                file=sys.stderr,
+            )
+            continue
+        updated_cache[manifest.path] = entry
+
+        for id_, path_ in entry["games"]:
+            if remaining is not None:
+                if id_ not in remaining:
+                    continue
+                remaining.discard(id_)
+            games[id_] = Path(path_)
+
+    # Manifests that were not reached (early stop) are kept in the cache:
+    if remaining is not None:
+        updated_cache = cache | updated_cache
+    if updated_cache != cache:
+        save_cache(MANIFEST_CACHE_NAME, MANIFEST_CACHE_VERSION, updated_cache)
 
     return games
 
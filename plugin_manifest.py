@@ -0,0 +1,175 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Any, TypedDict
+
+import mobase
+
+from .basic_game import BasicGame
+from .cache_utils import file_signature, load_cache, save_cache
+
+# Name and version of the manifest cache, the version must be bumped whenever the
+# format of the manifest changes:
+MANIFEST_CACHE_NAME = "plugin_manifest.json"
+MANIFEST_CACHE_VERSION = 1
+
+# Names of the static attributes that are not prefixed by Game:
+_PLUGIN_ATTRIBUTES = ("Name", "Author", "Version", "Description")
+
+
+class GameClassInfo(TypedDict):
+    # Name of the game class in its module:
+    name: str
+
+    # Names of the extra mobase interfaces implemented by the class, e.g.
+    # IPluginFileMapper:
+    interfaces: list[str]
+
+    # Interface methods overridden by the class or one of its parent below BasicGame:
+    methods: list[str]
+
+    # Attributes of the class (GameName, GameSteamId, ...), values that cannot be
+    # stored in JSON are stored as None:
+    metadata: dict[str, Any]
+
+
+class GameModuleInfo(TypedDict):
+    # Signatures of the files the information was extracted from, i.e. the module
+    # itself and the modules containing the parent classes of its games:
+    signatures: dict[str, list[int] | None]
+
+    # Game classes defined in the module:
+    classes: list[GameClassInfo]
+
+
+def _signatures(files: list[str]) -> dict[str, list[int] | None]:
+    return {
+        file: list(signature) if (signature := file_signature(file)) else None
+        for file in files
+    }
+
+
+def _is_static_value(value: Any) -> bool:
+    if isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, list):
+        return all(isinstance(v, (str, int)) for v in value)  # pyright: ignore
+    return False
+
+
+def _interfaces(cls: type[BasicGame]) -> list[type]:
+    return [
+        base
+        for base in cls.__mro__
+        if base.__module__ == "mobase" and base not in mobase.IPluginGame.__mro__
+    ]
+
+
+def _class_info(cls: type[BasicGame]) -> GameClassInfo:
+    interfaces = _interfaces(cls)
+
+    names = {"_featureList"}
+    for interface in (mobase.IPluginGame, *interfaces):
+        names.update(name for name in dir(interface) if not name.startswith("_"))
+
+    methods: set[str] = set()
+    for base in cls.__mro__:
+        if base is BasicGame or not issubclass(base, BasicGame):
+            continue
+        methods.update(name for name in vars(base) if name in names)
+
+    metadata: dict[str, Any] = {}
+    for name in dir(cls):
+        if name.startswith("Game") or name in _PLUGIN_ATTRIBUTES:
+            value = getattr(cls, name)
+            metadata[name] = value if _is_static_value(value) else None
+
+    return {
+        "name": cls.__name__,
+        "interfaces": [interface.__name__ for interface in interfaces],
+        "methods": sorted(methods),
+        "metadata": metadata,
+    }
+
+
+def _scan_module(package: str | None, module_name: str) -> GameModuleInfo | None:
+    try:
+        module = importlib.import_module(".games." + module_name, package)
+    except Exception as e:
+        print("Failed to import module {}: {}".format(module_name, e), file=sys.stderr)
+        return None
+
+    files: set[str] = {
+        str(module.__file__),
+        str(sys.modules[BasicGame.__module__].__file__),
+    }
+    classes: list[GameClassInfo] = []
+
+    for name in dir(module):
+        obj = getattr(module, name)
+
+        # Only consider classes defined in this module, classes imported from other
+        # modules are listed by their own module:
+        if (
+            not isinstance(obj, type)
+            or not issubclass(obj, BasicGame)
+            or obj.__module__ != module.__name__
+        ):
+            continue
+
+        # Instantiate the game once to make sure that it is valid, the instance
+        # is not kept:
+        try:
+            obj()
+        except Exception as e:
+            print("Failed to instantiate {}: {}".format(name, e), file=sys.stderr)
+            continue
+
+        classes.append(_class_info(obj))
+        for base in obj.__mro__:
+            if issubclass(base, BasicGame) and base is not BasicGame:
+                files.add(str(sys.modules[base.__module__].__file__))
+
+    return {"signatures": _signatures(sorted(files)), "classes": classes}
+
+
+def load_manifest(games_path: Path, package: str | None) -> dict[str, GameModuleInfo]:
+    """
+    Load the manifest of the python game plugins, updating the cached manifest for
+    modules that changed since it was generated.
+
+    Only modules that are new or changed are imported, other modules are described
+    by the cached manifest.
+
+    Args:
+        games_path: Path to the folder containing the game modules.
+        package: Name of the basic games package.
+
+    Returns:
+        A mapping from module name (relative to the games package) to the
+        description of the game classes in the module.
+    """
+    cached = load_cache(MANIFEST_CACHE_NAME, MANIFEST_CACHE_VERSION)
+
+    manifest: dict[str, GameModuleInfo] = {}
+    for file in sorted(games_path.glob("*.py")):
+        module_name = file.stem
+        if module_name == "__init__":
+            continue
+
+        info: GameModuleInfo | None = cached.get(module_name)
+        if info is None or _signatures(list(info["signatures"])) != info["signatures"]:
+            info = _scan_module(package, module_name)
+            if info is None:
+                continue
+
+        manifest[module_name] = info
+
+    if manifest != cached:
+        save_cache(MANIFEST_CACHE_NAME, MANIFEST_CACHE_VERSION, dict(manifest))
+
+    return manifest
@@ -0,0 +1,416 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import codecs
+import json
+import os
+import re
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+# Registry trees read by the store modules, with the depth of sub-keys to read (0 for
+# the values of the key only). All these trees are read at once, the first time the
+# registry is accessed, and cached for the session:
+REGISTRY_TREES = {
+    r"HKEY_CURRENT_USER\Software\Valve\Steam": 0,
+    r"HKEY_LOCAL_MACHINE\Software\Wow6432Node\GOG.com\Games": 1,
+    r"HKEY_LOCAL_MACHINE\Software\Wow6432Node\Epic Games\EpicGamesLauncher": 0,
+}
+
+# Environment variable containing the path to a registry file (.json or .reg) to use
+# instead of the Windows registry, e.g. for benchmarks or tests:
+REGISTRY_FILE_ENVIRON = "BASIC_GAMES_REGISTRY"
+
+
+def _split_path(path: str) -> list[str]:
+    return [part for part in path.split("\\") if part]
+
+
+class RegistryKey:
+
+    """
+    Read-only snapshot of a registry key, its values and some of its sub-keys.
+    Names of values and sub-keys are case-insensitive, as in the Windows registry.
+    """
+
+    __slots__ = ("name", "_values", "_subkeys")
+
+    def __init__(
+        self,
+        name: str,
+        values: Mapping[str, Any] | None = None,
+        subkeys: Iterable[RegistryKey] = (),
+    ):
+        self.name = name
+        self._values = {k.casefold(): v for k, v in (values or {}).items()}
+        self._subkeys = {subkey.name.casefold(): subkey for subkey in subkeys}
+
+    def value(self, name: str) -> Any | None:
+        """
+        Args:
+            name: Name of the value, empty for the default value of the key.
+
+        Returns:
+            The data of the value, or None if the value does not exist.
+        """
+        return self._values.get(name.casefold())
+
+    def subkey(self, path: str) -> RegistryKey | None:
+        """
+        Args:
+            path: Path of the sub-key, relative to this key.
+
+        Returns:
+            The sub-key, or None if it does not exist or was not read.
+        """
+        key: RegistryKey | None = self
+        for part in _split_path(path):
+            if key is None:
+                break
+            key = key._subkeys.get(part.casefold())
+        return key
+
+    def subkeys(self) -> list[RegistryKey]:
+        """
+        Returns:
+            The sub-keys of this key that were read.
+        """
+        return list(self._subkeys.values())
+
+    def __repr__(self) -> str:
+        return "RegistryKey({!r}, {} values, {} sub-keys)".format(
+            self.name, len(self._values), len(self._subkeys)
+        )
+
+
+class Registry(ABC):
+
+    """
+    Source of registry keys, e.g. the Windows registry or a registry file.
+    """
+
+    @abstractmethod
+    def read_tree(self, path: str, depth: int) -> RegistryKey | None:
+        """
+        Read a registry key and its sub-keys.
+
+        Args:
+            path: Full path of the key, starting with the name of the root key,
+                e.g. HKEY_LOCAL_MACHINE.
+            depth: Depth of the sub-keys to read, 0 to only read the values of the
+                key.
+
+        Returns:
+            The key, or None if it does not exist.
+        """
+        ...
+
+
+class WindowsRegistry(Registry):
+
+    """
+    Registry reading keys from the Windows registry.
+    """
+
+    def read_tree(self, path: str, depth: int) -> RegistryKey | None:
+        import winreg
+
+        root, *parts = _split_path(path)
+        try:
+            with winreg.OpenKey(getattr(winreg, root.upper()), "\\".join(parts)) as key:
+                return self._read_key(key, parts[-1] if parts else root, depth)
+        except (FileNotFoundError, AttributeError):
+            return None
+
+    def _read_key(self, key: Any, name: str, depth: int) -> RegistryKey:
+        import winreg
+
+        nsubkeys, nvalues, _ = winreg.QueryInfoKey(key)
+
+        values: dict[str, Any] = {}
+        for index in range(nvalues):
+            value_name, data, _ = winreg.EnumValue(key, index)
+            values[value_name] = data
+
+        subkeys: list[RegistryKey] = []
+        if depth > 0:
+            for index in range(nsubkeys):
+                subkey_name = winreg.EnumKey(key, index)
+                try:
+                    with winreg.OpenKey(key, subkey_name) as subkey:
+                        subkeys.append(self._read_key(subkey, subkey_name, depth - 1))
+                except OSError:
+                    pass
+
+        return RegistryKey(name, values, subkeys)
+
+
+class FileRegistry(Registry):
+
+    """
+    Registry reading keys from a file, either a JSON file or a registry export
+    (.reg) file.
+
+    The JSON file maps full key paths to keys, where each key is an object with
+    optional "values" (name to data) and "subkeys" (name to key) members, e.g.:
+
+        {
+            "HKEY_LOCAL_MACHINE\\Software\\Wow6432Node\\GOG.com\\Games": {
+                "subkeys": {"1207658924": {"values": {"path": "C:\\GOG Games\\X"}}}
+            }
+        }
+    """
+
+    # Tree of the registry as nested (values, sub-keys) dictionaries, indexed by
+    # case-folded names:
+    _root: dict[str, Any]
+
+    def __init__(self, path: Path | str):
+        """
+        Args:
+            path: Path to the registry file, files with the .reg extension are read
+                as registry exports, other files as JSON.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is invalid.
+        """
+        self._root = self._new_node("")
+        path = Path(path)
+        if path.suffix.lower() == ".reg":
+            self._load_reg(path.read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as fp:
+                self._load_json(json.load(fp))
+
+    @staticmethod
+    def _new_node(name: str) -> dict[str, Any]:
+        return {"name": name, "values": {}, "subkeys": {}}
+
+    def _node(self, path: str, create: bool = False) -> dict[str, Any] | None:
+        node = self._root
+        for part in _split_path(path):
+            subkeys: dict[str, Any] = node["subkeys"]
+            if part.casefold() not in subkeys:
+                if not create:
+                    return None
+                subkeys[part.casefold()] = self._new_node(part)
+            node = subkeys[part.casefold()]
+        return node
+
+    def _load_json_key(self, node: dict[str, Any], content: Any):
+        if not isinstance(content, dict):
+            raise ValueError(f"Invalid registry key: {content!r}")
+        node["values"].update(content.get("values", {}))  # pyright: ignore
+        for name, subkey in content.get("subkeys", {}).items():  # pyright: ignore
+            child = node["subkeys"].setdefault(name.casefold(), self._new_node(name))
+            self._load_json_key(child, subkey)
+
+    def _load_json(self, content: Any):
+        if not isinstance(content, dict):
+            raise ValueError("Invalid registry file, expected an object.")
+        for path, key in content.items():  # pyright: ignore[reportUnknownVariableType]
+            node = self._node(str(path), create=True)  # pyright: ignore
+            assert node is not None
+            self._load_json_key(node, key)
+
+    def _load_reg(self, data: bytes):
+        # regedit exports files in UTF-16 with a BOM, older exports are ANSI:
+        if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            text = data.decode("utf-16")
+        else:
+            text = data.decode("utf-8-sig", errors="replace")
+
+        # join the continuation lines of hex values:
+        text = re.sub(r"\\\r?\n\s*", "", text)
+
+        node: dict[str, Any] | None = None
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith(";"):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                path = line[1:-1]
+                # deleted keys, i.e. [-HKEY_...], are ignored:
+                node = None if path.startswith("-") else self._node(path, create=True)
+                continue
+            if node is None or "=" not in line:
+                continue
+            match = _REG_VALUE.match(line)
+            if match is None:
+                continue
+            name = "" if match["default"] else _reg_unescape(match["name"])
+            data = _reg_data(match["data"])
+            if data is not None:
+                node["values"][name] = data
+
+    def _to_key(self, node: dict[str, Any], depth: int) -> RegistryKey:
+        subkeys: list[RegistryKey] = []
+        if depth > 0:
+            subkeys = [
+                self._to_key(child, depth - 1) for child in node["subkeys"].values()
+            ]
+        return RegistryKey(node["name"], node["values"], subkeys)
+
+    def read_tree(self, path: str, depth: int) -> RegistryKey | None:
+        node = self._node(path)
+        if node is None:
+            return None
+        return self._to_key(node, depth)
+
+
+# A value line of a .reg file, "name"=data or @=data for the default value:
+_REG_VALUE = re.compile(
+    r'^(?:(?P<default>@)|"(?P<name>(?:\\.|[^\\"])*)")\s*=\s*(?P<data>.*)$'
+)
+
+
+def _reg_unescape(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def _reg_data(data: str) -> Any | None:
+    """
+    Convert the data of a value from a .reg file, returns None for deleted values
+    and unsupported types.
+    """
+    if data.startswith('"') and data.endswith('"'):
+        return _reg_unescape(data[1:-1])
+    if data.lower().startswith("dword:"):
+        return int(data[6:], 16)
+    if data.lower().startswith("hex"):
+        _, _, content = data.partition(":")
+        return bytes(int(b, 16) for b in content.split(",") if b.strip())
+    return None
+
+
+class RegistrySnapshot:
+
+    """
+    Cache of the registry trees read by the store modules.
+
+    The trees listed in REGISTRY_TREES are read all at once on first access, other
+    keys are read on demand and cached, until the cache is cleared.
+    """
+
+    def __init__(self, registry: Registry, trees: Mapping[str, int] = REGISTRY_TREES):
+        self._registry = registry
+        self._trees = dict(trees)
+        self._keys: dict[str, RegistryKey | None] | None = None
+        self._lock = threading.Lock()
+
+    def _read_trees(self) -> dict[str, RegistryKey | None]:
+        keys: dict[str, RegistryKey | None] = {}
+        for path, depth in self._trees.items():
+            try:
+                keys[path.casefold()] = self._registry.read_tree(path, depth)
+            except OSError as e:
+                print(f'Unable to read registry key "{path}": {e}', file=sys.stderr)
+                keys[path.casefold()] = None
+        return keys
+
+    def clear(self) -> None:
+        """
+        Discard the keys read so far, they are read again on next access.
+        """
+        with self._lock:
+            self._keys = None
+
+    def key(self, path: str) -> RegistryKey | None:
+        """
+        Retrieve a registry key.
+
+        Args:
+            path: Full path of the key, e.g. HKEY_CURRENT_USER\\Software\\Valve\\Steam.
+
+        Returns:
+            The key, or None if it does not exist. Only the sub-keys of trees listed
+            in REGISTRY_TREES are available.
+        """
+        parts = _split_path(path)
+        folded = "\\".join(parts).casefold()
+
+        with self._lock:
+            if self._keys is None:
+                self._keys = self._read_trees()
+
+            if folded in self._keys:
+                return self._keys[folded]
+
+            # the key may be in one of the trees, if the tree is deep enough:
+            for tree_path, depth in self._trees.items():
+                tree_parts = _split_path(tree_path)
+                if (
+                    len(tree_parts) < len(parts) <= len(tree_parts) + depth
+                    and "\\".join(parts[: len(tree_parts)]).casefold()
+                    == tree_path.casefold()
+                ):
+                    tree = self._keys[tree_path.casefold()]
+                    if tree is None:
+                        return None
+                    return tree.subkey("\\".join(parts[len(tree_parts) :]))
+
+            try:
+                key = self._registry.read_tree(path, 0)
+            except OSError as e:
+                print(f'Unable to read registry key "{path}": {e}', file=sys.stderr)
+                key = None
+            self._keys[folded] = key
+            return key
+
+
+_snapshot: RegistrySnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def set_registry(registry: Registry | None) -> None:
+    """
+    Set the registry used by the store modules, and clear the session cache.
+
+    Args:
+        registry: The registry to use, or None to use the default registry (the
+            Windows registry, unless REGISTRY_FILE_ENVIRON is set).
+    """
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None if registry is None else RegistrySnapshot(registry)
+
+
+def _default_registry() -> Registry:
+    if path := os.environ.get(REGISTRY_FILE_ENVIRON):
+        return FileRegistry(path)
+    return WindowsRegistry()
+
+
+def read_key(path: str) -> RegistryKey | None:
+    """
+    Read a registry key from the session cache of the registry.
+
+    Args:
+        path: Full path of the key, e.g. HKEY_CURRENT_USER\\Software\\Valve\\Steam.
+
+    Returns:
+        The key, or None if it does not exist.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None:
+            _snapshot = RegistrySnapshot(_default_registry())
+        snapshot = _snapshot
+    return snapshot.key(path)
+
+
+def refresh_registry() -> None:
+    """
+    Discard the registry keys cached so far, so that they are read again from the
+    registry on next access, e.g. before a store is scanned again.
+    """
+    with _snapshot_lock:
+        snapshot = _snapshot
+    if snapshot is not None:
+        snapshot.clear()
@@ -0,0 +1,554 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+import weakref
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import mobase
+from PyQt6.QtCore import QCoreApplication, QFileSystemWatcher, QObject, pyqtSignal
+
+# Default maximum depth of the folders scanned for saves, below the saves directory:
+SAVE_MAX_DEPTH = 8
+
+# Flags of the pattern regexes, patterns are case-insensitive on case-insensitive
+# file systems, as with Path.glob():
+_PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+class SaveEntry(NamedTuple):
+    # Path to the file or folder:
+    path: Path
+
+    # Result of stat() on the entry, as cached by os.scandir(), or None if the entry
+    # could not be stat'ed:
+    stat: os.stat_result | None
+
+
+def _translate(part: str) -> str:
+    # Translate a component of a glob pattern to a regex, wildcards never match the
+    # path separator:
+    regex: list[str] = []
+    index = 0
+    while index < len(part):
+        c = part[index]
+        index += 1
+        if c == "*":
+            regex.append("[^/]*")
+        elif c == "?":
+            regex.append("[^/]")
+        elif c == "[" and (end := part.find("]", index + 1)) != -1:
+            content = part[index:end].replace("\\", "\\\\")
+            if content.startswith("!"):
+                content = "^" + content[1:]
+            regex.append(f"[{content}]")
+            index = end + 1
+        else:
+            regex.append(re.escape(c))
+    return "".join(regex)
+
+
+class SavePattern:
+
+    """
+    Glob pattern relative to the saves directory, e.g. "**/*.sav" or
+    "characters/*.fch". "**" matches any number of folders, including none.
+    """
+
+    __slots__ = ("pattern", "_parts", "_folders", "_regex")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._parts = tuple(pattern.replace("\\", "/").split("/"))
+
+        # regexes of the folder components, None for "**":
+        self._folders = tuple(
+            None if part == "**" else re.compile(_translate(part), _PATTERN_FLAGS)
+            for part in self._parts[:-1]
+        )
+
+        regex: list[str] = []
+        for part in self._parts[:-1]:
+            regex.append("(?:[^/]+/)*" if part == "**" else _translate(part) + "/")
+        regex.append(_translate(self._parts[-1]))
+        self._regex = re.compile("".join(regex), _PATTERN_FLAGS)
+
+    @property
+    def depth(self) -> int | None:
+        """
+        Depth of the folders matched by this pattern, None if the pattern contains
+        "**".
+        """
+        if "**" in self._parts:
+            return None
+        return len(self._parts) - 1
+
+    def matches(self, relative_path: str) -> bool:
+        """
+        Args:
+            relative_path: Path relative to the saves directory, with / separators.
+
+        Returns:
+            True if the path matches this pattern.
+        """
+        return self._regex.fullmatch(relative_path) is not None
+
+    def can_descend(self, folders: Sequence[str]) -> bool:
+        """
+        Args:
+            folders: Names of the folders leading to a folder, relative to the saves
+                directory.
+
+        Returns:
+            True if entries in the folder may match this pattern.
+        """
+        for index, name in enumerate(folders):
+            if index >= len(self._folders):
+                return False
+            regex = self._folders[index]
+            if regex is None:
+                return True
+            if regex.fullmatch(name) is None:
+                return False
+        return True
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> SavePattern:
+    """Compile a glob pattern, patterns are cached."""
+    return SavePattern(pattern)
+
+
+def _scan_directory(
+    path: str,
+    folders: tuple[str, ...],
+    patterns: Sequence[SavePattern],
+    max_depth: int,
+) -> tuple[list[tuple[int, SaveEntry]], list[tuple[str, tuple[str, ...]]]]:
+    """
+    Scan a single directory.
+
+    Returns:
+        The (index of the pattern, entry) matches in the directory, and the (path,
+        folders) of the sub-directories to scan.
+
+    Raises:
+        OSError: If the directory cannot be listed.
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+
+    matches: list[tuple[int, SaveEntry]] = []
+    subdirectories: list[tuple[str, tuple[str, ...]]] = []
+
+    prefix = "".join(name + "/" for name in folders)
+    for entry in entries:
+        relative_path = prefix + entry.name
+
+        stat: os.stat_result | None = None
+        for index, pattern in enumerate(patterns):
+            if pattern.matches(relative_path):
+                if stat is None:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        pass
+                matches.append((index, SaveEntry(Path(entry.path), stat)))
+
+        if len(folders) >= max_depth:
+            continue
+
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+
+        if is_dir:
+            subfolders = (*folders, entry.name)
+            if any(pattern.can_descend(subfolders) for pattern in patterns):
+                subdirectories.append((entry.path, subfolders))
+
+    return matches, subdirectories
+
+
+def _effective_depth(patterns: Sequence[SavePattern], max_depth: int) -> int:
+    # Patterns without ** do not need to go deeper than their own depth:
+    depths = [pattern.depth for pattern in patterns]
+    if None in depths or not depths:
+        return max_depth
+    return min(max_depth, max(d for d in depths if d is not None))
+
+
+def scan_folder(
+    folder: Path | str, patterns: Sequence[str], max_depth: int = SAVE_MAX_DEPTH
+) -> list[list[SaveEntry]]:
+    """
+    Find the entries matching several glob patterns in a single traversal of a
+    folder.
+
+    Only the folders that can contain matches are visited, e.g. a "characters/*.fch"
+    pattern only visits the "characters" folder.
+
+    Args:
+        folder: Folder to scan.
+        patterns: Glob patterns relative to the folder, see SavePattern.
+        max_depth: Maximum depth of the folders to visit, 0 to only list the entries
+            of the folder itself.
+
+    Returns:
+        The entries matching each pattern, in the order of the patterns. An entry
+        may match several patterns.
+    """
+    compiled = [compile_pattern(pattern) for pattern in patterns]
+    results: list[list[SaveEntry]] = [[] for _ in compiled]
+    max_depth = _effective_depth(compiled, max_depth)
+
+    stack: list[tuple[str, tuple[str, ...]]] = [(os.fspath(folder), ())]
+    while stack and compiled:
+        path, folders = stack.pop()
+        try:
+            matches, subdirectories = _scan_directory(
+                path, folders, compiled, max_depth
+            )
+        except OSError:
+            continue
+        for index, entry in matches:
+            results[index].append(entry)
+        stack.extend(subdirectories)
+
+    return results
+
+
+def _signature(entry: SaveEntry) -> tuple[int, int] | None:
+    if entry.stat is None:
+        return None
+    return entry.stat.st_mtime_ns, entry.stat.st_size
+
+
+@dataclass(frozen=True)
+class SaveIndexDiff:
+    # Saves found by the update:
+    added: tuple[mobase.ISaveGame, ...] = ()
+
+    # Saves that no longer exist:
+    removed: tuple[mobase.ISaveGame, ...] = ()
+
+    # Saves that were modified, as (previous save, new save):
+    modified: tuple[tuple[mobase.ISaveGame, mobase.ISaveGame], ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+class SaveIndex(QObject):
+
+    """
+    Index of the saves matching several glob patterns in a folder.
+
+    The folder is scanned entirely on the first update. The scanned directories are
+    then watched, and later updates only scan again the directories that changed,
+    and check the signature of the indexed saves, since the watches do not report
+    files rewritten in place. Save objects are created by a factory, and are kept
+    for saves that did not change (same modification time and size), so that their
+    parsed metadata is reused.
+    """
+
+    # Emitted when a change is detected in the folder, the index itself is only
+    # updated by the next call to update() or saves():
+    changed = pyqtSignal()
+
+    # Open indices, see find_neighbours():
+    _open: weakref.WeakSet[SaveIndex] = weakref.WeakSet()
+
+    def __init__(
+        self,
+        folder: Path | str,
+        patterns: Sequence[str],
+        factory: Callable[[int, SaveEntry], mobase.ISaveGame],
+        max_depth: int = SAVE_MAX_DEPTH,
+        parent: QObject | None = None,
+    ):
+        """
+        Args:
+            folder: Folder containing the saves.
+            patterns: Glob patterns of the saves, relative to the folder, see
+                SavePattern.
+            factory: Function creating a save from the index of the pattern it
+                matched and its entry.
+            max_depth: Maximum depth of the folders to visit.
+            parent: Parent of the index.
+        """
+        super().__init__(parent)
+
+        self._folder = os.fspath(folder)
+        self._patterns = [compile_pattern(pattern) for pattern in patterns]
+        self._max_depth = _effective_depth(self._patterns, max_depth)
+        self._factory = factory
+
+        # Scanned directories, with their folders relative to the indexed folder:
+        self._directories: dict[str, tuple[str, ...]] = {}
+
+        # Saves in each scanned directory, by (index of the pattern, path), with the
+        # signature of their entry:
+        self._saves: dict[
+            str,
+            dict[tuple[int, str], tuple[tuple[int, int] | None, mobase.ISaveGame]],
+        ] = {}
+
+        # Directories that changed since the last update, or None if the whole
+        # folder must be scanned, e.g. on the first update:
+        self._dirty: set[str] | None = None
+
+        # Changes found by the current update:
+        self._added: list[mobase.ISaveGame] = []
+        self._removed: list[mobase.ISaveGame] = []
+        self._modified: list[tuple[mobase.ISaveGame, mobase.ISaveGame]] = []
+
+        self._last_diff = SaveIndexDiff()
+
+        # Saves from the newest to the oldest, and position of each save in this
+        # list by id, computed when needed, see neighbours():
+        self._ordered: list[mobase.ISaveGame] | None = None
+        self._positions: dict[int, int] = {}
+
+        # Changes cannot be notified without an application, in which case the
+        # folder is scanned on every update:
+        self._watcher: QFileSystemWatcher | None = None
+        if QCoreApplication.instance() is not None:
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        SaveIndex._open.add(self)
+
+    @property
+    def last_diff(self) -> SaveIndexDiff:
+        """The changes found by the last update."""
+        return self._last_diff
+
+    def saves(self) -> list[mobase.ISaveGame]:
+        """
+        Update the index and return the saves.
+
+        Returns:
+            The saves in the folder.
+        """
+        self.update()
+        return [save for saves in self._saves.values() for _, save in saves.values()]
+
+    def update(self) -> SaveIndexDiff:
+        """
+        Update the index, only the directories that changed since the last update
+        are scanned.
+
+        Returns:
+            The changes since the last update.
+        """
+        dirty, self._dirty = self._dirty, set()
+        if self._watcher is None or dirty is None:
+            self._scan_all()
+        else:
+            # parents first, so that removed trees are not scanned:
+            for path in sorted(dirty, key=lambda p: len(self._directories.get(p, ()))):
+                if (folders := self._directories.get(path)) is not None:
+                    self._scan_tree(path, folders, full=False)
+            # watches of directories only report added, removed or renamed entries,
+            # so files rewritten in place (e.g. quicksaves) are found by their
+            # signature:
+            self._check_modified()
+
+        self._last_diff = SaveIndexDiff(
+            tuple(self._added), tuple(self._removed), tuple(self._modified)
+        )
+        if self._last_diff:
+            self._ordered = None
+        self._added, self._removed, self._modified = [], [], []
+        return self._last_diff
+
+    def close(self):
+        """
+        Stop watching the folder and release the saves, the index must not be used
+        afterwards.
+        """
+        if self._watcher is not None:
+            self._watcher.directoryChanged.disconnect(self._on_directory_changed)
+            if directories := self._watcher.directories():
+                self._watcher.removePaths(directories)
+            self._watcher.deleteLater()
+            self._watcher = None
+        self._directories.clear()
+        self._saves.clear()
+        self._ordered = None
+        SaveIndex._open.discard(self)
+
+    def neighbours(self, save: mobase.ISaveGame) -> list[mobase.ISaveGame]:
+        """
+        Find the saves listed before and after the given one, by modification time,
+        i.e. the saves most likely to be displayed next. The folder is not scanned,
+        only the saves found by the last update are considered.
+
+        Args:
+            save: A save returned by this index.
+
+        Returns:
+            The saves next to the given one, the older one first, or an empty list
+            if the save is not in this index.
+        """
+        if self._ordered is None:
+            entries = [
+                (signature[0] if signature else 0, indexed)
+                for saves in self._saves.values()
+                for signature, indexed in saves.values()
+            ]
+            entries.sort(key=lambda entry: entry[0], reverse=True)
+            self._ordered = [indexed for _, indexed in entries]
+            self._positions = {
+                id(indexed): i for i, indexed in enumerate(self._ordered)
+            }
+
+        position = self._positions.get(id(save))
+        if position is None or self._ordered[position] is not save:
+            return []
+        return [
+            self._ordered[i]
+            for i in (position + 1, position - 1)
+            if 0 <= i < len(self._ordered)
+        ]
+
+    @classmethod
+    def find_neighbours(cls, save: mobase.ISaveGame) -> list[mobase.ISaveGame]:
+        """
+        Find the saves next to the given one in the open index containing it, see
+        neighbours().
+
+        Args:
+            save: A save.
+
+        Returns:
+            The saves next to the given one, or an empty list if the save is not in
+            an open index.
+        """
+        for index in list(cls._open):
+            if neighbours := index.neighbours(save):
+                return neighbours
+        return []
+
+    def _on_directory_changed(self, path: str):
+        if self._dirty is not None:
+            self._dirty.add(path)
+        self.changed.emit()
+
+    def _scan_all(self):
+        visited = self._scan_tree(self._folder, (), full=True)
+        for path in list(self._directories):
+            if path not in visited:
+                self._remove_directory(path)
+
+    def _scan_tree(self, path: str, folders: tuple[str, ...], full: bool) -> set[str]:
+        # Scan a directory, and its sub-directories that were not scanned before, or
+        # all of them if full is True:
+        visited: set[str] = set()
+        stack = [(path, folders)]
+        while stack:
+            path, folders = stack.pop()
+            try:
+                matches, subdirectories = _scan_directory(
+                    path, folders, self._patterns, self._max_depth
+                )
+            except OSError:
+                self._remove_tree(path)
+                if path == self._folder:
+                    # the folder is not watched anymore, it is scanned again
+                    # entirely on the next update:
+                    self._dirty = None
+                continue
+
+            visited.add(path)
+            self._update_directory(path, folders, matches)
+
+            if not full:
+                children = {subdirectory for subdirectory, _ in subdirectories}
+                for child, child_folders in list(self._directories.items()):
+                    if (
+                        len(child_folders) == len(folders) + 1
+                        and child_folders[:-1] == folders
+                        and child not in children
+                    ):
+                        self._remove_tree(child)
+
+            stack.extend(
+                (subdirectory, subfolders)
+                for subdirectory, subfolders in subdirectories
+                if full or subdirectory not in self._directories
+            )
+        return visited
+
+    def _update_directory(
+        self,
+        path: str,
+        folders: tuple[str, ...],
+        matches: list[tuple[int, SaveEntry]],
+    ):
+        previous = self._saves.get(path, {})
+        saves: dict[
+            tuple[int, str], tuple[tuple[int, int] | None, mobase.ISaveGame]
+        ] = {}
+        for index, entry in matches:
+            key = (index, str(entry.path))
+            signature = _signature(entry)
+            old = previous.pop(key, None)
+            if old is not None and signature is not None and old[0] == signature:
+                saves[key] = old
+                continue
+
+            save = self._factory(index, entry)
+            saves[key] = (signature, save)
+            if old is None:
+                self._added.append(save)
+            else:
+                self._modified.append((old[1], save))
+
+        self._removed.extend(save for _, save in previous.values())
+        self._saves[path] = saves
+
+        if path not in self._directories:
+            self._directories[path] = folders
+            if self._watcher is not None and not self._watcher.addPath(path):
+                # changes in this directory would be missed, so the folder is
+                # scanned entirely on every update:
+                self._watcher.deleteLater()
+                self._watcher = None
+
+    def _check_modified(self):
+        for saves in self._saves.values():
+            for key, (signature, save) in list(saves.items()):
+                index, path = key
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # removed files are found by the scan of their directory:
+                    continue
+                entry = SaveEntry(Path(path), stat)
+                if _signature(entry) != signature:
+                    new_save = self._factory(index, entry)
+                    saves[key] = (_signature(entry), new_save)
+                    self._modified.append((save, new_save))
+
+    def _remove_directory(self, path: str):
+        self._directories.pop(path, None)
+        self._removed.extend(save for _, save in self._saves.pop(path, {}).values())
+        if self._watcher is not None:
+            self._watcher.removePath(path)
+
+    def _remove_tree(self, path: str):
+        folders = self._directories.get(path)
+        if folders is None:
+            return
+        for child, child_folders in list(self._directories.items()):
+            if child_folders[: len(folders)] == folders:
+                self._remove_directory(child)
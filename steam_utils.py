@@ -1,12 +1,18 @@
 # Code greatly inspired by https://github.com/LostDragonist/steam-library-setup-tool
 
+import os
+import re
 import sys
-import winreg
+import threading
+from collections.abc import Collection, Iterable, Iterator
 from pathlib import Path
 from typing import TypedDict, cast
 
 import vdf  # pyright: ignore[reportMissingTypeStubs]
 
+from .cache_utils import FileSignature, file_signature
+from .registry_utils import read_key
+
 
 class SteamGame:
     def __init__(self, appid: str, installdir: str):
@@ -20,17 +26,129 @@ class SteamGame:
         return "{} ({})".format(self.appid, self.installdir)
 
 
-class _AppState(TypedDict):
-    appid: str
-    installdir: str
+# Tokens of the text VDF format: quoted string (possibly escaped), unquoted string,
+# block delimiter or comment, leading whitespaces are skipped:
+_VDF_TOKEN = re.compile(
+    r'\s*(?:"(?P<quoted>(?:\\.|[^\\"])*)"|(?P<brace>[{}])|//.*|(?P<bare>[^\s{}"]+))'
+)
+_VDF_ESCAPE = re.compile(r"\\([ntvbrfa\\?\"'])")
+_VDF_ESCAPES = {
+    "n": "\n",
+    "t": "\t",
+    "v": "\v",
+    "b": "\b",
+    "r": "\r",
+    "f": "\f",
+    "a": "\a",
+}
+
+
+def _vdf_unescape(value: str) -> str:
+    return _VDF_ESCAPE.sub(lambda m: _VDF_ESCAPES.get(m[1], m[1]), value)
+
+
+def _vdf_tokens(fp: Iterable[str]) -> Iterator[tuple[str, bool]]:
+    """
+    Tokenize a text VDF file, reading it line by line.
 
+    Yields:
+        (token, is_string) pairs, where token is either an unescaped string or a
+        block delimiter.
+    """
+    # start of a quoted string spanning multiple lines:
+    pending = ""
+
+    for lineno, line in enumerate(fp):
+        if lineno == 0:
+            line = line.lstrip("\ufeff")
+        line, pending = pending + line, ""
+
+        position = 0
+        while match := _VDF_TOKEN.match(line, position):
+            position = match.end()
+            if (quoted := match["quoted"]) is not None:
+                yield _vdf_unescape(quoted), True
+            elif (brace := match["brace"]) is not None:
+                yield brace, False
+            elif (bare := match["bare"]) is not None:
+                yield bare, True
+
+        if line[position:].strip():
+            pending = line[position:]
+
+    if pending:
+        raise ValueError("Unexpected end of file in quoted string")
+
+
+def read_acf_values(
+    fp: Iterable[str], keys: Collection[str], section: str = "AppState"
+) -> dict[str, str]:
+    """
+    Read some values of a top-level section of an application manifest (.acf).
 
-class _AppManifest(TypedDict):
-    AppState: _AppState
+    Contrary to vdf.load(), the manifest is read line by line and only until all
+    the requested values are found, and nested blocks (InstalledDepots, UserConfig,
+    ...) are skipped without being stored. Keys are compared case-insensitively,
+    as Steam does.
+
+    Args:
+        fp: The manifest, as an iterable of lines, e.g. an opened text file.
+        keys: Keys of the values to read from the section.
+        section: Name of the top-level section containing the values.
+
+    Returns:
+        A mapping from key (as requested) to value, for the keys found in the
+        section.
+
+    Raises:
+        ValueError: If the manifest is invalid.
+    """
+    wanted = {key.casefold(): key for key in keys}
+    values: dict[str, str] = {}
+
+    # depth of the current block, and depth of the requested section if entered:
+    depth = 0
+    section_depth: int | None = None
+
+    key: str | None = None
+    for token, is_string in _vdf_tokens(fp):
+        if not is_string:
+            if token == "{":
+                if key is None:
+                    raise ValueError("Unexpected block without key")
+                depth += 1
+                if depth == 1 and key.casefold() == section.casefold():
+                    section_depth = depth
+                key = None
+            else:
+                if depth == 0 or key is not None:
+                    raise ValueError("Unexpected end of block")
+                if depth == section_depth:
+                    # the section is over, there is no need to read further
+                    break
+                depth -= 1
+            continue
+
+        # conditionals, e.g. [$WIN32], are ignored:
+        if key is None and token.startswith("[") and token.endswith("]"):
+            continue
+
+        if key is None:
+            key = token
+            continue
 
+        if depth == section_depth and (name := wanted.get(key.casefold())):
+            values.setdefault(name, token)
+            if len(values) == len(wanted):
+                break
+        key = None
 
-class _LibraryFolder(TypedDict):
+    return values
+
+
+class _LibraryFolder(TypedDict, total=False):
     path: str
+    apps: dict[str, str]
 
 
 class _LibraryFolders(TypedDict, total=False):
@@ -39,39 +157,87 @@ class _LibraryFolders(TypedDict, total=False):
 
 
 class LibraryFolder:
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        wanted: Collection[str] | None = None,
+        app_ids: Collection[str] | None = None,
+    ):
+        """
+        Args:
+            path: Path to the library.
+            wanted: If not None, only read the manifests of these application IDs.
+            app_ids: IDs of the applications installed in the library, from the
+                main library file, or None if unknown (old format), in which case
+                the manifests in the library are listed.
+        """
         self.path = path
-
-        self.games: list[SteamGame] = []
-        for filepath in path.joinpath("steamapps").glob("appmanifest_*.acf"):
-            try:
-                with open(filepath, "r", encoding="utf-8") as fp:
-                    info = cast(
-                        _AppManifest,
-                        vdf.load(fp),  # pyright: ignore[reportUnknownMemberType]
-                    )
-                    app_state = info["AppState"]
-            except KeyError:
-                print(
-                    f'Unable to read application state from "{filepath}"',
-                    file=sys.stderr,
+        self.app_ids = app_ids
+
+        self._wanted = wanted
+        self._games: list[SteamGame] | None = None
+
+    @property
+    def games(self) -> list[SteamGame]:
+        """Games of the library, the manifests are only read on first access."""
+        if self._games is None:
+            self._games = []
+            for app_id in self._list_app_ids():
+                game = self.find_game(app_id)
+                if game is not None:
+                    self._games.append(game)
+        return self._games
+
+    def _list_app_ids(self) -> list[str]:
+        if self.app_ids is not None:
+            app_ids = list(self.app_ids)
+        else:
+            # the manifest file name contains the application ID, so unwanted
+            # manifests can be skipped without opening them
+            app_ids = [
+                filepath.stem.removeprefix("appmanifest_")
+                for filepath in self.path.joinpath("steamapps").glob(
+                    "appmanifest_*.acf"
                 )
-                continue
-            except Exception as e:
-                print(f'Unable to parse file "{filepath}": {e}', file=sys.stderr)
-                continue
+            ]
+        if self._wanted is not None:
+            app_ids = [app_id for app_id in app_ids if app_id in self._wanted]
+        return app_ids
 
-            try:
-                app_id = app_state["appid"]
-                install_dir = app_state["installdir"]
-                self.games.append(SteamGame(app_id, install_dir))
-            except KeyError:
-                print(
-                    f"Unable to read application ID or installation folder "
-                    f'from "{filepath}"',
-                    file=sys.stderr,
-                )
-                continue
+    def manifest_path(self, app_id: str) -> Path:
+        return self.path.joinpath("steamapps", f"appmanifest_{app_id}.acf")
+
+    def find_game(self, app_id: str) -> SteamGame | None:
+        """
+        Read the manifest of the given application.
+
+        Args:
+            app_id: ID of the application.
+
+        Returns:
+            The game, or None if the manifest does not exist or cannot be read.
+        """
+        filepath = self.manifest_path(app_id)
+        try:
+            with open(filepath, "r", encoding="utf-8") as fp:
+                app_state = read_acf_values(fp, ("appid", "installdir"))
+        except FileNotFoundError:
+            # the main library file can list applications that are not fully
+            # installed yet
+            return None
+        except Exception as e:
+            print(f'Unable to parse file "{filepath}": {e}', file=sys.stderr)
+            return None
+
+        try:
+            return SteamGame(app_state["appid"], app_state["installdir"])
+        except KeyError:
+            print(
+                f"Unable to read application ID or installation folder "
+                f'from "{filepath}"',
+                file=sys.stderr,
+            )
+            return None
 
     def __repr__(self):
         return str(self)
@@ -80,18 +246,9 @@ class LibraryFolder:
         return "LibraryFolder at {}: {}".format(self.path, self.games)
 
 
-def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
-    """
-    Read library folders from the main library file.
-
-    Args:
-        library_vdf_path: The main library file (from the Steam installation
-            folder).
-
-    Returns:
-        A list of LibraryFolder, for each library found.
-    """
-
+def _parse_library_folders(
+    library_vdf_path: Path,
+) -> list[tuple[Path, list[str] | None]]:
     with open(library_vdf_path, "r", encoding="utf-8") as f:
         info = cast(
             _LibraryFolders,
@@ -111,7 +268,7 @@ def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
     else:
         raise ValueError(f'Unknown file format from "{library_vdf_path}"')
 
-    library_folders: list[LibraryFolder] = []
+    library_folders: list[tuple[Path, list[str] | None]] = []
 
     for key, value in info_folders.items():
         # only keys that are integer values contains library folder
@@ -121,21 +278,75 @@ def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
             continue
 
         if isinstance(value, str):
-            path = value
+            library_folders.append((Path(value), None))
         else:
-            path = value["path"]
-
-        try:
-            library_folders.append(LibraryFolder(Path(path)))
-        except Exception as e:
-            print(
-                'Failed to read steam library from "{}", {}'.format(path, repr(e)),
-                file=sys.stderr,
+            # the apps section of the new format lists the installed applications,
+            # but is missing from the first versions of the new format
+            apps = value.get("apps")
+            library_folders.append(
+                (Path(value["path"]), None if apps is None else list(apps))
             )
 
     return library_folders
 
 
+def parse_library_paths(library_vdf_path: Path) -> list[Path]:
+    """
+    Read the paths of the library folders from the main library file.
+
+    Args:
+        library_vdf_path: The main library file (from the Steam installation
+            folder).
+
+    Returns:
+        The path of each library found.
+    """
+    return [path for path, _ in _parse_library_folders(library_vdf_path)]
+
+
+def parse_library_info(
+    library_vdf_path: Path, wanted: Collection[str] | None = None
+) -> list[LibraryFolder]:
+    """
+    Read library folders from the main library file.
+
+    With the new format of the main library file, the applications installed in
+    each library are known without listing the library. The application manifests
+    are only read when the games of a library are accessed.
+
+    Args:
+        library_vdf_path: The main library file (from the Steam installation
+            folder).
+        wanted: If not None, only read the manifests of these application IDs.
+
+    Returns:
+        A list of LibraryFolder, for each library found.
+    """
+    return [
+        LibraryFolder(path, wanted, app_ids)
+        for path, app_ids in _parse_library_folders(library_vdf_path)
+    ]
+
+
+def index_libraries(libraries: Iterable[LibraryFolder]) -> dict[str, LibraryFolder]:
+    """
+    Index the applications of the given libraries.
+
+    Args:
+        libraries: Libraries to index, e.g. from parse_library_info().
+
+    Returns:
+        A mapping from application ID to the library containing the application,
+        for the libraries whose applications are known from the main library file.
+    """
+    index: dict[str, LibraryFolder] = {}
+    for library in libraries:
+        if library.app_ids is not None:
+            for app_id in library.app_ids:
+                index.setdefault(app_id, library)
+    return index
+
+
 def find_steam_path() -> Path | None:
     """
     Retrieve the Steam path, if available.
@@ -143,18 +354,208 @@ def find_steam_path() -> Path | None:
     Returns:
         The Steam path, or None if Steam is not installed.
     """
+    key = read_key(r"HKEY_CURRENT_USER\Software\Valve\Steam")
+    if key is None or not (steam_exe := key.value("SteamExe")):
+        return None
+    return Path(steam_exe.replace("/", "\\")).parent
+
+
+# Offset between 64-bit Steam IDs (loginusers.vdf) and account IDs (userdata):
+_STEAM_ID64_BASE = 76561197960265728
+
+
+class SteamUserData:
+
+    """
+    Index of the per-account application folders of Steam, i.e.
+    userdata/<account ID>/<application ID>.
+
+    The folders are listed once, and listed again only when the userdata folder,
+    one of the account folders or the list of logged-in users changes, so lookups
+    do not walk the userdata folder.
+    """
+
+    def __init__(self, steam_path: Path):
+        """
+        Args:
+            steam_path: The Steam installation folder.
+        """
+        self.steam_path = steam_path
+        self.userdata_path = steam_path.joinpath("userdata")
+        self.loginusers_path = steam_path.joinpath("config", "loginusers.vdf")
+
+        self._lock = threading.Lock()
+        self._signature: list[FileSignature | None] | None = None
+
+        # Account folders, most recently used first, and account folders of each
+        # application, in the same order:
+        self._accounts: list[Path] = []
+        self._apps: dict[str, list[Path]] = {}
+
+    def _compute_signature(self) -> list[FileSignature | None]:
+        return [
+            file_signature(path)
+            for path in (self.userdata_path, self.loginusers_path, *self._accounts)
+        ]
+
+    def _most_recent_account(self) -> str | None:
+        try:
+            with open(self.loginusers_path, "r", encoding="utf-8") as fp:
+                users = vdf.load(fp)  # pyright: ignore[reportUnknownMemberType]
+            for steam_id, user in users["users"].items():  # pyright: ignore
+                if user.get("MostRecent") == "1":  # pyright: ignore
+                    return str(int(steam_id) - _STEAM_ID64_BASE)  # pyright: ignore
+        except Exception:
+            pass
+        return None
+
+    def _index(self):
+        accounts: list[tuple[bool, int, Path]] = []
+        most_recent = self._most_recent_account()
+        try:
+            with os.scandir(self.userdata_path) as it:
+                for entry in it:
+                    if entry.name.isdigit() and entry.is_dir():
+                        accounts.append(
+                            (
+                                entry.name == most_recent,
+                                entry.stat().st_mtime_ns,
+                                Path(entry.path),
+                            )
+                        )
+        except OSError:
+            pass
+
+        # the most recently used account first, then by modification time:
+        accounts.sort(key=lambda account: account[:2], reverse=True)
+        self._accounts = [path for _, _, path in accounts]
+
+        self._apps = {}
+        for account in self._accounts:
+            try:
+                with os.scandir(account) as it:
+                    for entry in it:
+                        if entry.name.isdigit() and entry.is_dir():
+                            self._apps.setdefault(entry.name, []).append(account)
+            except OSError:
+                pass
+
+    def _ensure_index(self):
+        signature = self._compute_signature()
+        if signature != self._signature:
+            self._index()
+            # the signature includes the account folders found by the index:
+            self._signature = self._compute_signature()
+
+    def accounts(self) -> list[Path]:
+        """
+        Returns:
+            The account folders, most recently used first.
+        """
+        with self._lock:
+            self._ensure_index()
+            return list(self._accounts)
+
+    def find_app_directory(self, app_id: str | int, *parts: str) -> Path | None:
+        """
+        Find the folder of an application for the most recently used account that
+        has one.
+
+        Args:
+            app_id: Steam ID of the application.
+            parts: Path, inside the application folder, that must exist, e.g.
+                "remote" for cloud saves.
+
+        Returns:
+            The path to the application folder joined with the given parts, or None
+            if no account has it.
+        """
+        with self._lock:
+            self._ensure_index()
+            accounts = self._apps.get(str(app_id), [])
+
+        for account in accounts:
+            path = account.joinpath(str(app_id), *parts)
+            if path.is_dir():
+                return path
+        return None
+
+
+_userdata: SteamUserData | None = None
+_userdata_lock = threading.Lock()
+
+
+def find_userdata() -> SteamUserData | None:
+    """
+    Retrieve the shared index of the Steam userdata folder.
+
+    Returns:
+        The index, or None if Steam is not installed.
+    """
+    global _userdata
+
+    steam_path = find_steam_path()
+    if steam_path is None:
+        return None
+
+    with _userdata_lock:
+        if _userdata is None or _userdata.steam_path != steam_path:
+            _userdata = SteamUserData(steam_path)
+        return _userdata
+
+
+def find_cloud_save_directory(app_id: str | int) -> Path | None:
+    """
+    Find the Steam Cloud save folder of a game, i.e.
+    userdata/<account ID>/<application ID>/remote, for the most recently used
+    account that has one.
+
+    Args:
+        app_id: Steam ID of the game.
+
+    Returns:
+        The cloud save folder, or None if Steam is not installed or no account has
+        cloud saves for the game.
+    """
+    userdata = find_userdata()
+    if userdata is None:
+        return None
+    return userdata.find_app_directory(app_id, "remote")
+
+
+def find_sources() -> list[Path]:
+    """
+    Find the files and folders the list of Steam games is read from.
+
+    Returns:
+        The main library file and the steamapps folder of each library, or an empty
+        list if Steam is not installed.
+    """
+    steam_path = find_steam_path()
+    if not steam_path:
+        return []
+
+    library_vdf_path = steam_path.joinpath("steamapps", "libraryfolders.vdf")
+
+    sources = [library_vdf_path, steam_path.joinpath("steamapps")]
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Software\\Valve\\Steam") as key:
-            value = winreg.QueryValueEx(key, "SteamExe")
-            return Path(value[0].replace("/", "\\")).parent
+        sources.extend(
+            path.joinpath("steamapps") for path in parse_library_paths(library_vdf_path)
+        )
     except FileNotFoundError:
-        return None
+        pass
 
+    return sources
 
-def find_games() -> dict[str, Path]:
+
+def find_games(wanted: Collection[str] | None = None) -> dict[str, Path]:
     """
     Find the list of Steam games installed.
 
+    Args:
+        wanted: If not None, only look for these Steam game IDs, and stop as soon
+            as all of them are found.
+
     Returns:
         A mapping from Steam game ID to install locations for available
         Steam games.
@@ -166,17 +567,54 @@ def find_games() -> dict[str, Path]:
     library_vdf_path = steam_path.joinpath("steamapps", "libraryfolders.vdf")
 
     try:
-        library_folders = parse_library_info(library_vdf_path)
-        library_folders.append(LibraryFolder(steam_path))
+        libraries = parse_library_info(library_vdf_path)
     except FileNotFoundError:
         return {}
 
+    # the Steam folder is always a library, but is not listed in the old format
+    if all(library.path != steam_path for library in libraries):
+        libraries.append(LibraryFolder(steam_path))
+
     games: dict[str, Path] = {}
-    for library in library_folders:
-        for game in library.games:
-            games[game.appid] = Path(library.path).joinpath(
-                "steamapps", "common", game.installdir
+
+    def add_game(library: LibraryFolder, game: SteamGame):
+        games[game.appid] = library.path.joinpath(
+            "steamapps", "common", game.installdir
+        )
+
+    # applications listed in the main library file (new format), only their
+    # manifest is read:
+    index = index_libraries(libraries)
+    app_ids = index.keys() if wanted is None else [i for i in wanted if i in index]
+    for app_id in app_ids:
+        game = index[app_id].find_game(app_id)
+        if game is not None:
+            add_game(index[app_id], game)
+
+    # libraries of unknown content (old format), all the manifests are listed:
+    remaining = None if wanted is None else set(wanted).difference(games)
+    for library in libraries:
+        if library.app_ids is not None:
+            continue
+        if remaining is not None and not remaining:
+            break
+
+        library = LibraryFolder(library.path, remaining)
+        try:
+            library_games = library.games
+        except Exception as e:
+            print(
+                'Failed to read steam library from "{}", {}'.format(
+                    library.path, repr(e)
+                ),
+                file=sys.stderr,
             )
+            continue
+
+        for game in library_games:
+            add_game(library, game)
+            if remaining is not None:
+                remaining.discard(game.appid)
 
     return games
 
@@ -0,0 +1,77 @@
+# -*- encoding: utf-8 -*-
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+# The package is registered without running its __init__.py, which requires mobase,
+# so that modules that do not depend on mobase can be tested (this also prevents
+# pytest from importing __init__.py when collecting the package):
+_root = Path(__file__).parent.parent
+_package = _root.name
+if _package not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        _package,
+        _root.joinpath("__init__.py"),
+        submodule_search_locations=[str(_root)],
+    )
+    assert _spec is not None
+    sys.modules[_package] = importlib.util.module_from_spec(_spec)
+
+
+class _Stub:
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._args = args
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other._args == self._args  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._args))
+
+
+def _stub_class(name: str) -> type[_Stub]:
+    return type(name, (_Stub,), {"__module__": "mobase"})
+
+
+def _mobase_stub() -> ModuleType:
+    """
+    Minimal stand-in for mobase, which is only available inside Mod Organizer: every
+    attribute of the module is a class accepting any argument.
+    """
+    module = ModuleType("mobase")
+
+    def getattr_(name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _stub_class(name)
+        setattr(module, name, value)
+        return value
+
+    module.__getattr__ = getattr_  # type: ignore
+    return module
+
+
+# mobase is replaced by a stub when it is not installed, so that the modules using
+# it can be tested:
+try:
+    import mobase  # noqa: F401
+except ImportError:
+    sys.modules["mobase"] = _mobase_stub()
+
+
+def _import_module(name: str) -> ModuleType:
+    return importlib.import_module(f"{_package}.{name}")
+
+
+@pytest.fixture
+def import_module() -> Callable[[str], ModuleType]:
+    """
+    Import a module of the basic games package, by name relative to the package,
+    e.g. "epic_utils".
+    """
+    return _import_module
@@ -0,0 +1,113 @@
+# -*- encoding: utf-8 -*-
+
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+
+@pytest.fixture
+def basic_game(import_module: Callable[[str], ModuleType]) -> ModuleType:
+    return import_module("basic_game")
+
+
+def _game_class(basic_game: ModuleType, **attributes: Any) -> type:
+    return type(
+        "Game",
+        (basic_game.BasicGame,),
+        {
+            "Name": "Test",
+            "Author": "Test",
+            "Version": "1.0.0",
+            "GameName": "Test",
+            "GameShortName": "test",
+            "GameBinary": "test.exe",
+            "GameDataPath": "",
+            **attributes,
+        },
+    )
+
+
+def _count_calls(
+    basic_game: ModuleType, monkeypatch: pytest.MonkeyPatch, name: str
+) -> list[int]:
+    calls = [0]
+    fn = basic_game.PATH_VARIABLES[name]
+
+    def wrapper(game: Any) -> str:
+        calls[0] += 1
+        return fn(game)
+
+    monkeypatch.setitem(basic_game.PATH_VARIABLES, name, wrapper)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "attributes, cacheable",
+    [
+        ({}, False),
+        ({"GameDocumentsDirectory": "%DOCUMENTS%/Test"}, True),
+        ({"GameSavesDirectory": "%DOCUMENTS%/Test/saves"}, True),
+        ({"GameSavesDirectory": "%GAME_DOCUMENTS%/saves"}, False),
+        (
+            {
+                "GameDocumentsDirectory": "%DOCUMENTS%/Test",
+                "GameSavesDirectory": "%GAME_DOCUMENTS%/saves",
+            },
+            True,
+        ),
+    ],
+)
+def test_saves_directory_cacheable(
+    basic_game: ModuleType, attributes: dict[str, str], cacheable: bool
+):
+    game = _game_class(basic_game, **attributes)()
+    assert game._mappings.cacheable("savesDirectory") is cacheable
+
+
+def test_game_documents_not_cached_with_default_documents(
+    basic_game: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    calls = _count_calls(basic_game, monkeypatch, "GAME_DOCUMENTS")
+    game = _game_class(basic_game, GameSavesDirectory="%GAME_DOCUMENTS%/saves")()
+    game.setGamePath(str(tmp_path))
+
+    game.savesDirectory()
+    game.savesDirectory()
+    assert calls[0] == 2
+
+
+def test_game_documents_cached_with_static_documents(
+    basic_game: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    calls = _count_calls(basic_game, monkeypatch, "GAME_DOCUMENTS")
+    game = _game_class(
+        basic_game,
+        GameDocumentsDirectory=str(tmp_path),
+        GameSavesDirectory="%GAME_DOCUMENTS%/saves",
+    )()
+    game.setGamePath(str(tmp_path))
+
+    assert game.savesDirectory().absolutePath() == tmp_path.joinpath("saves").as_posix()
+    game.savesDirectory()
+    assert calls[0] == 1
+
+
+def test_register_path_variable_after_class_creation(
+    basic_game: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(basic_game, "PATH_VARIABLES", dict(basic_game.PATH_VARIABLES))
+    game = _game_class(basic_game, GameSavesDirectory=f"{tmp_path}/%LATE%/saves")()
+
+    # unknown variables are kept as-is:
+    assert game.savesDirectory().absolutePath() == f"{tmp_path}/%LATE%/saves"
+
+    basic_game.register_path_variable("LATE", lambda game: "late")
+    game._mappings.invalidate()
+    assert game.savesDirectory().absolutePath() == f"{tmp_path}/late/saves"
+
+
+def test_register_path_variable_invalid_name(basic_game: ModuleType):
+    with pytest.raises(ValueError):
+        basic_game.register_path_variable("NOT A NAME", lambda game: "")
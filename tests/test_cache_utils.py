@@ -0,0 +1,111 @@
+# -*- encoding: utf-8 -*-
+
+import inspect
+import itertools
+import sqlite3
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+_PARSER = "tests.Parser/1"
+
+
+@pytest.fixture
+def cache_utils(
+    import_module: Callable[[str], ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> ModuleType:
+    module = import_module("cache_utils")
+
+    # distinct and increasing times of use:
+    counter = itertools.count(1)
+    monkeypatch.setattr(time, "time_ns", lambda: next(counter))
+    return module
+
+
+def test_eviction_keeps_most_recent_entries(
+    cache_utils: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(cache_utils, "_METADATA_EVICT_INTERVAL", 1)
+    cache = cache_utils.MetadataCache(tmp_path.joinpath("cache.sqlite"), 3)
+    for i in range(5):
+        cache.put(f"save{i}", (i, i), _PARSER, {"index": i})
+
+    assert [cache.get(f"save{i}", (i, i), _PARSER) for i in range(5)] == [
+        None,
+        None,
+        {"index": 2},
+        {"index": 3},
+        {"index": 4},
+    ]
+
+
+def test_eviction_on_open(cache_utils: ModuleType, tmp_path: Path):
+    path = tmp_path.joinpath("cache.sqlite")
+    cache = cache_utils.MetadataCache(path)
+    for i in range(4):
+        cache.put(f"save{i}", (i, i), _PARSER, {"index": i})
+    cache.close()
+
+    cache = cache_utils.MetadataCache(path, 2)
+    assert cache.get("save1", (1, 1), _PARSER) is None
+    assert cache.get("save3", (3, 3), _PARSER) == {"index": 3}
+
+
+def test_default_max_entries(cache_utils: ModuleType):
+    parameters = inspect.signature(cache_utils.MetadataCache).parameters
+    assert parameters["max_entries"].default == cache_utils.METADATA_CACHE_MAX_ENTRIES
+
+
+def test_changed_signature_or_parser_misses(cache_utils: ModuleType):
+    cache = cache_utils.MetadataCache(None)
+    cache.put("save", (1, 2), _PARSER, {"name": "a"})
+
+    assert cache.get("save", (1, 2), _PARSER) == {"name": "a"}
+    assert cache.get("save", (1, 3), _PARSER) is None
+    assert cache.get("save", (2, 2), _PARSER) is None
+    assert cache.get("save", (1, 2), "tests.Parser/2") is None
+
+
+def test_metadata_version_misses(
+    cache_utils: ModuleType,
+    import_module: Callable[[str], ModuleType],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    module = import_module("basic_features.basic_save_game_info")
+    cache = cache_utils.MetadataCache(None)
+    monkeypatch.setattr(module, "metadata_cache", lambda: cache)
+
+    loads: list[int] = []
+
+    class SaveGame(module.BasicGameSaveGame):
+        def _load_metadata(self) -> dict[str, Any]:
+            loads.append(self._metadata_version)
+            return {"version": self._metadata_version}
+
+    path = tmp_path.joinpath("save")
+    path.write_text("save")
+
+    assert SaveGame(path).metadata() == {"version": 1}
+    assert SaveGame(path).metadata() == {"version": 1}
+    assert loads == [1]
+
+    SaveGame._metadata_version = 2
+    assert SaveGame(path).metadata() == {"version": 2}
+    assert loads == [1, 2]
+
+
+def test_corrupted_database_is_recreated(cache_utils: ModuleType, tmp_path: Path):
+    path = tmp_path.joinpath("cache.sqlite")
+    path.write_bytes(b"not a database" * 100)
+
+    cache = cache_utils.MetadataCache(path)
+    cache.put("save", (1, 2), _PARSER, {"name": "a"})
+    assert cache.get("save", (1, 2), _PARSER) == {"name": "a"}
+    cache.close()
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM metadata").fetchone() == (1,)
@@ -0,0 +1,28 @@
+# -*- encoding: utf-8 -*-
+
+from concurrent.futures import Future
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+
+def test_ensure_timed_out(
+    import_module: Callable[[str], ModuleType],
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+):
+    discovery_utils = import_module("discovery_utils")
+    monkeypatch.setenv(discovery_utils.DISCOVERY_REPORT_ENVIRON, "1")
+    monkeypatch.setattr(discovery_utils, "load_cache", lambda name, version: {})
+
+    # the scan never completes:
+    future: Future[Any] = Future()
+    monkeypatch.setattr(discovery_utils, "_start_scan", lambda *args: future)
+
+    discovery = discovery_utils.StoreDiscovery(["steam"], timeouts={"steam": 0.01})
+    result = discovery.ensure("steam")
+
+    assert result.timed_out
+    assert result.games == {}
+    assert "steam: timed out" in capsys.readouterr().err
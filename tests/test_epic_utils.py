@@ -0,0 +1,93 @@
+# -*- encoding: utf-8 -*-
+
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+
+@pytest.fixture
+def epic_utils(
+    import_module: Callable[[str], ModuleType],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> ModuleType:
+    module = import_module("epic_utils")
+
+    manifests = tmp_path.joinpath("Manifests")
+    manifests.mkdir()
+    manifests.joinpath("A.item").write_text(
+        json.dumps({"AppName": "A", "InstallLocation": "C:/Manifest/A"})
+    )
+
+    monkeypatch.setenv("PROGRAMDATA", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(module, "find_manifests_path", lambda: manifests)
+    return module
+
+
+def _write_launcher_installed(epic_utils: ModuleType, content: str):
+    path: Path = epic_utils.find_launcher_installed_path()
+    path.parent.mkdir(parents=True)
+    path.write_text(content)
+
+
+def _spy_manifests(
+    epic_utils: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> list[Any]:
+    opened: list[Any] = []
+    read_json_values = epic_utils.read_json_values
+
+    def spy(fp: Any, *args: Any, **kwargs: Any):
+        opened.append(fp.name)
+        return read_json_values(fp, *args, **kwargs)
+
+    monkeypatch.setattr(epic_utils, "read_json_values", spy)
+    return opened
+
+
+def test_manifests_not_read_with_launcher_installed(
+    epic_utils: ModuleType, monkeypatch: pytest.MonkeyPatch
+):
+    _write_launcher_installed(
+        epic_utils,
+        json.dumps({"InstallationList": [{"AppName": "B", "InstallLocation": "C:/B"}]}),
+    )
+    opened = _spy_manifests(epic_utils, monkeypatch)
+
+    assert epic_utils.find_games({"A", "B"}) == {"B": Path("C:/B")}
+    assert epic_utils.find_games() == {"B": Path("C:/B")}
+    assert opened == []
+
+
+@pytest.mark.parametrize("content", [None, "{", '{"InstallationList": 1}'])
+def test_manifests_read_without_launcher_installed(
+    epic_utils: ModuleType, monkeypatch: pytest.MonkeyPatch, content: str | None
+):
+    if content is not None:
+        _write_launcher_installed(epic_utils, content)
+    opened = _spy_manifests(epic_utils, monkeypatch)
+
+    assert epic_utils.find_games({"A"}) == {"A": Path("C:/Manifest/A")}
+    assert len(opened) == 1
+
+
+def test_launcher_wins_over_legendary(epic_utils: ModuleType, tmp_path: Path):
+    _write_launcher_installed(
+        epic_utils,
+        json.dumps({"InstallationList": [{"AppName": "B", "InstallLocation": "C:/B"}]}),
+    )
+    legendary = tmp_path.joinpath("legendary", "installed.json")
+    legendary.parent.mkdir()
+    legendary.write_text(
+        json.dumps(
+            {
+                "B": {"app_name": "B", "install_path": "D:/B"},
+                "C": {"app_name": "C", "install_path": "D:/C"},
+            }
+        )
+    )
+
+    assert epic_utils.find_games() == {"B": Path("C:/B"), "C": Path("D:/C")}
@@ -0,0 +1,35 @@
+# -*- encoding: utf-8 -*-
+
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+import pytest
+
+
+def test_find_sources_includes_manifests(
+    import_module: Callable[[str], ModuleType],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    origin_utils = import_module("origin_utils")
+    discovery_utils = import_module("discovery_utils")
+    monkeypatch.setattr(origin_utils, "find_local_content_path", lambda: tmp_path)
+
+    folder = tmp_path.joinpath("Game")
+    folder.mkdir()
+    manifest = folder.joinpath("game.mfst")
+    manifest.write_text("?id=OFB-EAST:1&dipinstallpath=C:\\Games\\Game")
+    folder.joinpath("other@steam.mfst").write_text("?id=OFB-EAST:2")
+
+    sources = origin_utils.find_sources()
+    assert sorted(sources) == [tmp_path, folder, manifest]
+
+    # a manifest modified in place changes the signatures of the sources:
+    signatures = discovery_utils._signatures(sources)
+    stat = folder.stat()
+    manifest.write_text("?id=OFB-EAST:1&dipinstallpath=D:\\Games\\Game")
+    os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert discovery_utils._signatures(sources) != signatures
@@ -0,0 +1,113 @@
+# -*- encoding: utf-8 -*-
+
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+import pytest
+
+_DATA = Path(__file__).parent.joinpath("data")
+
+_GOG = r"HKEY_LOCAL_MACHINE\Software\Wow6432Node\GOG.com\Games"
+
+
+@pytest.fixture
+def registry_utils(import_module: Callable[[str], ModuleType]) -> Iterator[ModuleType]:
+    module = import_module("registry_utils")
+    yield module
+    module.set_registry(None)
+
+
+def _utf16_export(tmp_path: Path) -> Path:
+    # regedit exports are encoded in UTF-16 with a BOM:
+    path = tmp_path.joinpath("registry.reg")
+    text = _DATA.joinpath("registry.reg").read_bytes().decode("utf-8")
+    path.write_bytes(text.encode("utf-16"))
+    return path
+
+
+@pytest.fixture(params=["registry.json", "registry.reg", "utf-16"])
+def registry_file(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    if request.param == "utf-16":
+        return _utf16_export(tmp_path)
+    return _DATA.joinpath(request.param)
+
+
+def test_read_key_values(registry_utils: ModuleType, registry_file: Path):
+    registry_utils.set_registry(registry_utils.FileRegistry(registry_file))
+
+    # names are case-insensitive:
+    steam = registry_utils.read_key(r"HKEY_CURRENT_USER\SOFTWARE\valve\steam")
+    assert steam is not None
+    assert steam.value("steampath") == "c:/program files (x86)/steam"
+    assert steam.value("SteamExe") is None
+
+    epic = registry_utils.read_key(
+        r"HKEY_LOCAL_MACHINE\Software\Wow6432Node\Epic Games\EpicGamesLauncher"
+    )
+    assert epic is not None
+    assert (
+        epic.value("AppDataPath") == "C:\\ProgramData\\Epic\\EpicGamesLauncher\\Data\\"
+    )
+
+
+def test_read_key_subkeys(registry_utils: ModuleType, registry_file: Path):
+    registry_utils.set_registry(registry_utils.FileRegistry(registry_file))
+
+    games = registry_utils.read_key(_GOG)
+    assert games is not None
+    assert sorted(key.name for key in games.subkeys()) == ["1207658924", "1435827232"]
+
+    witcher = registry_utils.read_key(_GOG + r"\1435827232")
+    assert witcher is not None
+    assert witcher.value("path") == "C:\\GOG Games\\Witcher 3"
+    assert witcher.value("dependsOn") == 1
+    assert games.subkey("1207658924").value("gameID") == "1207658924"
+
+
+def test_read_missing_keys(registry_utils: ModuleType, registry_file: Path):
+    registry_utils.set_registry(registry_utils.FileRegistry(registry_file))
+
+    assert registry_utils.read_key(_GOG + r"\42") is None
+    assert registry_utils.read_key(r"HKEY_CURRENT_USER\Software\Missing") is None
+    assert registry_utils.read_key(r"HKEY_LOCAL_MACHINE\Software\Missing\Key") is None
+
+
+def test_registry_environ(registry_utils: ModuleType, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(
+        registry_utils.REGISTRY_FILE_ENVIRON, str(_DATA.joinpath("registry.json"))
+    )
+    registry_utils.set_registry(None)
+    assert registry_utils.read_key(_GOG + r"\1207658924") is not None
+
+
+def test_refresh_registry(registry_utils: ModuleType, tmp_path: Path):
+    path = tmp_path.joinpath("registry.json")
+    path.write_text('{"HKEY_CURRENT_USER\\\\Software\\\\Valve\\\\Steam": {}}')
+
+    class Registry(registry_utils.Registry):
+        def read_tree(self, path_: str, depth: int):
+            return registry_utils.FileRegistry(path).read_tree(path_, depth)
+
+    registry_utils.set_registry(Registry())
+    steam = registry_utils.read_key(r"HKEY_CURRENT_USER\Software\Valve\Steam")
+    assert steam is not None and steam.value("SteamPath") is None
+
+    path.write_text(
+        '{"HKEY_CURRENT_USER\\\\Software\\\\Valve\\\\Steam":'
+        ' {"values": {"SteamPath": "C:/Steam"}}}'
+    )
+    steam = registry_utils.read_key(r"HKEY_CURRENT_USER\Software\Valve\Steam")
+    assert steam is not None and steam.value("SteamPath") is None
+
+    registry_utils.refresh_registry()
+    steam = registry_utils.read_key(r"HKEY_CURRENT_USER\Software\Valve\Steam")
+    assert steam is not None and steam.value("SteamPath") == "C:/Steam"
+
+
+def test_invalid_file(registry_utils: ModuleType, tmp_path: Path):
+    path = tmp_path.joinpath("registry.json")
+    path.write_text("[]")
+    with pytest.raises(ValueError):
+        registry_utils.FileRegistry(path)
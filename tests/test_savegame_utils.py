@@ -0,0 +1,216 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QDir
+
+
+@pytest.fixture
+def savegame_utils(import_module: Callable[[str], ModuleType]) -> ModuleType:
+    return import_module("savegame_utils")
+
+
+class _Save:
+    def __init__(self, index: int, entry: Any):
+        self.index = index
+        self.path = entry.path
+
+
+def _touch(path: Path, mtime: int | None = None, content: str = "save") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def _relative(folder: Path, entries: list[Any]) -> list[str]:
+    return sorted(entry.path.relative_to(folder).as_posix() for entry in entries)
+
+
+@pytest.fixture
+def saves_folder(tmp_path: Path) -> Path:
+    for path in (
+        "a.sav",
+        "b.txt",
+        "slot1/c.sav",
+        "slot1/deep/d.sav",
+        "characters/e.fch",
+        "characters/sub/f.fch",
+        "worlds/g.fch",
+    ):
+        _touch(tmp_path.joinpath(path))
+    return tmp_path
+
+
+def test_scan_folder_patterns(savegame_utils: ModuleType, saves_folder: Path):
+    saves, characters, top = savegame_utils.scan_folder(
+        saves_folder, ["**/*.sav", "characters/*.fch", "*.sav"]
+    )
+    assert _relative(saves_folder, saves) == [
+        "a.sav",
+        "slot1/c.sav",
+        "slot1/deep/d.sav",
+    ]
+    assert _relative(saves_folder, characters) == ["characters/e.fch"]
+    assert _relative(saves_folder, top) == ["a.sav"]
+
+
+def test_scan_folder_max_depth(savegame_utils: ModuleType, saves_folder: Path):
+    (saves,) = savegame_utils.scan_folder(saves_folder, ["**/*.sav"], max_depth=1)
+    assert _relative(saves_folder, saves) == ["a.sav", "slot1/c.sav"]
+
+    (saves,) = savegame_utils.scan_folder(saves_folder, ["**/*.sav"], max_depth=0)
+    assert _relative(saves_folder, saves) == ["a.sav"]
+
+
+@pytest.mark.parametrize(
+    "pattern, path, matches",
+    [
+        ("**/*.sav", "a.sav", True),
+        ("**/*.sav", "x/y/a.sav", True),
+        ("**/*.sav", "a.sav.bak", False),
+        ("*.sav", "x/a.sav", False),
+        ("slot?/*.sav", "slot1/a.sav", True),
+        ("slot[!0]/*.sav", "slot0/a.sav", False),
+        ("characters/*.fch", "characters/sub/a.fch", False),
+    ],
+)
+def test_pattern_matches(
+    savegame_utils: ModuleType, pattern: str, path: str, matches: bool
+):
+    assert savegame_utils.SavePattern(pattern).matches(path) is matches
+
+
+def test_index_add_remove_modify(savegame_utils: ModuleType, saves_folder: Path):
+    index = savegame_utils.SaveIndex(saves_folder, ["**/*.sav"], _Save)
+
+    saves = index.saves()
+    assert _relative(saves_folder, saves) == [
+        "a.sav",
+        "slot1/c.sav",
+        "slot1/deep/d.sav",
+    ]
+    assert len(index.last_diff.added) == 3
+
+    # unchanged saves are kept:
+    assert not index.update()
+    assert {id(save) for save in index.saves()} == {id(save) for save in saves}
+
+    _touch(saves_folder.joinpath("slot2/new.sav"))
+    saves_folder.joinpath("slot1/deep/d.sav").unlink()
+    modified = _touch(saves_folder.joinpath("a.sav"), 1000, "modified save")
+
+    diff = index.update()
+    assert _relative(saves_folder, diff.added) == ["slot2/new.sav"]
+    assert _relative(saves_folder, diff.removed) == ["slot1/deep/d.sav"]
+    assert [(old.path, new.path) for old, new in diff.modified] == [
+        (modified, modified)
+    ]
+    assert _relative(saves_folder, index.saves()) == [
+        "a.sav",
+        "slot1/c.sav",
+        "slot2/new.sav",
+    ]
+
+
+def test_index_patterns(savegame_utils: ModuleType, saves_folder: Path):
+    index = savegame_utils.SaveIndex(
+        saves_folder, ["**/*.sav", "characters/*.fch"], _Save
+    )
+    saves = index.saves()
+    assert sorted(
+        (save.index, save.path.relative_to(saves_folder).as_posix()) for save in saves
+    ) == [
+        (0, "a.sav"),
+        (0, "slot1/c.sav"),
+        (0, "slot1/deep/d.sav"),
+        (1, "characters/e.fch"),
+    ]
+
+
+def test_index_max_depth(savegame_utils: ModuleType, saves_folder: Path):
+    index = savegame_utils.SaveIndex(saves_folder, ["**/*.sav"], _Save, max_depth=1)
+    assert _relative(saves_folder, index.saves()) == ["a.sav", "slot1/c.sav"]
+
+
+def test_index_neighbours(savegame_utils: ModuleType, tmp_path: Path):
+    for i in range(3):
+        _touch(tmp_path.joinpath(f"{i}.sav"), 1000 + i)
+    index = savegame_utils.SaveIndex(tmp_path, ["*.sav"], _Save)
+    saves = {save.path.name: save for save in index.saves()}
+
+    assert [save.path.name for save in index.neighbours(saves["1.sav"])] == [
+        "0.sav",
+        "2.sav",
+    ]
+    assert savegame_utils.SaveIndex.find_neighbours(saves["2.sav"]) == [saves["1.sav"]]
+
+    index.close()
+    assert savegame_utils.SaveIndex.find_neighbours(saves["2.sav"]) == []
+
+
+def test_index_watched_folder(
+    savegame_utils: ModuleType, saves_folder: Path, monkeypatch: pytest.MonkeyPatch
+):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    index = savegame_utils.SaveIndex(saves_folder, ["**/*.sav"], _Save)
+    assert index._watcher is not None
+    index.saves()
+
+    scanned: list[str] = []
+    scan_tree = index._scan_tree
+
+    def spy(path: str, *args: Any, **kwargs: Any) -> Any:
+        scanned.append(path)
+        return scan_tree(path, *args, **kwargs)
+
+    monkeypatch.setattr(index, "_scan_tree", spy)
+
+    # a file rewritten in place is not reported by the watches:
+    modified = _touch(saves_folder.joinpath("slot1/c.sav"), 1000, "modified save")
+    diff = index.update()
+    assert [new.path for _, new in diff.modified] == [modified]
+    assert scanned == []
+
+    changed: list[bool] = []
+    index.changed.connect(lambda: changed.append(True))
+    _touch(saves_folder.joinpath("slot1/new.sav"))
+    deadline = time.monotonic() + 5
+    while not changed and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert changed
+
+    diff = index.update()
+    assert _relative(saves_folder, diff.added) == ["slot1/new.sav"]
+    assert scanned == [str(saves_folder.joinpath("slot1"))]
+    index.close()
+
+
+def test_game_save_max_depth(
+    import_module: Callable[[str], ModuleType], saves_folder: Path
+):
+    basic_game = import_module("basic_game")
+
+    class Game(basic_game.BasicGame):
+        Name = "Test"
+        Author = "Test"
+        Version = "1.0.0"
+        GameName = "Test"
+        GameShortName = "test"
+        GameBinary = "test.exe"
+        GameDataPath = ""
+        GameSaveExtension = "sav"
+        GameSaveMaxDepth = 1
+
+    saves = Game().listSaves(QDir(str(saves_folder)))
+    assert sorted(Path(save.getFilepath()).name for save in saves) == [
+        "a.sav",
+        "c.sav",
+    ]
@@ -0,0 +1,66 @@
+# -*- encoding: utf-8 -*-
+
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module, game",
+    [
+        ("games.game_witcher3", "Witcher3Game"),
+        ("games.game_dao", "DAOriginsGame"),
+        ("games.game_control", "ControlGame"),
+        ("games.game_assettocorsa", "AssettoCorsaGame"),
+    ],
+)
+def test_snapshot_matches_getters(
+    import_module: Callable[[str], ModuleType], tmp_path: Path, module: str, game: str
+):
+    plugin: Any = getattr(import_module(module), game)()
+    plugin.setGamePath(str(tmp_path))
+
+    snapshot = plugin.snapshot()
+
+    assert snapshot.gamePath == str(tmp_path)
+    assert snapshot.name == plugin.name()
+    assert snapshot.gameName == plugin.gameName()
+    assert snapshot.gameShortName == plugin.gameShortName()
+    assert snapshot.validShortNames == tuple(plugin.validShortNames())
+    assert snapshot.nexusGameId == plugin.nexusGameID()
+    assert snapshot.binaryName == plugin.binaryName()
+    assert snapshot.launcherName == plugin.getLauncherName()
+    assert snapshot.supportURL == plugin.getSupportURL()
+    assert snapshot.iniFiles == tuple(plugin.iniFiles())
+    assert snapshot.dataDirectory == plugin.dataDirectory().absolutePath()
+    assert snapshot.documentsDirectory == plugin.documentsDirectory().absolutePath()
+    assert snapshot.savesDirectory == plugin.savesDirectory().absolutePath()
+
+
+def test_snapshot_resolves_variables_once(
+    import_module: Callable[[str], ModuleType],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    basic_game = import_module("basic_game")
+    calls: dict[str, int] = {}
+
+    def counted(name: str, fn: Callable[[Any], str]) -> Callable[[Any], str]:
+        def wrapper(game: Any) -> str:
+            calls[name] = calls.get(name, 0) + 1
+            return fn(game)
+
+        return wrapper
+
+    for name, fn in list(basic_game.PATH_VARIABLES.items()):
+        monkeypatch.setitem(basic_game.PATH_VARIABLES, name, counted(name, fn))
+
+    plugin: Any = import_module("games.game_witcher3").Witcher3Game()
+    plugin.setGamePath(str(tmp_path))
+    plugin.snapshot()
+
+    # the saves directory depends on the documents directory:
+    assert calls.get("GAME_DOCUMENTS") == 1
+    assert all(count == 1 for count in calls.values())
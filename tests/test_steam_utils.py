@@ -0,0 +1,116 @@
+# -*- encoding: utf-8 -*-
+
+from collections.abc import Iterator
+from types import ModuleType
+from typing import Callable
+
+import pytest
+
+_MANIFEST = r"""
+"AppState"
+{
+	"appid"		"489830"
+	"name"		"The Elder Scrolls V: Skyrim Special Edition"
+	"InstalledDepots"
+	{
+		"489833"
+		{
+			"manifest"		"123"
+			"installdir"		"nested"
+		}
+	}
+	"UserConfig"
+	{
+		"language"		"english"
+	}
+	"installdir"		"Skyrim Special Edition"
+	"LastOwner"		"1234"
+}
+"""
+
+
+@pytest.fixture
+def steam_utils(import_module: Callable[[str], ModuleType]) -> ModuleType:
+    return import_module("steam_utils")
+
+
+def test_read_values_skips_nested_blocks(steam_utils: ModuleType):
+    values = steam_utils.read_acf_values(
+        _MANIFEST.splitlines(True), ["appid", "InstallDir", "language"]
+    )
+    # keys are case-insensitive, and only read from the section itself:
+    assert values == {"appid": "489830", "InstallDir": "Skyrim Special Edition"}
+
+
+def test_read_values_escapes(steam_utils: ModuleType):
+    manifest = r"""
+    "AppState"
+    {
+        "name"  "The \"Game\""
+        "installdir"  "C:\\Games\\Game\tX"
+        "other"  "a \n b"
+    }
+    """
+    values = steam_utils.read_acf_values(
+        manifest.splitlines(True), ["name", "installdir", "other"]
+    )
+    assert values == {
+        "name": 'The "Game"',
+        "installdir": "C:\\Games\\Game\tX",
+        "other": "a \n b",
+    }
+
+
+def test_read_values_stops_once_found(steam_utils: ModuleType):
+    read: list[str] = []
+
+    def lines() -> Iterator[str]:
+        for line in _MANIFEST.splitlines(True):
+            read.append(line)
+            if "UserConfig" in line:
+                raise AssertionError("read past the requested values")
+            yield line
+
+    assert steam_utils.read_acf_values(lines(), ["appid", "name"]) == {
+        "appid": "489830",
+        "name": "The Elder Scrolls V: Skyrim Special Edition",
+    }
+    assert len(read) == 5
+
+
+def test_read_values_stops_at_end_of_section(steam_utils: ModuleType):
+    manifest = '"AppState" { "appid" "1" } garbage "{'
+    assert steam_utils.read_acf_values([manifest], ["appid", "installdir"]) == {
+        "appid": "1"
+    }
+
+
+def test_read_values_other_section(steam_utils: ModuleType):
+    manifest = '"Other" { "appid" "1" } "AppState" { "appid" "2" }'
+    assert steam_utils.read_acf_values([manifest], ["appid"]) == {"appid": "2"}
+
+
+def test_read_values_multiline_string(steam_utils: ModuleType):
+    manifest = ['"AppState"\n', "{\n", '"name" "first\n', 'second"\n', "}\n"]
+    assert steam_utils.read_acf_values(manifest, ["name"]) == {"name": "first\nsecond"}
+
+
+@pytest.mark.parametrize(
+    "manifest",
+    [
+        '"AppState" { "appid" "1',
+        '"Other" { } } "AppState" { }',
+        '"AppState" { { } }',
+    ],
+)
+def test_read_values_invalid(steam_utils: ModuleType, manifest: str):
+    with pytest.raises(ValueError):
+        steam_utils.read_acf_values(manifest.splitlines(True), ["installdir"])
+
+
+def test_read_values_truncated_block(steam_utils: ModuleType):
+    # values read before the end of a truncated manifest are returned:
+    lines = _MANIFEST.splitlines(True)[:5]
+    assert steam_utils.read_acf_values(lines, ["appid", "installdir"]) == {
+        "appid": "489830"
+    }